@@ -1,6 +1,7 @@
-from typing import Literal, Optional, Any
+from typing import Callable, Literal, Optional, Any
 from tkinter import ttk
 import tkinter as tk
+import bisect
 
 
 class AutoScrollbar(ttk.Scrollbar):
@@ -226,6 +227,9 @@ class ScrollableFrame:
         self.canvas = tk.Canvas(master, **canvas_config)
         self.grid = self.canvas.grid
 
+        self.hscrollbar = hscrollbar
+        self.vscrollbar = vscrollbar
+
         ## Bind the scrollbar(s) if they exist
         if vscrollbar is not None:
             self.canvas.configure(yscrollcommand=vscrollbar.set)
@@ -239,6 +243,21 @@ class ScrollableFrame:
         self.canvas.xview_moveto(0)
         self.canvas.yview_moveto(0)
 
+        self._create_interior(frame_config)
+
+        ## Todo: Bind Button-4 and Button-5 to scroll
+        ## Bind scrolling with the mousewheel to scroll the canvas widget.
+        ## Pressing the `Shift` key changes the scroll axis.
+        self.canvas.bind_all('<MouseWheel>', lambda v: self.canvas.yview_scroll(round(v.delta / self.yscrollfactor), 'units'))
+        self.canvas.bind_all('<Shift-MouseWheel>', lambda v: self.canvas.xview_scroll(round(v.delta / self.xscrollfactor), 'units'))
+
+    def _create_interior(self, frame_config: dict) -> None:
+        """
+        Create the frame that is scrolled by the canvas
+
+        :param frame_config: The config for the frame
+        """
+
         ## Create a frame to be scrolled
         self.frame = tk.Frame(self.canvas, **frame_config)
 
@@ -249,12 +268,6 @@ class ScrollableFrame:
         self.frame.bind('<Configure>', lambda v: self._configure_interior())
         self.canvas.bind('<Configure>', lambda v: self._configure_canvas())
 
-        ## Todo: Bind Button-4 and Button-5 to scroll
-        ## Bind scrolling with the mousewheel to scroll the canvas widget.
-        ## Pressing the `Shift` key changes the scroll axis.
-        self.canvas.bind_all('<MouseWheel>', lambda v: self.canvas.yview_scroll(round(v.delta / self.yscrollfactor), 'units'))
-        self.canvas.bind_all('<Shift-MouseWheel>', lambda v: self.canvas.xview_scroll(round(v.delta / self.xscrollfactor), 'units'))
-
     def _configure_interior(self) -> None:
         """
         Update the canvas scroll region to match the size of the scrolling frame and update the width of the canvas to match the scrolling frame
@@ -280,6 +293,261 @@ class ScrollableFrame:
             self.canvas.itemconfigure(self._scrollable_frame, width=self.canvas.winfo_width())
 
 
+class VirtualScrollableFrame(ScrollableFrame):
+    """
+    A virtualised list mode for `ScrollableFrame`, for displaying long lists of items.
+    Rather than creating a widget for every item, only the items in and near the visible area are displayed. Each row widget is placed on the canvas as a window item.
+    When a row scrolls out of view, its widget is hidden and reused for the next item of the same kind that scrolls into view.
+
+    Config for the canvas can be defined by specifying arguments with the prefix "c_".
+
+    :param master: The parent widget
+    :param create_row: A function taking the parent widget and a row kind that creates a new row widget
+    :param bind_row: A function taking a row widget and an item that updates the widget to display the item
+    :param row_height: A function taking an item that returns the estimated height of its row in pixels. The estimate is replaced with the actual height when the row is displayed.
+
+    :keyword row_kind: A function taking an item that returns the kind of row used to display it. Row widgets are only reused for items of the same kind.
+    :keyword release_row: A function taking a row widget that is called when the widget is hidden
+    :keyword overscan: The distance in pixels above and below the visible area in which rows are displayed
+    :keyword padx: The horizontal padding on each side of the rows
+    :keyword vscrollbar: The scrollbar widget to which the y-scroll command should be bound
+    :keyword yscrollfactor: Scroll factor for the y-axis.
+    """
+
+    def __init__(self, master, create_row: Callable[[tk.Misc, Any], tk.Widget], bind_row: Callable[[tk.Widget, Any], None], row_height: Callable[[Any], int], **kwargs) -> None:
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.row_kind: Callable[[Any], Any] = kwargs.pop('row_kind') if 'row_kind' in kwargs else lambda v: None
+        self.release_row: Optional[Callable[[tk.Widget], None]] = kwargs.pop('release_row') if 'release_row' in kwargs else None
+        self.overscan: int = kwargs.pop('overscan') if 'overscan' in kwargs else 200
+        self.padx: int = kwargs.pop('padx') if 'padx' in kwargs else 0
+
+        self.items: list = []  # The items in the list. Use the methods of this class to edit the list so that the displayed rows are updated.
+        self._heights: list[int] = []  # The height of each item’s row
+        self._offsets: list[int] = [0]  # The y position of each item’s row, followed by the total height of the rows
+        self._rows: dict[int, tk.Widget] = dict()  # The row widget displaying each visible item, keyed by the index of the item
+        self._pool: dict[Any, list[tk.Widget]] = dict()  # The hidden row widgets available for reuse, keyed by their kind
+        self._windows: dict[tk.Widget, int] = dict()  # The canvas window item of each row widget
+        self._kinds: dict[tk.Widget, Any] = dict()  # The kind of each row widget
+        self._refresh_after: Optional[str] = None
+
+        super().__init__(master, **kwargs)
+
+        ## Update the displayed rows whenever the canvas is scrolled
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+
+    def _create_interior(self, frame_config: dict) -> None:
+        """ The rows are placed directly on the canvas, so no interior frame is created """
+
+        self.frame = None
+        self.canvas.bind('<Configure>', lambda v: self._configure_canvas())
+
+    def _configure_canvas(self) -> None:
+        """ Update the width of the rows to match the canvas and display the rows in the visible area """
+
+        width = max(self.canvas.winfo_width() - 2 * self.padx, 1)
+        for window in self._windows.values():
+            self.canvas.itemconfigure(window, width=width)
+
+        self._update_scrollregion()
+        self.schedule_refresh()
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        """ Update the scrollbar and the displayed rows. Called whenever the canvas is scrolled. """
+
+        if self.vscrollbar is not None:
+            self.vscrollbar.set(first, last)
+
+        self.schedule_refresh()
+
+    def _update_offsets(self, start: int = 0) -> None:
+        """ Recalculate the y position of the rows from the input index onwards """
+
+        del self._offsets[start + 1:]
+        total = self._offsets[start]
+        for height in self._heights[start:]:
+            total += height
+            self._offsets.append(total)
+
+    def _update_scrollregion(self) -> None:
+        """ Update the scroll region of the canvas to fit all the rows """
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), self._offsets[-1]))
+
+    def _acquire(self, idx: int) -> None:
+        """ Display the item at the input index, reusing a hidden row widget of the same kind if one exists """
+
+        item = self.items[idx]
+        kind = self.row_kind(item)
+
+        pool = self._pool.get(kind)
+        if pool:  # Reuse a hidden row widget
+            row = pool.pop()
+            self.canvas.itemconfigure(self._windows[row], state='normal')
+        else:  # Otherwise, create a new row widget
+            row = self.create_row(self.canvas, kind)
+            self._windows[row] = self.canvas.create_window(self.padx, 0, window=row, anchor='nw', width=max(self.canvas.winfo_width() - 2 * self.padx, 1))
+            self._kinds[row] = kind
+
+        self.bind_row(row, item)
+        self._rows[idx] = row
+
+    def _release(self, idx: int) -> None:
+        """ Hide the row widget displaying the item at the input index and keep it for reuse """
+
+        row = self._rows.pop(idx)
+        self.canvas.itemconfigure(self._windows[row], state='hidden')
+
+        if self.release_row is not None:
+            self.release_row(row)
+
+        self._pool.setdefault(self._kinds[row], []).append(row)
+
+    def _release_all(self) -> None:
+        """ Hide all the displayed row widgets """
+
+        for idx in list(self._rows):
+            self._release(idx)
+
+    def _measure(self, indexes: list[int]) -> bool:
+        """
+        Replace the estimated heights of displayed rows with their actual heights
+
+        :param indexes: The indexes of the items to measure
+        :return: Whether any of the heights changed
+        """
+
+        self.canvas.update_idletasks()  # Calculate the size of the row widgets
+
+        changed = None
+        for idx in indexes:
+            height = self._rows[idx].winfo_reqheight()
+            if height != self._heights[idx]:
+                self._heights[idx] = height
+                changed = idx if changed is None else min(changed, idx)
+
+        if changed is None:
+            return False
+
+        self._update_offsets(changed)
+        self._update_scrollregion()
+        return True
+
+    def schedule_refresh(self) -> None:
+        """ Update the displayed rows once the application is idle """
+
+        if self._refresh_after is None:
+            self._refresh_after = self.canvas.after_idle(self.refresh)
+
+    def refresh(self) -> None:
+        """ Display the rows in and near the visible area and hide all other rows """
+
+        if self._refresh_after is not None:
+            self.canvas.after_cancel(self._refresh_after)
+            self._refresh_after = None
+
+        ## Get the range of items in and near the visible area
+        top = self.canvas.canvasy(0)
+        first = max(bisect.bisect_right(self._offsets, top - self.overscan) - 1, 0)
+        last = min(bisect.bisect_left(self._offsets, top + self.canvas.winfo_height() + self.overscan), len(self.items))
+
+        ## Hide the rows that are no longer in range
+        for idx in [v for v in self._rows if not first <= v < last]:
+            self._release(idx)
+
+        ## Display the rows that have come into range
+        new_rows = [idx for idx in range(first, last) if idx not in self._rows]
+        for idx in new_rows:
+            self._acquire(idx)
+
+        ## Correct the estimated heights of the new rows. If they changed, the range of visible items may have changed, so check it again.
+        if new_rows and self._measure(new_rows):
+            self.schedule_refresh()
+
+        ## Move the displayed rows to their positions
+        for idx, row in self._rows.items():
+            self.canvas.coords(self._windows[row], self.padx, self._offsets[idx])
+
+    def set_items(self, items: list) -> None:
+        """
+        Replace the items in the list
+
+        :param items: The new items
+        """
+
+        self._release_all()
+        self.items = list(items)
+        self._heights = [self.row_height(v) for v in self.items]
+        self._update_offsets()
+        self._update_scrollregion()
+        self.schedule_refresh()
+
+    def insert(self, idx: int, item: Any) -> None:
+        """
+        Insert an item into the list
+
+        :param idx: The index to insert the item at
+        :param item: The item to insert
+        """
+
+        self._release_all()  # The indexes of the displayed rows change, so rebind them when the list is refreshed
+        self.items.insert(idx, item)
+        self._heights.insert(idx, self.row_height(item))
+        self._update_offsets(idx)
+        self._update_scrollregion()
+        self.schedule_refresh()
+
+    def remove(self, idx: int) -> None:
+        """
+        Remove an item from the list
+
+        :param idx: The index of the item to remove
+        """
+
+        self._release_all()
+        del self.items[idx]
+        del self._heights[idx]
+        self._update_offsets(idx)
+        self._update_scrollregion()
+        self.schedule_refresh()
+
+    def update_item(self, idx: int) -> None:
+        """
+        Update the row of an item after the item has been edited
+
+        :param idx: The index of the edited item
+        """
+
+        if idx in self._rows:  # If the row is displayed, rebind it and measure its new height
+            self.bind_row(self._rows[idx], self.items[idx])
+            if self._measure([idx]):
+                self.schedule_refresh()
+        else:
+            self._heights[idx] = self.row_height(self.items[idx])
+            self._update_offsets(idx)
+            self._update_scrollregion()
+
+    def see(self, idx: int) -> None:
+        """
+        Scroll the list so that the row of an item is visible
+
+        :param idx: The index of the item
+        """
+
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        total = max(self._offsets[-1], 1)
+
+        if self._offsets[idx] < top:  # If the row is above the visible area, scroll up to the top of the row
+            self.canvas.yview_moveto(self._offsets[idx] / total)
+        elif self._offsets[idx + 1] > bottom:  # If the row is below the visible area, scroll down to the bottom of the row
+            self.canvas.yview_moveto(max(self._offsets[idx + 1] - self.canvas.winfo_height(), 0) / total)
+
+    def visible_rows(self) -> list[tuple[Any, tk.Widget]]:
+        """ Get the items that are currently displayed along with their row widgets """
+        return [(self.items[idx], row) for idx, row in self._rows.items()]
+
+
 ## Todo: Document `Tab` and `TabbedInterface` classes
 
 
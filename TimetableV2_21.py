@@ -10,12 +10,11 @@ Dependencies  : requirements.txt
 import re
 import sys
 from traceback import format_exc
-import idlelib.colorizer as ic
-import idlelib.percolator as ip
+from functools import partial
 import configurable_image_widgets18 as ci
 from tkinter import messagebox as mb
 from tkinter import filedialog as fd
-from typing import Generator, Literal, Optional, Any
+from typing import Callable, Generator, Iterable, Literal, Optional, Any
 from tkinter import ttk
 from tkinter import simpledialog as sd
 import platform
@@ -26,20 +25,17 @@ import os.path
 import ctypes
 import tksvg
 import json
+import hashlib
+import itertools
+import bisect
+import heapq
+import time
 import animated_widgets as anim
 from toolsV1 import *
+from timetable_model import ClassData, EventData, EventStore, EventTypeRegistry, TimeslotClock, TimetableModel
+from timetable_io import DEFAULT_NUM_WEEKS, iter_timetable_json, timetable_args, SaveEngine, Journal, has_recovery_data, discard_recovery_data, recover_timetable
 from tkinter import font as tkfont
-import webbrowser
-from multipledispatch import dispatch
-from CustomWidgets import AutoScrollbar, CustomRadiobutton, CustomComboBox, Entry, ScrollableFrame, MouseoverButton
-
-from reportlab.lib.colors import HexColor, Color  # noqa
-from reportlab.lib import units
-from reportlab.platypus import Table
-from reportlab.platypus.flowables import Flowable
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfgen.canvas import Canvas
-from reportlab.pdfbase.ttfonts import TTFont
+from CustomWidgets import AutoScrollbar, CustomRadiobutton, CustomComboBox, Entry, VirtualScrollableFrame, MouseoverButton
 
 VERSION = '2.28.1'
 
@@ -53,16 +49,19 @@ INDENT_HIGHLIGHT_PATTERN = rf'(\n|\A)[ \t]*({DOTPOINT_PATTERN}|{NUMBERING_PATTER
 INDENT_PATTERN = r'[ \t]*(?P<dotpoints_and_numbering>(?P<CAP_Lettering>[A-Z]{1,2}[):])|(?P<LOW_Lettering>[a-z]{1,2}[):])|(?P<Numbering>[0-9]{1,2}[.):])|[>•o-])?[ \t]+'
 
 DPI_AWARE_MODES = ['DPI Unaware', 'System DPI Aware', 'Per Monitor DPI Aware']  # DPI awareness modes for the settings menu
-
-## Define colour mapping for event types
-EVENT_TYPE_COLOUR_MAPPING = {
-    'Event': ('#e06c75', '#443E47'),
-    'Info': ('#528bff', '#465E86'),
-    'Reminder': ('#56b6c2', '#476975'),
-    'Bookmark': ('#98c379', '#596D61'),
-    'Assignment': ('#c678dd', '#66587D'),
-    'Test': ('#abb2bf', '#5E6875'),
+ICON_CACHE_DIR = 'icon_cache'  # The directory to cache rasterised SVG icons in
+ICON_TRACE_FILE = os.path.join(ICON_CACHE_DIR, 'usage.json')  # The names of the icons used in the last session, which are preloaded at startup
+TABLE_RENDERER: Literal['widgets', 'canvas'] = 'widgets'  # How the cells of the timetable are displayed: a frame of widgets for each cell, or items drawn on a single canvas (see `CanvasGrid`)
+
+## A Tcl procedure that sets the colours of a widget cell in a single call: the border colour of the cell’s frame, and the background and foreground colours of each of its children
+CELL_STATE_PROC = '''
+proc timetable_cell_state {frame border background foreground children} {
+    $frame configure -background $border
+    foreach child $children {
+        $child configure -background $background -foreground $foreground
+    }
 }
+'''
 
 
 class WindowTopbar(tk.Frame):
@@ -98,21 +97,26 @@ class WindowTopbar(tk.Frame):
         file_menubutton.grid(row=0, column=7, sticky='nswe', padx=(0, 1))
 
         export_menu = tk.Menu(file_menubutton, tearoff=0, background='#323232', relief='flat', foreground='#fff', borderwidth=0, activeborderwidth=0, type='normal')
-        export_menu.add_command(label='CSV', image=icons['csv'], compound='left', command=lambda: self.root.export_timetable('csv'))
-        export_menu.add_command(label='Excel Spreadsheet', image=icons['xls'], compound='left', command=lambda: self.root.export_timetable('xls'))
-        export_menu.add_command(label='PDF', image=icons['pdf'], compound='left', command=lambda: self.root.export_timetable('pdf'))
-
         file_menu = tk.Menu(file_menubutton, tearoff=0, background='#323232', relief='flat', foreground='#fff', borderwidth=0, activeborderwidth=0, type='normal')
-        file_menu.add_command(label='Save', image=icons['save'], compound='left', hidemargin=True, command=lambda: self.root.timetable.save_timetable())
-        file_menu.add_command(label='Save As', image=icons['saveas'], compound='left', hidemargin=True, command=lambda: self.root.timetable.save_as())
-        file_menu.add_command(label='Save a Copy', image=icons['savecopy'], compound='left', hidemargin=True, command=lambda: self.root.timetable.save_copy())
-        file_menu.add_separator(background='#D4D4D4')
-        file_menu.add_command(label='New', image=icons['new'], compound='left', hidemargin=True, command=lambda: self.root.new_timetable())
-        file_menu.add_command(label='Load', image=icons['load'], compound='left', hidemargin=True, command=lambda: self.root.load_timetable())
-        file_menu.add_separator(background='#D4D4D4')
-        file_menu.add_cascade(label='Export', image=icons['export'], compound='left', hidemargin=True, menu=export_menu)
-        file_menu.add_separator(background='#D4D4D4')
-        file_menu.add_command(label='Settings', image=icons['settings'], compound='left', hidemargin=True, command=lambda: self.root.show_settings())
+
+        ## Add the menu entries the first time each menu is opened, so the menu icons are only loaded when they are needed
+        def populate_file_menu() -> None:
+            export_menu.add_command(label='CSV', image=icons['csv'], compound='left', command=lambda: self.root.export_timetable('csv'))
+            export_menu.add_command(label='Excel Spreadsheet', image=icons['xls'], compound='left', command=lambda: self.root.export_timetable('xls'))
+            export_menu.add_command(label='PDF', image=icons['pdf'], compound='left', command=lambda: self.root.export_timetable('pdf'))
+
+            file_menu.add_command(label='Save', image=icons['save'], compound='left', hidemargin=True, command=lambda: self.root.timetable.save_timetable())
+            file_menu.add_command(label='Save As', image=icons['saveas'], compound='left', hidemargin=True, command=lambda: self.root.timetable.save_as())
+            file_menu.add_command(label='Save a Copy', image=icons['savecopy'], compound='left', hidemargin=True, command=lambda: self.root.timetable.save_copy())
+            file_menu.add_separator(background='#D4D4D4')
+            file_menu.add_command(label='New', image=icons['new'], compound='left', hidemargin=True, command=lambda: self.root.new_timetable())
+            file_menu.add_command(label='Load', image=icons['load'], compound='left', hidemargin=True, command=lambda: self.root.load_timetable())
+            file_menu.add_separator(background='#D4D4D4')
+            file_menu.add_cascade(label='Export', image=icons['export'], compound='left', hidemargin=True, menu=export_menu)
+            file_menu.add_separator(background='#D4D4D4')
+            file_menu.add_command(label='Settings', image=icons['settings'], compound='left', hidemargin=True, command=lambda: self.root.show_settings())
+
+        self.populate_on_post(file_menu, populate_file_menu)
         file_menubutton.configure(menu=file_menu)
 
         ## ------------------------------------------ Edit Menu -------------------------------------------
@@ -120,226 +124,76 @@ class WindowTopbar(tk.Frame):
         edit_menubutton.grid(row=0, column=8, sticky='nswe', padx=(0, 1))
         edit_menu = tk.Menu(edit_menubutton, tearoff=0, background='#323232', relief='flat', foreground='#fff', borderwidth=0, activeborderwidth=0, type='normal')
 
-        edit_menu.add_command(label='Undo', image=icons['undo'], compound='left', command=lambda: self.root.undo())
-        edit_menu.add_command(label='Redo', image=icons['redo'], compound='left', command=lambda: self.root.redo())
-        edit_menu.add_command(label='Undo All', image=icons['restore'], compound='left', command=lambda: self.root.undo_all())
-        edit_menu.add_separator(background='#D4D4D4')
-        edit_menu.add_command(label='New Event', image=icons['new_event'], compound='left', command=lambda: self.root.timetable.create_event())
-        edit_menu.add_command(label='New Class', image=icons['new_class'], compound='left', command=lambda: self.root.timetable.new_class())
-        edit_menu.add_separator(background='#D4D4D4')
-        edit_menu.add_command(label='Delete Events', image=icons['delete_event'], compound='left', command=lambda: self.root.timetable.delete_event())
-        edit_menu.add_command(label='Delete Class', image=icons['delete_class'], compound='left', command=lambda: self.root.timetable.delete_class())
-        edit_menu.add_separator(background='#D4D4D4')
-        edit_menu.add_command(label='Change Week Number', image=icons['calendar'], compound='left', command=lambda: self.root.timetable.change_week())
+        def populate_edit_menu() -> None:
+            edit_menu.add_command(label='Undo', image=icons['undo'], compound='left', command=lambda: self.root.undo())
+            edit_menu.add_command(label='Redo', image=icons['redo'], compound='left', command=lambda: self.root.redo())
+            edit_menu.add_command(label='Undo All', image=icons['restore'], compound='left', command=lambda: self.root.undo_all())
+            edit_menu.add_separator(background='#D4D4D4')
+            edit_menu.add_command(label='New Event', image=icons['new_event'], compound='left', command=lambda: self.root.timetable.create_event())
+            edit_menu.add_command(label='New Class', image=icons['new_class'], compound='left', command=lambda: self.root.timetable.new_class())
+            edit_menu.add_separator(background='#D4D4D4')
+            edit_menu.add_command(label='Delete Events', image=icons['delete_event'], compound='left', command=lambda: self.root.timetable.delete_event())
+            edit_menu.add_command(label='Delete Class', image=icons['delete_class'], compound='left', command=lambda: self.root.timetable.delete_class())
+            edit_menu.add_separator(background='#D4D4D4')
+            edit_menu.add_command(label='Change Week Number', image=icons['calendar'], compound='left', command=lambda: self.root.timetable.change_week())
+            edit_menu.add_command(label='Change Term Length', image=icons['calendar'], compound='left', command=lambda: self.root.timetable.change_term_length())
+
+        self.populate_on_post(edit_menu, populate_edit_menu)
         edit_menubutton.configure(menu=edit_menu)
 
         ## ------------------------------------------ About Menu ------------------------------------------
         about_menubutton = tk.Menubutton(self, text='About', relief='flat', borderwidth=0, activebackground='#323232', image=self.root.pixel, compound='center', height=13, width=50, background=self.cget('background'), foreground='#D8DEE9', activeforeground='#D8DEE9', font=('Calibri', 13))
         about_menubutton.grid(row=0, column=9, sticky='nswe', padx=(0, 1))
         about_menu = tk.Menu(about_menubutton, tearoff=0, background='#323232', relief='flat', foreground='#fff', borderwidth=10, activeborderwidth=0, type='normal')
-        about_menu.add_command(label='About', image=icons['about'], compound='left', command=lambda: self.root.show_about())
-        about_menu.add_command(label='Help', image=icons['help'], compound='left', command=lambda: self.root.show_help())
-        about_menu.add_separator(background='#D4D4D4')
-        about_menu.add_command(label='Report a Bug', image=icons['bug'], compound='left', command=lambda: self.root.report_bug())
-        about_menu.add_command(label='Suggest a Feature', image=icons['feature'], compound='left', command=lambda: self.root.report_feature())
+
+        def populate_about_menu() -> None:
+            about_menu.add_command(label='About', image=icons['about'], compound='left', command=lambda: self.root.show_about())
+            about_menu.add_command(label='Help', image=icons['help'], compound='left', command=lambda: self.root.show_help())
+            about_menu.add_separator(background='#D4D4D4')
+            about_menu.add_command(label='Report a Bug', image=icons['bug'], compound='left', command=lambda: self.root.report_bug())
+            about_menu.add_command(label='Suggest a Feature', image=icons['feature'], compound='left', command=lambda: self.root.report_feature())
+
+        self.populate_on_post(about_menu, populate_about_menu)
         about_menubutton.configure(menu=about_menu)
 
         self.filename_display = tk.Label(self, text=self.root.filename, background=self.cget('background'), foreground='#666', font=('Calibri', 10, 'bold'), anchor='center', image=self.root.pixel, compound='center')
         self.filename_display.grid(row=0, column=10, sticky='nswe', padx=(0, 1))
 
-
-class FormattingOption(tk.Frame):
-    """
-    A widget containing and displaying a line of formatting information for a reportlab Table style config
-
-    :param root: (ExportAsPDFMenu) The export as pdf toplevel widget
-    """
-
-    def __init__(self, root, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-
-        self.root: ExportAsPDFMenu = root
-        self.style_option = tk.StringVar(self)  # Define a stringvar for the selected style option
-
-        ## Create a dropdown to select the style option
-        class_dropdown = CustomComboBox(self, style='TCombobox', textvariable=self.style_option, values=['GRID', 'ALIGN', 'VALIGN', 'FONT', 'TOPPADDING', 'FONTSIZE', 'TEXTCOLOR', 'BACKGROUND', 'SPAN', 'BOTTOMPADDING'])
-        class_dropdown.pack(side='left', fill='y', padx=1, pady=1)
-
-        tk.Frame(self, background='#000', width=12).pack(side='left', fill='y')  # Spacer
-
-        ## Top Left Corner
-        tk.Label(self, background='#303841', foreground='#D8DEE9', text='X₁', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
-
-        self.x1_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
-        self.x1_entry.configure(invalidcommand=lambda: self.invalid_input(self.x1_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.x1_entry, 'x'))
-        self.x1_entry.pack(side='left', fill='y', padx=(1, 0), pady=1)
-
-        tk.Label(self, background='#303841', foreground='#D8DEE9', text='Y₁', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
-
-        self.y1_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
-        self.y1_entry.configure(invalidcommand=lambda: self.invalid_input(self.y1_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.y1_entry, 'y'))
-        self.y1_entry.pack(side='left', fill='y', padx=(1, 1), pady=1)
-
-        tk.Frame(self, background='#000', width=12).pack(side='left', fill='y')  # Spacer
-
-        ## Bottom Right Corner
-        tk.Label(self, background='#303841', foreground='#D8DEE9', text='X₂', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
-
-        self.x2_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
-        self.x2_entry.configure(invalidcommand=lambda: self.invalid_input(self.x2_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.x2_entry, 'x'))
-        self.x2_entry.pack(side='left', fill='y', padx=(1, 0), pady=1)
-
-        tk.Label(self, background='#303841', foreground='#D8DEE9', text='Y₂', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
-
-        self.y2_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
-        self.y2_entry.configure(invalidcommand=lambda: self.invalid_input(self.y2_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.y2_entry, 'y'))
-        self.y2_entry.pack(side='left', fill='y', padx=(1, 1), pady=1)
-
-        tk.Frame(self, background='#000', width=12).pack(side='left', fill='y')  # Spacer
-
-        ## Value entry
-        tk.Label(self, background='#303841', foreground='#D8DEE9', text='Value ', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
-
-        self.value_entry = ttk.Entry(self, style='stipple.TEntry', validate='focusout')
-        self.value_entry.configure(invalidcommand=lambda: self.invalid_input(self.value_entry, 'Invalid Value'), validatecommand=lambda: self.validate_value())
-        self.value_entry.pack(side='left', expand=True, fill='both', padx=(1, 1), pady=1)
-
-        ## Bind the widget’s children to select the widget when clicked
-        self.bind_class(f'click:{id(self)}', '<Button-1>', lambda v: self.clicked())
-        self.bindtags((f'click:{id(self)}', *self.bindtags()))
-        for i in self.winfo_children():
-            i.bindtags((f'click:{id(self)}', *i.bindtags()))
-
-    def clicked(self) -> None:
-        """
-        Selects / deselects the formatting option
-        """
-
-        if self.root.selected_format_option == self:
-            self.deselect()
-            self.root.selected_format_option = None
-        else:
-            if self.root.selected_format_option is not None:
-                self.root.selected_format_option.deselect()
-            self.root.selected_format_option = self
-            self.select()
-
-    def select(self) -> None:
-        """ Changes the background colour to a selected colour """
-        self.configure(background='#F9AE58')
-
-    def deselect(self) -> None:
-        """ Changes the background colour to the normal colour """
-        self.configure(background='#3B434C')
-
-    def select_style_class(self) -> None:
-        """ Adds template text to the value entry when the user selects the style option to edit """
-        ## Todo: This should add a formatting template to the value entry when a new style option is selected
-        pass
-
-    def validate_pos(self, elem: ttk.Entry, mode: Literal['x', 'y']) -> bool:
-        """
-        Validates that the X or Y position in the input entry are within the bounds of the table.
-
-        :param elem: The entry whose value to check
-        :param mode: Whether to treat the value as an X coordinate or Y coordinate
-
-        :return: Whether or not the input value is an integer within the bounds of the table
-        """
-
-        val = elem.get()  # Get the contents of the entry
-        if not val.removeprefix('-').isnumeric():  # Check if the value is an integer
-            return False
-
-        ## Validate the coordinate is within the bounds of the table
-        if mode == 'x':
-            return -7 <= int(val) <= 6
-        else:
-            return -(len(self.root.timetable_data['sessions'])) <= int(val) <= (len(self.root.timetable_data['sessions']) - 1)
-
     @staticmethod
-    def invalid_input(elem: tk.Entry, text: str) -> None:
-        """
-        This function is called when an input into an entry does not pass validation.
-        It sets the cursor back into the entry and displays a message to the user.
-
-        :param elem: The entry to set the cursor into
-        :param text: The message to display to the user
+    def populate_on_post(menu: tk.Menu, populate: Callable[[], None]) -> None:
         """
+        Add the entries to a menu the first time it is opened
 
-        cursor_pos = elem.index(tk.INSERT)
-        mb.showinfo('Invalid Input', text)
-        elem.focus()
-        elem.icursor(cursor_pos)
-
-    def validate_value(self) -> bool:
-        """
-        Evaluate the contents of the value entry as python code and validate the result.
+        :param menu: The menu to populate
+        :param populate: A function that adds the entries to the menu
         """
 
-        val = self.value_entry.get()  # Get the contents of the value entry
-
-        try:  # Attempt to evaluate the value
-            eval(f'[{val}]')
-            return True
-        except Exception:
-            return False
-
-
-## todo: add font, colours, margin, to export PDF
+        def post() -> None:
+            menu.configure(postcommand='')  # Only populate the menu once
+            populate()
 
-class VerticalText(Flowable):
-    """
-    Rotates a text in a table cell.
-    From: https://stackoverflow.com/a/40349017
-
-    :param text: The text to display
-    :bottompadding: The spacing on the bottom of the text that becomes the padding on the right-hand side.
-    """
-
-    def __init__(self, text: str, bottompadding: float | int = 0) -> None:
-        Flowable.__init__(self)
-        self.text = text
-        self.bottompadding = bottompadding
-
-    def draw(self) -> None:
-        """
-        Add the text to the canvas
-        """
-
-        canvas = self.canv
-        canvas.rotate(90)
-        fs = canvas._fontsize
-        canvas.translate(1, -fs / 1.2)  # canvas._leading?
-        canvas.drawString(0, self.bottompadding, self.text)
-
-    def wrap(self, a_w: float, a_h: float) -> tuple[float, float]:
-        """
-        Wrap the text on the canvas
-        """
-
-        canv = self.canv
-        fn, fs = canv._fontname, canv._fontsize
-        return canv._leading, 1 + canv.stringWidth(self.text, fn, fs)
+        menu.configure(postcommand=post)
 
 
 class TimetableClass:
     """
-    Stores data related to a class that can be mapped to a cell in the timetable.
+    Displays the data of a class that can be mapped to a cell in the timetable.
+    The data is stored in the timetable’s model (see `ClassData`), and the class holds string variables to display and edit it.
+    Classes should be created with `TimeTable.add_class`, which adds them to the timetable’s list of classes.
 
     :param root: (TimeTable) The root timetable widget.
-    :param name: The name of the mappable timetable class.
-    :param room: The name/number of the class’s room.
-    :param teacher: The name of the class’s teacher.
+    :param data: The data of the class.
     """
 
-    def __init__(self, root, name: str, room: str, teacher: str) -> None:
+    def __init__(self, root, data: ClassData) -> None:
         self.root: TimeTable = root
+        self.data = data
+        self.cells: set[TimetableCell] = set()  # The cells that the class is mapped to
 
         ## Create string variables for the class’s name, room, and teacher to display on mapped cells
-        self.name_disp = tk.StringVar(self.root.display_frame, name)
-        self.room_disp = tk.StringVar(self.root.display_frame, room)
-        self.teacher_disp = tk.StringVar(self.root.display_frame, teacher)
+        self.name_disp = tk.StringVar(self.root.display_frame, data.name)
+        self.room_disp = tk.StringVar(self.root.display_frame, data.room)
+        self.teacher_disp = tk.StringVar(self.root.display_frame, data.teacher)
 
         ## Map the `get` method of each string variable to a new name
         self.name = self.name_disp.get
@@ -348,25 +202,42 @@ class TimetableClass:
 
         ## Add a trace that is called when the string variable is edited to each of the string variables
         self.name_disp.trace('w', lambda a, b, c: self.edit_name())
-        self.room_disp.trace('w', lambda a, b, c: self.root.check_saved(self.root.get_json()))
-        self.teacher_disp.trace('w', lambda a, b, c: self.root.check_saved(self.root.get_json()))
+        self.room_disp.trace('w', lambda a, b, c: self.edit_details())
+        self.teacher_disp.trace('w', lambda a, b, c: self.edit_details())
+
+    @property
+    def id(self) -> int:
+        """ A stable identifier for the class that does not change when other classes are added or removed """
+        return self.data.id
+
+    @property
+    def idx(self) -> int:
+        """ The index of the class in the timetable’s list of classes """
+        return self.data.idx
 
     def edit_name(self) -> None:
         """
-        Updates the value of the timetable widget’s class name combobox and updates its values.
+        Updates the class’s name in the model and the value of the timetable widget’s class name combobox and updates its values.
         This function is called whenever the class’s name string is edited.
         """
 
-        self.root.class_name_combobox.set(self.name_disp.get())  # Update the value of the combobox
+        self.data.name = self.name_disp.get()
+        self.root.class_name_combobox.set(self.data.name)  # Update the value of the combobox
         self.root.edit_class_names()
 
+    def edit_details(self) -> None:
+        """ Updates the class’s room and teacher in the model. This function is called whenever the class’s room or teacher string is edited. """
+
+        self.data.room = self.room_disp.get()
+        self.data.teacher = self.teacher_disp.get()
+        self.root.mark_changed('classes')
+
     def get_idx(self) -> int:
         """
-        Dynamically get the index of the class in the timetable’s list of classes.
-        This allows classes to be added and removed without keeping track of the index for each class.
+        Get the index of the class in the timetable’s list of classes.
         """
 
-        return self.root.classes.index(self)
+        return self.data.idx
 
     def destroy(self) -> None:
         """
@@ -374,654 +245,28 @@ class TimetableClass:
         """
 
         ## Todo: destroy stringvars
-        for row in self.root.tt_elements:  # Iterate through each cell in the timetable
-            for elem in row:
-                if elem.tt_class == self:  # If it is mapped to the deleted class, remove its mapping in the class mapping array as well as in the cell itself.
-                    elem.update_mapped_class(None)
-                    self.root.class_mapping[elem.day][elem.session] = None
+        for cell in list(self.cells):  # Remove the mapping of each cell that the class is mapped to
+            cell.update_mapped_class(None)
 
-        self.root.classes.remove(self)  # Remove the instance of the class from the list of classes
-        self.root.edit_class_names()  # Update the values of the class name combobox
+        ## Remove the instance of the class from the list of classes. The model updates the indexes of the classes after it.
+        del self.root.classes[self.idx]
+        self.root.model.remove_class(self.data)
+        self.root.classes_by_id.pop(self.id)
 
-        del self  # Delete the class from memory
+        self.root.edit_class_names()  # Update the values of the class name combobox
 
     def __iter__(self) -> None:
         """ Yield the name, room, and teacher of the class as strings. """
 
-        yield self.name_disp.get().replace("\"", "\\\"")
-        yield self.room_disp.get().replace("\"", "\\\"")
-        yield self.teacher_disp.get().replace("\"", "\\\"")
+        yield self.name_disp.get()
+        yield self.room_disp.get()
+        yield self.teacher_disp.get()
 
 
 ## Todo: current time 'playhead', draggable events, custom event start times, day/month/week view, session division editor, optimise and publish ip2 and toolsV2, O(n) finder, multiple events per session
 ## Todo: prompt to reset week when number of weeks exceded. Add number of weeks to timetable properties
 
 
-class ExportAsPDFMenu(tk.Toplevel):
-    """
-    A window that allows converting a timetable file to PDF and configuring the formatting of the resulting PDF.
-
-    :param root: (Window) The root window widget
-    """
-
-    def __init__(self, root, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.root: Window = root
-
-        self.attributes('-topmost', True)  # Set the window to the topmost window
-        self.grab_set()  # Disable interaction with the main window until this window is closed
-        self.title('Convert to PDF')  # Set the title of the window
-        self.geometry(f'+{self.root.winfo_x() + int(self.root.winfo_width() // 3)}+{self.root.winfo_y() + int(self.root.winfo_height() // 3)}')  # Set the position of the window to roughly the centre of the main window
-        self.root.call('wm', 'iconphoto', str(self), self.root.icons['window_icon2'])  # Set the icon of the window
-
-        self.configure(background='#222', padx=1, pady=1)  # Set the background colour and internal padding of the window
-        self.columnconfigure(2, weight=1)
-        self.rowconfigure(10, weight=1)
-
-        self.selected_format_option: Optional[FormattingOption] = None
-        self.formatting_elems: list[FormattingOption] = []
-
-        ## Load the current timetable
-        self.timetable_data: Optional[dict] = None
-
-        with open(self.root.filename, encoding='utf-8') as input_file:
-            timetable = json.load(input_file)
-            self.timetable_data = timetable
-
-        ## Define basic style elements
-        self.tablestyle = [
-            ('SPAN', (-2, 2), (-2, -1)),
-            ('SPAN', (-1, 2), (-1, -1)),
-        ]
-
-        ## Layout formatting presets for the output PDF. Other presets can be added here and be used by the program
-        self.preset_options = {
-            # Preset Name   |  Width | Height | Table width | Table height | Horizontal margin | Vertical margin | Size units | Table size units | Margin Units  # noqa
-            '2x1 Timetable' : (22,     12,      'Auto',       'Auto',        1.0,                1.0,              'cm',        'cm',              'cm'),        # noqa
-            'A4 (Portrait)' : (29.7,   40,      'Auto',       'Auto',        1.5,                1.5,              'cm',        'cm',              'cm'),        # noqa
-            'A5 (Portrait)' : (21,     29.7,    'Auto',       'Auto',        1.5,                1.5,              'cm',        'cm',              'cm'),        # noqa
-            'A4 (Landscape)': (29.7,   40,      'Auto',       'Auto',        1.0,                1.0,              'cm',        'cm',              'cm'),        # noqa
-            'A5 (Landscape)': (21,     29.7,    'Auto',       'Auto',        1.0,                1.0,              'cm',        'cm',              'cm'),        # noqa
-        }
-
-        ## Define default formatting for each part of the output timetable
-        self.formatting = {
-            'first_row': {
-                'BACKGROUND': '#D3D3D3',
-                'FOREGROUND': '#000000',
-                'GRID': (1, '#000000'),
-                'FONT': ('Calibri-Bold',),
-                'FONTSIZE': 'Auto',
-                'ORIENT': 'horizontal',
-                'ALIGN': ('CENTER',),
-                'VALIGN': ('MIDDLE',),
-                'BOTTOMPADDING': (0,),
-            },
-
-            'first_column': {
-                'BACKGROUND': '#D3D3D3',
-                'FOREGROUND': '#000000',
-                'GRID': (1, '#000000'),
-                'FONT': ('Calibri-Bold',),
-                'FONTSIZE': 'Auto',
-                'ORIENT': 'vertical',
-                'ALIGN': ('CENTER',),
-                'VALIGN': ('MIDDLE',),
-                'BOTTOMPADDING': (0,),
-            },
-
-            'break': {
-                'BACKGROUND': '#D3D3D3',
-                'FOREGROUND': '#000000',
-                'GRID': (0.5, '#000000'),
-                'FONT': ('Calibri-Bold',),
-                'FONTSIZE': 'Auto',
-                'ORIENT': 'horizontal',
-                'ALIGN': ('CENTER',),
-                'VALIGN': ('MIDDLE',),
-                'BOTTOMPADDING': (0,),
-            },
-
-            'sessionname': {
-                'BACKGROUND': '#FFFFFF',
-                'FOREGROUND': '#000000',
-                'GRID': (0.5, '#000000'),
-                'FONT': ('Calibri-Bold',),
-                'FONTSIZE': 'Auto',
-                'ORIENT': 'horizontal',
-                'ALIGN': ('CENTER',),
-                'VALIGN': ('MIDDLE',),
-                'BOTTOMPADDING': (0,),
-            },
-
-            'body': {
-                'BACKGROUND': '#FFFFFF',
-                'FOREGROUND': '#000000',
-                'GRID': (0.5, '#000000'),
-                'FONT': ('Calibri',),
-                'FONTSIZE': 'Auto',
-                'ORIENT': 'horizontal',
-                'ALIGN': ('CENTER',),
-                'VALIGN': ('MIDDLE',),
-                'BOTTOMPADDING': (0,),
-            }
-        }
-
-        ## Define default formatting for UI elements
-        labelconfig = dict(background='#303841', foreground='#D8DEE9', image=self.root.pixel, font=('Calibri', 11), compound='center', height=14)
-        buttonconfig = dict(background='#303841', foreground='#D8DEE9', activebackground='#2E3238', mouseoverbackground='#3B434C', font=('Calibri', 11), compound='center', highlightbackground='#4F565E')
-
-        ## ======================================== User Interface ========================================
-
-        ## ---------------------------------------- Filename input ----------------------------------------
-        outfile_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
-        outfile_frame.grid(row=0, column=0, columns=3, sticky='NSWE', padx=0, pady=(0, 0))
-        outfile_frame.columnconfigure(1, weight=1)
-
-        tk.Label(outfile_frame, text='Output File', width=60, **labelconfig).grid(row=0, column=0, sticky='NSWE', padx=(0, 1), pady=0)
-
-        self.outfile_entry = Entry(outfile_frame, text=self.root.filename.removesuffix('.json').removesuffix('.txt') + '.pdf', style='stipple.TEntry')
-        self.outfile_entry.grid(row=0, column=1, sticky='NSWE', padx=(0, 1), pady=0)
-
-        MouseoverButton(outfile_frame, command=lambda: self.browse_filename(), image=self.root.icons['load'], width=25, height=20, **buttonconfig).grid(row=0, column=2, sticky='nswe', padx=(0, 0), pady=0)
-
-        ## ----------------------------------------- Page Options -----------------------------------------
-        page_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
-        page_options_frame.grid(row=1, column=0, sticky='nswe', padx=0, pady=(7, 0))
-
-        tk.Label(page_options_frame, text='Page Size', **labelconfig).pack(side='top', padx=(0, 0), pady=(0, 1), fill='x')
-        tk.Frame(page_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
-
-        self.presets_selector = CustomComboBox(page_options_frame, state='readonly', style='TCombobox', values=list(self.preset_options.keys()), width=5)
-        self.presets_selector.pack(side='top', padx=(0, 0), pady=(0, 1), fill='x')
-        self.presets_selector.bind('<<ComboboxSelected>>', lambda v: self.select_preset())
-        self.presets_selector.set('A4 (Portrait)')
-
-        self.width_entry = Entry(page_options_frame, text='29.7', style='stipple.TEntry', width=5)
-        self.width_entry.configure(validatecommand=lambda: self.validate_num(self.width_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.width_entry, 'TODO'))
-        self.width_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        tk.Label(page_options_frame, text='x', width=10, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.height_entry = Entry(page_options_frame, text='40', style='stipple.TEntry', width=5)
-        self.height_entry.configure(validatecommand=lambda: self.validate_num(self.height_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.height_entry, 'TODO'))
-        self.height_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        self.page_units = CustomComboBox(page_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in'], width=3)
-        self.page_units.pack(side='left', padx=0, pady=0, fill='both')
-        self.page_units.set('cm')
-
-        ## ----------------------------------------- Table Options ----------------------------------------
-        table_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
-        table_options_frame.grid(row=2, column=0, sticky='nswe', padx=0, pady=(7, 0))
-
-        tk.Label(table_options_frame, text='Table Size', **labelconfig).pack(side='top', anchor='w', padx=0, pady=0, fill='x')
-        tk.Frame(table_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
-
-        self.table_width_entry = Entry(table_options_frame, text='Auto', style='stipple.TEntry', width=5)
-        self.table_width_entry.configure(validatecommand=lambda: self.validate_num(self.table_width_entry, special_vals=['Auto']), validate='focusout', invalidcommand=lambda: self.invalid_input(self.table_width_entry, 'TODO'))
-        self.table_width_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        tk.Label(table_options_frame, text='x', width=10, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.table_height_entry = Entry(table_options_frame, text='Auto', style='stipple.TEntry', width=5)
-        self.table_height_entry.configure(validatecommand=lambda: self.validate_num(self.table_height_entry, special_vals=['Auto']), validate='focusout', invalidcommand=lambda: self.invalid_input(self.table_height_entry, 'TODO'))
-        self.table_height_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        self.table_units = CustomComboBox(table_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in', '%'], width=3)
-        self.table_units.pack(side='left', padx=0, pady=0, fill='both')
-        self.table_units.set('cm')
-
-        ## ---------------------------------------- Margin Options ----------------------------------------
-        margin_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
-        margin_options_frame.grid(row=3, column=0, sticky='nswe', padx=0, pady=(7, 0))
-
-        tk.Label(margin_options_frame, text='Margins', **labelconfig).pack(side='top', padx=0, pady=(0, 0), fill='x')
-        tk.Frame(margin_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
-
-        tk.Label(margin_options_frame, text='↔', width=15, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.h_margin_entry = Entry(margin_options_frame, text='1.5', style='stipple.TEntry', width=5)
-        self.h_margin_entry.configure(validatecommand=lambda: self.validate_num(self.h_margin_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.h_margin_entry, 'TODO'))
-        self.h_margin_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        tk.Label(margin_options_frame, text='↕', width=15, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.v_margin_entry = Entry(margin_options_frame, text='1.5', style='stipple.TEntry', width=5)
-        self.v_margin_entry.configure(validatecommand=lambda: self.validate_num(self.v_margin_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.v_margin_entry, 'TODO'))
-        self.v_margin_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        self.margin_units = CustomComboBox(margin_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in', '%'], width=3)
-        self.margin_units.pack(side='left', padx=0, pady=0, fill='both')
-        self.margin_units.set('cm')
-
-        ## ------------------------------------ Bottom Padding Options ------------------------------------
-        ## Note: Changing the font size of the text causes """unique""" behaviour with vertical alignment, so this option exists to adjust it.
-        bottompad_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
-        bottompad_options_frame.grid(row=4, column=0, sticky='nswe', padx=0, pady=(7, 0))
-
-        tk.Label(bottompad_options_frame, text='Bottom Padding', **labelconfig).pack(side='top', padx=0, pady=(0, 0), fill='x')
-        tk.Frame(bottompad_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
-
-        self.bottom_padding_0 = Entry(bottompad_options_frame, text='5', style='stipple.TEntry', width=5)
-        self.bottom_padding_0.configure(validatecommand=lambda: self.validate_num(self.bottom_padding_0), validate='focusout', invalidcommand=lambda: self.invalid_input(self.bottom_padding_0, 'TODO'))
-        self.bottom_padding_0.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        self.bottom_padding_1 = Entry(bottompad_options_frame, text='15', style='stipple.TEntry', width=5)
-        self.bottom_padding_1.configure(validatecommand=lambda: self.validate_num(self.bottom_padding_1), validate='focusout', invalidcommand=lambda: self.invalid_input(self.bottom_padding_1, 'TODO'))
-        self.bottom_padding_1.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
-
-        self.bottom_padding_2 = Entry(bottompad_options_frame, text='25', style='stipple.TEntry', width=5)
-        self.bottom_padding_2.configure(validatecommand=lambda: self.validate_num(self.bottom_padding_2), validate='focusout', invalidcommand=lambda: self.invalid_input(self.bottom_padding_2, 'TODO'))
-        self.bottom_padding_2.pack(side='left', padx=(0, 0), pady=0, expand=True, fill='both')
-
-        ## ------------------------------------ Corner Rounding Options -----------------------------------
-        round_corner_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
-        round_corner_options_frame.grid(row=5, column=0, sticky='nswe', padx=0, pady=(7, 0))
-
-        tk.Label(round_corner_options_frame, text='Round Corners', **labelconfig).pack(side='top', padx=0, pady=(0, 0), fill='x')
-        tk.Frame(round_corner_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
-
-        self.corner_units = CustomComboBox(round_corner_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in', '%'], width=3)
-        self.corner_units.pack(side='top', padx=0, pady=(0, 1), fill='both')
-        self.corner_units.set('cm')
-
-        corner_radius_entry_frame = tk.Frame(round_corner_options_frame, background='#3B434C')
-        corner_radius_entry_frame.pack(side='top', expand=True, fill='both')
-
-        tk.Label(corner_radius_entry_frame, text='◴', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.nw_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
-        self.nw_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.nw_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.nw_corner_radius, 'TODO'))
-        self.nw_corner_radius.pack(side='left', padx=(0, 1), expand=True, fill='both')
-
-        tk.Label(corner_radius_entry_frame, text='◷', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.ne_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
-        self.ne_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.ne_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.ne_corner_radius, 'TODO'))
-        self.ne_corner_radius.pack(side='left', padx=(0, 0), expand=True, fill='both')
-
-        corner_radius_entry_frame = tk.Frame(round_corner_options_frame, background='#3B434C')
-        corner_radius_entry_frame.pack(side='top', expand=True, fill='both')
-
-        tk.Label(corner_radius_entry_frame, text='◵', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.sw_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
-        self.sw_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.sw_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.sw_corner_radius, 'TODO'))
-        self.sw_corner_radius.pack(side='left', padx=(0, 1), expand=True, fill='both')
-
-        tk.Label(corner_radius_entry_frame, text='◶', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
-
-        self.se_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
-        self.se_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.se_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.se_corner_radius, 'TODO'))
-        self.se_corner_radius.pack(side='left', padx=(0, 0), expand=True, fill='both')
-
-        self.match_corner_radius = tk.BooleanVar(self, True)
-        ttk.Checkbutton(round_corner_options_frame, style='Custom.TCheckbutton', text='Match Radius', variable=self.match_corner_radius).pack(side='top', fill='both', pady=(0, 1))
-
-        ## -------------------------------- Advanced Formatting Input Frame -------------------------------
-        ## A frame that allows direct editing of the table style options.
-        frame = tk.Frame(self, background='#222')
-        frame.grid(row=1, column=1, columns=1, rows=5, sticky='NSWE', padx=(10, 0), pady=(7, 0))
-        frame.rowconfigure(1, weight=1)
-        frame.columnconfigure(1, weight=1, minsize=500)
-
-        tk.Label(frame, text='Advanced Formatting', **labelconfig, highlightthickness=1, highlightbackground='#3B434C').grid(row=0, column=0, columns=3, sticky='NSWE', pady=(0, 1))
-
-        self.vscrollbar = ttk.Scrollbar(frame, orient='vertical', style='Custom.Vertical.TScrollbar')
-        self.vscrollbar.grid(row=1, column=2, sticky='ns', padx=(0, 0), pady=0)
-
-        self.scrollable_frame = ScrollableFrame(frame, vscrollbar=self.vscrollbar, c_highlightthickness=1, c_background='#000', c_highlightbackground='#3B434C', f_background='#000')
-        self.scrollable_frame.grid(row=1, column=0, columns=2, sticky='NSWE', padx=(0, 1), pady=0)
-
-        MouseoverButton(frame, text='+', command=lambda: self.add_formatting(), image=self.root.pixel, width=18, height=18, highlightthickness=1, **buttonconfig).grid(row=2, column=0, sticky='nw', padx=(0, 1), pady=(1, 0))
-        MouseoverButton(frame, text='-', command=lambda: self.remove_formatting(), image=self.root.pixel, width=18, height=18, highlightthickness=1, **buttonconfig).grid(row=2, column=1, sticky='nw', padx=(0, 0), pady=(1, 0))
-
-        ## Add existing formatting options to the formatting options frame
-        for i in self.tablestyle:
-            elem = FormattingOption(self, self.scrollable_frame.frame, background='#3B434C')
-            elem.pack(side='top', fill='x', padx=1, pady=(1, 0))
-            elem.style_option.set(i[0])
-            elem.x1_entry.insert(0, str(i[1][0]))
-            elem.x2_entry.insert(0, str(i[2][0]))
-            elem.y1_entry.insert(0, str(i[1][1]))
-            elem.y2_entry.insert(0, str(i[2][1]))
-            elem.value_entry.insert(0, str(list(i[3:]))[1:-1])
-
-            self.formatting_elems.append(elem)
-
-        ## ------------------------------------ Cancel and Export Buttons ---------------------------------
-
-        frame = tk.Frame(self, background='#222')
-        frame.grid(row=6, column=1, sticky='NSE', pady=(0, 0))
-
-        MouseoverButton(frame, text='Cancel', command=lambda: self.destroy(), image=self.root.pixel, width=50, height=18, highlightthickness=1, **buttonconfig).pack(side='left', padx=0, fill='y')  # .grid(row=1, column=1, sticky='nswe', padx=(0, 1), pady=(0, 0))
-        MouseoverButton(frame, text='Export', command=lambda: self.convert(), image=self.root.pixel, width=50, height=18, highlightthickness=1, **buttonconfig).pack(side='left', padx=(1, 0), fill='y')  # .grid(row=1, column=0, sticky='nswe', padx=(0, 1), pady=(0, 0))
-
-    def select_preset(self) -> None:
-        """
-        Sets the values of all page formatting entries when a preset is selected from the dropdown
-        """
-
-        ## Get the preset name and data
-        preset_name = self.presets_selector.get()
-        preset_data = self.preset_options[preset_name]
-
-        ## Get the widgets to update (in order)
-        elems = [
-            self.width_entry,
-            self.height_entry,
-            self.table_width_entry,
-            self.table_height_entry,
-            self.h_margin_entry,
-            self.v_margin_entry,
-            self.page_units,
-            self.table_units,
-            self.margin_units
-        ]
-
-        ## Update each widget
-        for elem, i in zip(elems, preset_data):
-            elem.set(i)
-
-    def browse_filename(self) -> None:
-        """ Open an 'open file' dialogue and set the outfile entry to the chosen file """
-
-        filename = fd.askopenfilename(defaultextension='.json', filetypes=(('JSON', '.json'), ('Plain Text', '.txt'), ('All', '*')), initialdir=os.path.dirname(self.root.filename), initialfile=self.root.filename, parent=self)
-        if filename:  # If a file was chosen, update the outfile entry.
-            self.outfile_entry.set(filename)
-
-    @staticmethod
-    def invalid_input(element: Entry, text: str) -> None:
-        """
-        This function is called when an input into an entry does not pass validation.
-        It sets the cursor back into the entry and displays a message to the user.
-
-        :param element: The entry to set the cursor into
-        :param text: The message to display to the user
-        """
-
-        cursor_pos = element.index(tk.INSERT)
-        mb.showinfo('Invalid Input', text)
-        element.focus()
-        element.icursor(cursor_pos)
-
-    @staticmethod
-    def validate_num(elem: Entry, dtype=float, allow_negative: bool = False, special_vals: Optional[list[str]] = None) -> bool:
-        """
-        Evaluates a number or simple equation in an entry widget and validates the result based on the input parameters.
-        Sets the value of the entry to the evaluated string if the string is valid.
-
-        :param elem: The entry from which to get the string to validate.
-        :param dtype: The data type that the evaluated string should match.
-        :param allow_negative: Weather or not to allow the result to be negative.
-        :param special_vals: An optional list of values for which to skip validation and always return `True`.
-                             This parameter should be a list of strings in Title Case or `None`.
-
-        :return: Whether or not the value in the entry is valid.
-        """
-
-        value = elem.get()  # Get the string to validate
-        if special_vals is not None:  # Check if the string matches any of the `special vals`
-            if value.title().strip(' \t\n') in special_vals:
-                elem.set(value.title().strip(' \t\n'))
-                return True
-
-        if value.strip('0123456789.+-/*() '):  # Check for invalid characters
-            return False
-        else:
-            ## Attempt to evaluate the string
-            try:
-                value = eval(value)
-                if type(value) is not dtype:  # If the resulting value does not match the valid data type
-                    ## Allow integers to be used as floats
-                    if dtype is float and type(value) is int:  # If the valid data type is `float` and the evaluated data type is `int` convert the result to a float
-                        value = float(value)
-                    else:  # Otherwise, return that the input is invalid.
-                        return False
-
-                if not allow_negative and value < 0:  # If the result is negative, and negatives are not allowed, return that the result is invalid
-                    return False
-                else:  # Otherwise, set the value of the entry to the evaluated string and return that the input is valid.
-                    elem.set(str(value))
-                    return True
-            except Exception:  # If the program fails to evaluate the input string, return that the input is invalid. Note: the `eval` function runs any python code, so the exception could be anything.
-                return False
-
-    def convert(self) -> None:
-        """
-        Converts a timetable file to a table in a PDF
-        """
-        # if append:
-        #     canvas = Canvas(dir_name + '/img2pdf_tmp.pdf', (doc_w, doc_h))
-        # else:
-
-        ## Get the filename of the output pdf
-        output_filename = self.outfile_entry.get()
-        if not output_filename.endswith('.pdf'):
-            output_filename += '.pdf'
-
-        ## If the output file already exists, check for permission to write.
-        if file_exists(output_filename):
-            permission_error = True
-            while permission_error:
-                try:
-                    open(output_filename, 'w').close()  # Attempt to write to the file
-                    permission_error = False
-                except PermissionError:
-                    ans = mb.askretrycancel('Permission Denied', f'Could not save {os.path.basename(output_filename)}, because it is open\nin another program.')  # Warn the user that the file is open in another program
-                    if not ans:  # If the user presses the 'x' or 'cancel' buttons, stop the function.
-                        return
-
-        self.tablestyle = []  # Define an array for the table style options
-
-        data = [['', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']]  # Define an array for the table text data
-
-        sessionname_idxs = [((-2, 1), (-1, -1))]  # Define a list for the indexes of 'session name' cells
-        break_idxs = []  # Define a list for the indexes of the 'session break' cells
-        break_count = 0  # Define a counter for the number of 'break' cells
-        v_header_indexes = []  # Define a list for the indexes of the session name headers
-
-        ## Iterate through each session in the timetable data
-        for n, i in enumerate(self.timetable_data['sessions']):
-            if i[1]:  # If the session is not a session break
-                ## Add the indexes of the session name and session header to their respective lists
-                sessionname_idxs.append([(1, len(data)), (-3, len(data))])
-                v_header_indexes.append([(0, len(data)), (0, len(data) + 2)])
-
-                self.tablestyle.append(('SPAN', (0, len(data)), (0, len(data) + 2)))  # Configure the session header to span three rows
-
-                line_data = [[i[0]], [''], ['']]  # Initiate a list for the row’s text with the values of the first column
-
-                ## Add the text for each class in the session’s time slot to the text list
-                for day_num, day in enumerate(self.timetable_data['timetable']):
-                    class_index = day[n - break_count]
-                    line_data[0].append(self.timetable_data['classes'][class_index])
-                    line_data[1].append(self.timetable_data['teachers'][class_index])
-                    line_data[2].append(self.timetable_data['rooms'][class_index])
-
-                data.extend(line_data)  # Add the session text to the table data
-            else:  # Otherwise (the session is a break)
-                break_count += 1  # Increment the number of breaks
-                break_idxs.append([(0, len(data)), (-3, len(data))])  # Add the indexes of the break to the respective list
-
-                self.tablestyle.append(('SPAN', (0, len(data)), (-3, len(data))))  # Configure the table to span to the 1st to 3rd last columns
-                data.append(i[0])  # Add the break text to the table data
-
-        data[1].extend(['Homework'] * 2)  # Add the text for saturday and sunday
-
-        page_unit = {'cm': units.cm, 'mm': units.mm, 'pt': units.pica, 'px': 1, 'in': units.inch}[self.page_units.get()]  # Get the multiplier corresponding to the units selected for the page size
-
-        ## Calculate the document dimensions
-        doc_w = float(self.width_entry.get()) * page_unit
-        doc_h = float(self.height_entry.get()) * page_unit
-
-        ## Calculate the size of the margins for the document
-        if self.margin_units.get() == '%':  # If the input value is a percentage, calculate the margins as a percentage of the document dimensions
-            margin = [doc_w * (float(self.h_margin_entry.get()) / 100), doc_h * (float(self.v_margin_entry.get()) / 100)]
-        else:
-            margin_unit = {'cm': units.cm, 'mm': units.mm, 'pt': units.pica, 'px': 1, 'in': units.inch}[self.page_units.get()]  # Get the multiplier for the units selected for the margins
-            margin = [float(self.h_margin_entry.get()) * margin_unit, float(self.v_margin_entry.get()) * margin_unit]  # Calculate the margins
-
-        table_unit = {'cm': units.cm, 'mm': units.mm, 'pt': units.pica, 'px': 1, 'in': units.inch, '%': 1}[self.table_units.get()]  # Get the multiplier for the units selected for the table size. '%' is given a multiplier of 1 as a placeholder
-
-        if self.table_width_entry.get().lower() == 'auto':  # If the table width is 'Auto', set the table width to the document width minus the margins
-            tablewidth = doc_w - margin[0] * 2
-        else:
-            if self.table_units.get() == '%':  # Otherwise, if the selected unit is '%', calculate the table width as a percentage of the document width, minus the margins.
-                tablewidth = (doc_w - margin[0] * 2) * (float(self.table_width_entry.get()) / 100)
-            else:
-                tablewidth = float(self.table_width_entry.get()) * table_unit  # Calculate the table width
-
-        if self.table_height_entry.get().lower() == 'auto':  # If the table height is 'Auto', set the table height to the document height minus the margins
-            tableheight = doc_h - margin[1] * 2
-        else:
-            if self.table_units.get() == '%':  # Otherwise, if the selected unit is '%', calculate the table height as a percentage of the document height, minus the margins.
-                tableheight = (doc_h - margin[1] * 2) * (float(self.table_height_entry.get()) / 100)
-            else:
-                tableheight = float(self.table_height_entry.get()) * table_unit  # Calculate the table height
-
-        ## todo: add column and row size distribution to export config
-
-        cw = [0.055] + [0.135] * 7  # Get relative column widths
-        cw = [v * tablewidth for v in cw]  # Multiply the relative column widths by the table width
-
-        rows = len(data) - 1  # Calculate the number of rows in the table
-        header_column_width = cw[0] / tableheight  # Get the pixel size of the first column’s width as a percentage of the table height so the first row and first column can be the same size
-        rh = [header_column_width] + [(1 - header_column_width) / rows] * rows  # Get the relative row heights
-        rh = [v * tableheight for v in rh]  # Multiply the relative row heights by the table height
-
-        font_sizes = dict()  # Define a dictionary to store the maximum font size corresponding to a certain height
-
-        ## Register the fonts to use
-        pdfmetrics.registerFont(TTFont(f'Calibri-Bold', 'calibrib.ttf'))
-        pdfmetrics.registerFont(TTFont(f'Calibri', 'calibri.ttf'))
-
-        ## Loop through the formatting options and the indexes of the row with the height to fit to.
-        for key, row in [('first_row', 0), ('first_column', 1), ('body', 1), ('sessionname', 1), ('break', 1)]:
-            if self.formatting[key]['FONTSIZE'] == 'Auto':
-                height = rh[row]  # Get the height at the formating option’s row index
-                font = self.formatting[key]['FONT'][0]  # Get the font of the formatting option
-
-                if f'{height}.{font}' not in font_sizes:  # Check if the font size has already been calculated for the font name and row height
-                    font_size = 1  # Declare a variable for the font size
-
-                    face = pdfmetrics.getFont(font).face  # Get the size of the font size
-                    face = (face.ascent - face.descent) / 1000  # Get the difference between the font’s ascent and descent
-
-                    while face * (font_size + 0.5) < height / 2:  # While if the height of the font at the current size, plus 0.5, is less than half the available height.
-                        font_size += 0.5  # Add 0.5 to the current font size
-                    font_sizes.update({f'{height}.{font}': font_size})  # Add the calculated font size to the dictionary, indexed by the available height and face name
-
-        ## Add the formatting options for each cell type
-        for key, ranges in [('body', [((1, 1), (-3, -1))]), ('first_row', [((0, 0), (-1, 0))]), ('first_column', v_header_indexes), ('sessionname', sessionname_idxs), ('break', break_idxs)]:  # For each of the style options and their calculated ranges
-            for pos in ranges:  # Iterate through each index of the current cell type
-                for k, v in self.formatting[key].items():  # Iterate through each style option and the corresponding value for the cell type
-                    ## Match the style option
-                    match k:
-                        case 'FONTSIZE':
-                            if v == 'Auto':  # If the font size is 'Auto', use the pre-calculated font size for the height
-                                if key == 'first_row':
-                                    font_size = font_sizes[str(rh[0]) + '.' + self.formatting[key]['FONT'][0]]
-                                else:
-                                    font_size = font_sizes[str(rh[1]) + '.' + self.formatting[key]['FONT'][0]]
-                            else:  # Otherwise, use the font size as is.
-                                font_size = float(v)
-                            self.tablestyle.append((k, *pos, font_size))  # Add the font size formatting to the table style array
-                        case 'ORIENT':
-                            if v.lower() == 'vertical':  # If the orientation is vertical
-                                updated_lines = []  # Declare an empty array to hold the updated text
-                                for y in data[pos[0][1]:pos[1][1] + (1 if pos[1][1] >= 0 else -1)]:  # Iterate through the rows in the current index range
-                                    line = y  # Copy the current row
-                                    vertical_slice = slice(pos[0][0], pos[1][0] + (1 if pos[1][0] >= 0 else -1))  # Pre-calculate a slice for the columns in the current index range
-                                    line[vertical_slice] = [x if x.strip('\n\t ') == '' else VerticalText(x, self.formatting[key]['BOTTOMPADDING'][0]) for x in line[vertical_slice]]  # Iterate through the columns in the current index range and convert the string to a VerticalText widget if it is not empty. Insert the result into the current line
-                                    updated_lines.append(line)  # Add the current line into the `updated_lines` array
-                                data[pos[0][1]:pos[1][1] + (1 if pos[1][1] >= 0 else -1)] = updated_lines  # Replace the lines in the current index range in the data array with the corresponding lines in the `updated_lines` array
-                        case 'BOTTOMPADDING':
-                            if self.formatting[key]['ORIENT'].lower() != 'vertical':  # If the orientation is not vertical, add the bottom padding to the style config (If the orientation is vertical, the bottom padding is added to the VerticalText class)
-                                self.tablestyle.append((k, *pos, *v))
-                        ## Calculate the colour object using the input hex data and add the result to the table style array
-                        case 'GRID':
-                            self.tablestyle.append((k, *pos, v[0], HexColor(v[1])))
-                        case 'BACKGROUND':
-                            self.tablestyle.append((k, *pos, HexColor(v)))
-                        case 'FOREGROUND':
-                            self.tablestyle.append((k, *pos, HexColor(v)))
-                        case _:
-                            self.tablestyle.append((k, *pos, *v))
-
-        corner_unit = {'cm': units.cm, 'mm': units.mm, 'pt': units.pica, 'px': 1, 'in': units.inch, '%': min(tablewidth, tableheight) / 200}[self.corner_units.get()]  # Get the multiplier for the units selected for the table size. '%' is calculated as a percentage of half of the shortest side length of the page (the maximum possible radius)
-        corners = [float(i.get()) * corner_unit for i in [self.nw_corner_radius, self.ne_corner_radius, self.sw_corner_radius, self.se_corner_radius]]  # Calculate the radius for each corner
-
-        ## Get the custom style options from the config window and add them to the end of the table formatting
-        for i in self.formatting_elems:
-            line = (i.style_option.get().upper(), (int(i.x1_entry.get()), int(i.y1_entry.get())), (int(i.x2_entry.get()), int(i.y2_entry.get())), *eval(f'[{i.value_entry.get()}]'))
-            self.tablestyle.append(line)
-
-        canvas = Canvas(output_filename, (doc_w, doc_h))  # Create a new PDF
-
-        table = Table(
-            data, style=self.tablestyle,
-            colWidths=cw, rowHeights=rh,
-            cornerRadii=corners
-        )  # Create a new table object with the data calculated above
-
-        table.wrapOn(canvas, 0, 0)  # Set the wrap for the canvas
-        table.drawOn(canvas, margin[0], doc_h - margin[1] - tableheight)  # Add the table to the canvas at the top left cornet, plus the margins
-        canvas.save()  # Save the output PDF
-
-        mb.showinfo('Success', f'Successfully converted {self.root.filename} to PDF.')  # Prompt the user that the conversion was successful
-
-        webbrowser.open('file://' + self.outfile_entry.get())  # Open the PDF
-
-        ## todo: add omit weekends, omit rooms, omit teachers to export PDF config.
-        ## todo: Add events to PDF conversion
-
-        self.destroy()  # Destroy the window
-
-    def validate_corner(self, elem: Entry) -> bool:
-        """
-        Evaluates the number or simple equation in a corner radius entry widget and validates the result.
-        If match corner radius is enabled, this function updates the value of all corner radius entries.
-
-        :param elem: The entry from which to get the string to validate
-        :return: Whether or not the value in the entry is valid.
-        """
-
-        result = self.validate_num(elem)  # Validate the text in the corner entry
-        val = elem.get()  # Get the updated text in the corner entry
-
-        if result and self.match_corner_radius.get():  # If the text in the entry is valid and match corner radius is enabled
-            ## Iterate through each corner radius entry and set the value to the new text in the modified corner entry
-            for i in [self.nw_corner_radius, self.ne_corner_radius, self.sw_corner_radius, self.se_corner_radius]:
-                i.set(val)
-
-        return result  # Return the validation result
-
-    def add_formatting(self) -> None:
-        """ Add a table formatting option """
-
-        ## Create a formatting option widget and add it at the bottom of the scrollable frame
-        elem = FormattingOption(self, self.scrollable_frame.frame, background='#3B434C')
-        elem.pack(side='top', fill='x', padx=1, pady=(1, 0))
-
-        self.formatting_elems.append(elem)  # Add the formatting option widget to the list of formatting options
-        self.scrollable_frame.canvas.yview_moveto(10)  # Scroll the scrollable frame canvas by a large amount so the new formatting option is visible
-
-    def remove_formatting(self) -> None:
-        """ Removes a table formatting option """
-
-        ## Todo: Save PDF formatting config
-
-        if self.selected_format_option is not None:  # If a formatting option is selected
-            idx = self.formatting_elems.index(self.selected_format_option)  # Get the index of the formatting option in the list
-            self.formatting_elems.pop(idx).destroy()  # Remove the option from the list and destroy the widget
-            if len(self.formatting_elems):  # If there are other elements in the formatting option list
-                ## Select the previous formatting option
-                self.selected_format_option = self.formatting_elems[max(0, idx - 1)]
-                self.selected_format_option.select()
-
-
 ## todo: loading bar: ⡿⢿⣻⣽⣾⣷⣯⣟
 
 
@@ -1050,6 +295,25 @@ class IndentText(tk.Text):
 
         super().__init__(*args, **kwargs)
 
+        self.cdg = None  # The colour delegator for highlighting dotpoints (see `enable_highlighting`)
+        self.percolator = None
+
+        self.after(1, self.after_idle, self.enable_highlighting)  # Enable highlighting once the window has been displayed, so idlelib is not imported at startup
+
+        self.bind('<KeyPress>', lambda v: self.keypress_event_manager(v))  # Bind all key-presses to a function
+
+    def enable_highlighting(self) -> None:
+        """
+        Create the colour delegator and percolator used to highlight dotpoints and numbering.
+        Any text already in the widget is highlighted when the colour delegator is added.
+        """
+
+        if self.cdg is not None or not self.winfo_exists():  # If highlighting is already enabled or the widget has been destroyed, return.
+            return
+
+        import idlelib.colorizer as ic
+        import idlelib.percolator as ip
+
         self.cdg = ic.ColorDelegator()  # Create a colour delegator for highlighting dotpoints.
         self.cdg.tagdefs = dict()  # Remove the colour delegator’s default tags
 
@@ -1066,8 +330,6 @@ class IndentText(tk.Text):
         self.percolator = ip.Percolator(self)
         self.percolator.insertfilter(self.cdg)
 
-        self.bind('<KeyPress>', lambda v: self.keypress_event_manager(v))  # Bind all key-presses to a function
-
     def custom_update_callback(self) -> None:
         """
         Called every time a keypress is detected after any edits have been performed.
@@ -1257,29 +519,26 @@ class IndentText(tk.Text):
 
 class WeekFrame(tk.Frame):
     """
-    A frame that displays a week number and the events and event types on said week
+    A frame that displays a week number and the number of events of each type on said week.
+    Widgets are reused for different weeks as the week strip is scrolled (see `set_item`).
 
     :param parent: (TimeTable) The root timetable widget
-    :param week: The week number for the widget
+    :param week: The week number for the widget. Leave blank to create the widget without displaying a week.
     """
 
-    def __init__(self, parent, week: int, *args, **kwargs) -> None:
+    def __init__(self, parent, week: Optional[int], *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.week = week
+        self.week: Optional[int] = None
         self.parent: TimeTable = parent
 
-        self.indicator_elems: list[Optional[tk.Label]] = [None] * len(self.parent.event_types)  # Define an array to hold the session event indicators for the week
+        self.indicator_elems: list[Optional[tk.Label]] = []  # Define an array to hold the session event indicators for the week, indexed by the event type
+        self.displayed_counts: list[int] = []  # The count displayed by each event type indicator
 
-        self.event_data = {(v.day, v.session): v.type() for v in filter(lambda v: v.week == week, parent.events)}  # Create a dictionary of all events in the week, indexed by the day and session number
-
-        types = list(self.event_data.values())  # Create a list of all the event types that occur in the week
-        event_type_counts = [(n, i, types.count(i)) for n, i in enumerate(self.parent.event_types)]  # Create an array containing the index, name, and count for the week, of all possible event types
-
-        self.event_num_texts = [tk.StringVar(self, str(i[2])) for i in event_type_counts]  # Create a string variable to display the count of each event type
-
-        ## Create an event class to bind all the widget’s children to.
-        self.bind_class(f'click:wk{self.week}', '<Button-1>', lambda v: self.set_week())
-        self.bindtags((f'click:wk{self.week}', *self.bindtags()))
+        ## Create an event class to bind all the widget’s children to. The class name is unique to the widget, as the widget’s week changes when it is reused.
+        self.click_tag = f'click:{self}'
+        self.bind_class(self.click_tag, '<Button-1>', lambda v: self.set_week())
+        self.bind_class(self.click_tag, '<MouseWheel>', lambda v: self.parent.scroll_weeks(v))
+        self.bindtags((self.click_tag, *self.bindtags()))
 
         ## Adjust the grid geometry
         self.columnconfigure(0, weight=1)
@@ -1288,212 +547,148 @@ class WeekFrame(tk.Frame):
         ## ======================================== User Interface ========================================
 
         ## ------------------------------------------ Week number -----------------------------------------
-        self.numlabel = tk.Label(self, text=f'Week {week + 1}{" (Current)" if week == self.parent.week else ""}', background='#303841', foreground='#D8DEE9', height=15, image=self.parent.master.pixel, compound='center', font=('Arial', 11, 'bold' if week == self.parent.week else ''), anchor='nw')
-        self.numlabel.bindtags((f'click:wk{self.week}', *self.numlabel.bindtags()))
+        self.numlabel = tk.Label(self, background='#303841', foreground='#D8DEE9', height=15, image=self.parent.master.pixel, compound='center', font=('Arial', 11), anchor='nw')
+        self.numlabel.bindtags((self.click_tag, *self.numlabel.bindtags()))
         self.numlabel.grid(row=0, column=0, sticky='nswe')
 
         ## ----------------------------------- Event type display frame -----------------------------------
         self.indicator_frame = tk.Frame(self, background='#303841', height=8)
-        self.indicator_frame.bindtags((f'click:wk{self.week}', *self.indicator_frame.bindtags()))
+        self.indicator_frame.bindtags((self.click_tag, *self.indicator_frame.bindtags()))
         self.indicator_frame.grid(row=1, column=0, sticky='nswe')
 
         ## Add a blank image for formatting purposes
         self.formatting_image = tk.Label(self.indicator_frame, image=parent.master.pixel, compound='center', width=8, height=8, background='#303841')
-        self.formatting_image.bindtags((f'click:wk{self.week}', *self.formatting_image.bindtags()))
+        self.formatting_image.bindtags((self.click_tag, *self.formatting_image.bindtags()))
         self.formatting_image.grid(row=0, column=len(self.parent.event_types), padx=(0, 1), pady=(1, 0), sticky='NW')
 
-        ## --------------------------------------- Event indicators ---------------------------------------
-        ## Iterate through the calculated event counts for the week that are above one, and add a corresponding indicator to the indicator frame
-        for idx, e_type, count in filter(lambda v: v[2] > 0, event_type_counts):
-            indicator = tk.Label(self.indicator_frame, textvariable=self.event_num_texts[idx], image=parent.master.icons[e_type], compound='left', width=15, height=8, background='#303841', foreground='#D8DEE9', font=('Calibri', 12))
-            indicator.grid(row=0, column=idx, padx=(0, 1), pady=(1, 0), sticky='W')
-            indicator.bindtags((f'click:wk{self.week}', *indicator.bindtags()))
+        if week is not None:
+            self.set_item(week)  # Display the week
 
-            self.indicator_elems[idx] = indicator
-
-    def set_week(self) -> None:
-        """
-        Update the parent element’s current week number to this widget’s week number.
-        Called whenever the widget is clicked.
-        """
-
-        self.parent.week_slider.set(self.week)
-
-    def edit_event_type(self, event) -> None:
+    def set_item(self, week: int) -> None:
         """
-        Update the count for the previous and new event types whenever an event’s type is changed.
+        Update the widget to display a week.
 
-        :param event: The updated event to process
+        :param week: The week number to display
         """
 
-        if self.event_data[(event.day, event.session)] != event.type():  # If the stored event type and actual event type do not match
-            self.remove_event(event, event_type=self.event_data[(event.day, event.session)])  # Decrement the counter for the stored event type for the event’s session and day number
-            self.add_event(event)  # Add the event to the widget’s stored events and increment the appropriate event type counter
-
-    def add_event(self, event) -> None:
-        """
-        Increment the counter for the event type of the input event and add the event to the event dictionary
+        self.week = week
 
-        :param event: The event object to add
-        """
+        ## Update the week number, marking the actual week and highlighting the displayed week
+        current = week == self.parent.model.get_week(datetime.datetime.now().timestamp())
+        self.numlabel.configure(text=f'Week {week + 1}{" (Current)" if current else ""}', font=('Arial', 11, 'bold' if week == self.parent.week else ''))
 
-        idx = self.parent.event_types.index(event.event_type.get())  # Get the index of the event’s type
+        self.update_counts()
 
-        text = self.event_num_texts[idx]  # Get the event type counter to update
-        val = int(text.get())  # Get the current stored event count
+    def update_counts(self) -> None:
+        """ Update the event type indicators to match the number of events of each type in the week. Only the indicators whose count changed are reconfigured. """
 
-        if val == 0:  # If no events of the input type are currently stored
-            ## Add a new counter to the indicator display
-            indicator = tk.Label(self.indicator_frame, textvariable=text, image=self.parent.master.icons[event.type()], compound='left', width=15, height=8, background='#303841', foreground='#D8DEE9', font=('Calibri', 12))
-            indicator.grid(row=0, column=idx, padx=(0, 1), pady=(1, 0), sticky='W')
-            self.indicator_elems[idx] = indicator
-            indicator.bindtags((f'click:wk{self.week}', *indicator.bindtags()))
+        counts = self.parent.events.type_counts(self.week)  # Get the row of the event store’s count matrix for the week
 
-        text.set(str(val + 1))  # Increment the counter
-        self.event_data.update({(event.day, event.session): event.type()})  # Add the event type at the session and day number to the event dictionary
+        ## Extend the indicator arrays if event types have been added since the widget was created
+        for _ in range(len(self.displayed_counts), len(counts)):
+            self.indicator_elems.append(None)
+            self.displayed_counts.append(0)
 
-    def remove_event(self, event, event_type: Optional[str] = None) -> None:
-        """
-        Decrement the counter for the input event’s type and remove the stored event type from the event type dictionary.
+        for idx, count in enumerate(counts):
+            if count == self.displayed_counts[idx]:  # Skip the indicators whose displayed count has not changed
+                continue
+            self.displayed_counts[idx] = count
 
-        :param event: (Event) The event object to add
-        :param event_type: The key of the event counter to decrement
-        """
+            indicator = self.indicator_elems[idx]
 
-        ## Get the event type from the input event if necessary
-        if event_type is None:
-            event_type = event.type()
+            if count == 0:  # Hide the indicators for event types that do not occur in the week
+                indicator.grid_remove()
+                continue
 
-        idx = self.parent.event_types.index(event_type)  # Get the index of the input event type
+            if indicator is None:  # Add a new counter to the indicator display
+                indicator = tk.Label(self.indicator_frame, image=self.parent.event_types.icons[self.parent.events.types[idx]], compound='left', width=15, height=8, background='#303841', foreground='#D8DEE9', font=('Calibri', 12))
+                indicator.bindtags((self.click_tag, *indicator.bindtags()))
+                self.indicator_elems[idx] = indicator
 
-        text = self.event_num_texts[idx]  # Get the event type counter to update
-        val = int(text.get())  # Get the current stored event count
+            indicator.configure(text=str(count))
+            indicator.grid(row=0, column=idx, padx=(0, 1), pady=(1, 0), sticky='W')
 
-        if val == 1:  # If only one event of the input type is stored
-            ## Remove the indicator corresponding to the event type
-            self.indicator_elems[idx].destroy()
-            self.indicator_elems[idx] = None
+    def set_week(self) -> None:
+        """
+        Update the parent element’s current week number to this widget’s week number.
+        Called whenever the widget is clicked.
+        """
 
-        text.set(str(val - 1))  # Decrement the counter for the type
-        self.event_data.pop((event.day, event.session))  # Remove the event from the event data dictionary
+        self.parent.week_slider.set(self.week)
 
 
-class Event:
+class Event(EventData):
     """
     Stores timetable event data for a single day.
+    Events are compared by their timeslot (see `Timeslot`). Events should be created with `TimetableModel.create_event`, which assigns the id of their type.
+
+    The title and type are stored as strings, and the id of the type in the timetable’s event type registry is cached in `type_id`. Tkinter variables for them are only created when the event is displayed (see `title_variable` and `type_variable`), so loading a timetable does not create any Tcl variables for events that are not visible.
 
+    :param master: (TimeTable) The root timetable widget.
     :param week: The week number of the event.
     :param day: The day number of the event (Monday = 0, Sunday = 6).
     :param session: The session number of the event.
     :param text: The event text to store.
     :param tags: The tags for the event (currently does nothing).
     :param etype: The type string of the event.
+    :param title: The title of the event.
     """
 
-    def __init__(self, master, week: int, day: int, session: int, text: str, tags: Optional[list], etype: str, title: str) -> None:
-        ## Get the week, day, and session number for the event
-        self.week = week
-        self.day = day
-        self.session: int = session
-
-        master: TimeTable = master
-
-        ## Get the formatting for the event
-        self.text = text
-
-        self.title = tk.StringVar(master.display_frame, value=title)
-        self.title.trace('w', lambda a, b, c: master.check_saved(master.get_json()))
+    __slots__ = ('master', 'display_widget', '_title_variable', '_type_variable')
 
-        self.tags = tags
-        self.event_type = tk.StringVar(master.display_frame, value=etype)
-        self.type = self.event_type.get
+    def __init__(self, master, week: int, day: int, session: int, text: str, tags: Optional[list], etype: str, title: str) -> None:
+        super().__init__(week, day, session, text, tags, etype, title)
 
+        self.master: TimeTable = master
         self.display_widget: Optional[UpcomingEvent] = None  # Stores an Upcoming Event widget associated with the event
 
-    @dispatch(tuple)
-    def __eq__(self, other) -> bool:
-        """
-        Check if the event’s timeslot matches the input timeslot
+        self._title_variable: Optional[tk.StringVar] = None
+        self._type_variable: Optional[tk.StringVar] = None
 
-        :param other: The timeslot to compare to in (week, day, session) format
+    def title_variable(self) -> tk.StringVar:
+        """
+        Get a string variable holding the event’s title, creating it if necessary.
+        Edits to the variable are copied to the event’s title and update the save state of the timetable.
         """
 
-        return other == (self.week, self.day, self.session)
+        if self._title_variable is None:
+            self._title_variable = tk.StringVar(self.master.display_frame, value=self.title)
+            self._title_variable.trace('w', lambda a, b, c: self.edit_title())
 
-    @dispatch(object)
-    def __eq__(self, other) -> bool:
-        """
-        Check if the event’s timeslot matches the input timeslot
+        return self._title_variable
 
-        :param other: The timeslot to compare to in (week, day, session) format
+    def type_variable(self) -> tk.StringVar:
+        """
+        Get a string variable holding the event’s type, creating it if necessary.
+        The variable is copied to the event’s type when a type is selected (see `TimeTable.edit_event_type`).
         """
 
-        return tuple(other) == (self.week, self.day, self.session)
+        if self._type_variable is None:
+            self._type_variable = tk.StringVar(self.master.display_frame, value=self.etype)
 
-    def __iter__(self) -> Generator[int, int, int]:
-        """ Yield the event timeslot as an iterable """
-        yield self.week
-        yield self.day
-        yield self.session
+        return self._type_variable
 
-    def get_data(self) -> dict:
+    def set_type(self, etype: str) -> None:
         """
-        Get the event’s data in dictionary form to be written to a timetable JSON file
+        Set the event’s type and update the cached type id
+
+        :param etype: The name of the new type
         """
 
-        data = dict(
-            title=enclose(multireplace(self.title.get(), {'"': '\\"', '\n': '\\n', '\t': '\\t'}), '"'),
-            week=self.week,
-            day=self.day,
-            session=self.session,
-            text=enclose(multireplace(self.text, {'"': '\\"', '\n': '\\n', '\t': '\\t'}), '"'),
-            tags=list(map(lambda v: v.replace('"', '\\"'), self.tags)) if self.tags is not None else 'null',
-            etype=enclose(self.type(), '"')
-        )
-        return data
-
-    def __gt__(self, other) -> bool:
-        """ Check if the event occurs after the input event """
-        return self.day > other.day or (self.day == other.day and self.session > other.session)
-
-    def __lt__(self, other) -> bool:
-        """ Check if the event occurs before the input event """
-        return self.day < other.day or (self.day == other.day and self.session < other.session)
-
-    @dispatch(tuple)
-    def __ge__(self, other: tuple) -> bool:
-        """ Check if the event occurs at the same time or later than the input event. 'Other' tuple can be either the day and session, or the week, day, and session """
-        if len(other) == 2:  # Check the length of the 'other' tuple
-            ## Compare day number and session number
-            return self.day > other[0] or (self.day == other[0] and self.session >= other[1])
-        else:
-            ## Compare week number, day number, and session number
-            return self.week > other[0] or (self.week == other[0] and self.day > other[1]) or (self.week == other[0] and self.day == other[1] and self.session >= other[2])
-
-    @dispatch(object)
-    def __ge__(self, other) -> bool:
-        """ Check if the event occurs at the same time or later than the input event """
-        return self.day > other.day or (self.day == other.day and self.session >= other.session)
-
-    @dispatch(tuple)
-    def __le__(self, other: tuple) -> bool:
-        """ Check if the event occurs at the same time or earlier than the input event. 'Other' tuple can be either the day and session, or the week, day, and session """
-        if len(other) == 2:  # Check the length of the 'other' tuple
-            ## Compare day number and session number
-            return self.day < other[0] or (self.day == other[0] and self.session <= other[1])
-        else:
-            ## Compare week number, day number, and session number
-            return self.week < other[0] or (self.week == other[0] and self.day < other[1]) or (self.week == other[0] and self.day == other[1] and self.session <= other[2])
+        self.etype = etype
+        self.type_id = self.master.event_types.id(etype)
+
+    def edit_title(self) -> None:
+        """ Copy the value of the title variable to the event’s title. Called whenever the title variable is edited. """
 
-    @dispatch(object)
-    def __le__(self, other) -> bool:
-        """ Check if the event occurs at the same time or earlier than the input event """
-        return self.day < other.day or (self.day == other.day and self.session <= other.session)
+        self.title = self._title_variable.get()
+        self.master.mark_event_changed(self)
 
 
 class TimetableCell:
     """
     A base class representing a cell in a timetable.
+    Subclasses display the cell, either with a frame of widgets (see `WidgetCell`) or with items drawn on a shared canvas (see `CanvasCell`).
 
     :param root: (TimeTable) The root timetable widget.
     :param master: The parent element.
@@ -1514,64 +709,52 @@ class TimetableCell:
 
         self.state = 'normal'
         self.current_event: Optional[Event] = None
-        self.events_indicator: Optional[tk.Label] = None
-
-        ## Create a frame to hold the elements of the cell
-        self.frame = tk.Frame(master, background='#3B434C')
-        self.frame.columnconfigure(0, weight=1)
-        self.frame.rowconfigure(0, weight=1)
 
-        ## Bind mouseover to highlight the cell
-        self.frame.bind('<Enter>', lambda v: self.enter())
-        self.frame.bind('<Leave>', lambda v: self.leave())
-
-        ## Create an event class and bind clicking to toggle selection.
-        self.frame.bind_class(f'click:{id(self)}', '<Button-1>', lambda v: self.toggle_selected())
-
-    def add_event_indicator(self) -> None:
+    def set_event(self, event: Optional[Event]) -> None:
         """
-        Adds an event type indicator to the cell
-        """
-
-        self.events_indicator = tk.Label(self.frame, image=self.root.master.pixel, compound='center', width=8, height=8, background='#303841')
-        self.events_indicator.grid(row=0, column=0, padx=(0, 1), pady=(1, 0), sticky='NE')
-
-    def set_event(self, event) -> None:
-        """
-        Sets the event currently displayed by the cell and updates the event indicator accordingly
+        Sets the event currently displayed by the cell and updates the event indicator accordingly.
+        The event indicator is only reconfigured if the event type changes.
 
         :param event: The event to set
         """
 
+        old_type = None if self.current_event is None else self.current_event.type_id  # Get the type of the event currently displayed by the indicator
         self.current_event = event  # Set the current event variable to the input event
 
         ## Update the event indicator with the appropriate image
         if event is None:
-            self.events_indicator.configure(image=self.root.master.pixel)
-        else:
-            self.events_indicator.configure(image=self.root.master.icons[event.type()])
+            if old_type is not None:
+                self.set_indicator(None)
+        elif event.type_id != old_type:
+            self.set_indicator(event.type_id)
+
+    def set_indicator(self, type_id: Optional[int]) -> None:
+        """
+        Display the icon of an event type in the cell’s event indicator
+
+        :param type_id: The id of the event type to display. Leave blank to display no icon.
+        """
+        raise NotImplementedError
 
     def update_event(self) -> None:
         """
         Update the event currently stored and displayed by the cell
         """
 
-        events = list(filter(lambda v: v == (self.root.week, self.day, self.session), self.root.events))  # Get a list of events that occur on the same timeslot as the cell and on the current week.
-
-        if not events:  # If no events occur on the same timeslot as the cell, update the event indicator and current event
-            self.events_indicator.configure(image=self.root.master.pixel)
-            self.current_event = None
-
-        elif events:  # Otherwise, set the current event to the first event in the list and set the event indicator’s image to the event type
-            self.current_event = events[0]
-            self.events_indicator.configure(image=self.root.master.icons[self.current_event.type()])
+        event = self.root.events.get(self.root.week, self.day, self.session)  # Get the event that occurs on the same timeslot as the cell and on the current week.
+        self.set_event(event)
 
         if self.state == 'active':  # If the cell is active, update the root’s active event
             self.root.update_active_event()
 
     def grid(self) -> None:
         """ Add the cell to the position on the grid corresponding to the cell’s timeslot """
-        self.frame.grid(column=self.day + 1, row=self.session + sum(map(lambda v: self.session > v, self.root.session_break_idxs[1])) + 1, sticky='nswe', padx=(int(self.day == 0), 1), pady=(int(self.session == 0), 1), rows=len(self.root.sessions) if self.weekend else 1)
+        raise NotImplementedError
+
+    def destroy(self) -> None:
+        """ Remove the cell from the timetable and from the cells of its mapped class """
+        if self.tt_class is not None:
+            self.tt_class.cells.discard(self)
 
     def enter(self) -> None:
         """ Highlight the cell colours and update the state """
@@ -1607,15 +790,76 @@ class TimetableCell:
         self.root.update_active_event()  # Update the root’s active cell data
 
     def update_elems(self) -> None:
-        """ Updates the colours of the cell and its children to match the current state """
-        formatting = self.root.cell_state_config[self.state]  # Get the formatting config for the current state
+        """ Updates the colours of the cell to match the current state """
+        raise NotImplementedError
 
-        self.frame.configure(background=formatting[1])  # Set the cell’s border colour
-        for elem in self.frame.winfo_children():  # Set the cell’s children’s background colour
-            elem.configure(**formatting[0])
 
+class WidgetCell(TimetableCell):
+    """
+    A base class for cells displayed as a frame of widgets on the grid of the table.
 
-class WeekendCell(TimetableCell):
+    :param root: (TimeTable) The root timetable widget.
+    :param master: The parent element.
+    :param day: The day index of the cell.
+    :param session: The session index of the cell.
+    :param tt_class: The cell’s class data object.
+    :param weekend: Whether or not the cell is on a weekend day.
+    """
+
+    def __init__(self, root, master, day: int, session: int, tt_class, weekend: bool = False) -> None:
+        super().__init__(root, master, day, session, tt_class, weekend)
+
+        self.events_indicator: Optional[tk.Label] = None
+        self.children: tuple[str, ...] = ()  # The path names of the cell’s children, whose colours change with the cell’s state
+
+        ## Create a frame to hold the elements of the cell
+        self.frame = tk.Frame(master, background='#3B434C')
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        ## Bind mouseover to highlight the cell
+        self.frame.bind('<Enter>', lambda v: self.enter())
+        self.frame.bind('<Leave>', lambda v: self.leave())
+
+        ## Create an event class and bind clicking to toggle selection.
+        self.frame.bind_class(f'click:{id(self)}', '<Button-1>', lambda v: self.toggle_selected())
+
+    def add_event_indicator(self) -> None:
+        """
+        Adds an event type indicator to the cell
+        """
+
+        self.events_indicator = tk.Label(self.frame, image=self.root.master.pixel, compound='center', width=8, height=8, background='#303841')
+        self.events_indicator.grid(row=0, column=0, padx=(0, 1), pady=(1, 0), sticky='NE')
+
+    def cache_children(self) -> None:
+        """ Store the path names of the cell’s children, so they do not have to be queried whenever the cell’s state changes. Called once the children have been created. """
+        self.children = tuple(str(elem) for elem in self.frame.winfo_children())
+
+    def set_indicator(self, type_id: Optional[int]) -> None:
+        """
+        Display the icon of an event type in the cell’s event indicator
+
+        :param type_id: The id of the event type to display. Leave blank to display no icon.
+        """
+        self.events_indicator.configure(image=self.root.master.pixel if type_id is None else self.root.event_types.icons[type_id])
+
+    def grid(self) -> None:
+        """ Add the cell to the position on the grid corresponding to the cell’s timeslot """
+        self.frame.grid(column=self.day + 1, row=self.root.model.get_timeslot_index(self.session) + 1, sticky='nswe', padx=(int(self.day == 0), 1), pady=(int(self.session == 0), 1), rows=len(self.root.sessions) if self.weekend else 1)
+
+    def destroy(self) -> None:
+        """ Remove the cell from the timetable """
+        super().destroy()
+        self.frame.unbind_class(f'click:{id(self)}', '<Button-1>')  # Class bindings are not removed when the widgets using them are destroyed
+        self.frame.destroy()
+
+    def update_elems(self) -> None:
+        """ Updates the colours of the cell and its children to match the current state, using a single Tcl call (see `CELL_STATE_PROC`) """
+        self.frame.tk.call('timetable_cell_state', self.frame, *self.root.cell_state_styles[self.state], self.children)
+
+
+class WeekendCell(WidgetCell):
     """
     A class representing the 'body' cells displayed under the saturday and sunday headings
 
@@ -1627,90 +871,404 @@ class WeekendCell(TimetableCell):
     def __init__(self, root, master, weekend_day: int) -> None:
         self.name = ['Saturday', 'Sunday'][weekend_day]  # Get the text to display
 
-        super().__init__(root, master, weekend_day + 5, 0, None, True)
+        super().__init__(root, master, weekend_day + 5, 0, None, True)
+
+        ## Create a label to display the contents of the cell
+        self.name_display = tk.Label(self.frame, text='Homework', relief='flat', wraplength=75, font=('Calibri', 12, 'bold'), background='#303841', foreground='#D8DEE9', anchor='n')
+        self.name_display.grid(row=0, column=0, padx=1, pady=1, sticky='NSWE')
+        self.name_display.bindtags((f'click:{id(self)}', *self.name_display.bindtags()))
+
+        self.add_event_indicator()  # Add an event indicator
+        self.cache_children()
+
+
+class SessionCell(WidgetCell):
+    """
+    A class representing a single timeslot for a weekday in a timetable.
+
+    :param root: (TimeTable) The root timetable widget.
+    :param master: The parent element.
+    :param day: The day index of the cell.
+    :param session: The session index of the cell.
+    :param tt_class: The cell’s class data object.
+    """
+
+    def __init__(self, root, master, day: int, session: int, tt_class: Optional[TimetableClass]) -> None:
+        super().__init__(root, master, day, session, None)
+
+        ## Create a label to display the name of the class
+        self.name_display = tk.Label(self.frame, relief='flat', wraplength=100, font=('Calibri', 12, 'bold'), background='#303841', foreground='#D8DEE9')
+        self.name_display.grid(row=0, column=0, padx=1, pady=1, sticky='NSWE')
+        self.name_display.bindtags((f'click:{id(self)}', *self.name_display.bindtags()))
+
+        ## Create a label to display the name of the classroom
+        self.room_display = tk.Label(self.frame, relief='flat', font=('Calibri', 12), background='#303841', foreground='#D8DEE9')
+        self.room_display.grid(row=1, column=0, padx=1, pady=(0, 1), sticky='NSWE')
+        self.room_display.bindtags((f'click:{id(self)}', *self.room_display.bindtags()))
+
+        ## Create a label to display the name of the teacher
+        self.teacher_display = tk.Label(self.frame, relief='flat', font=('Calibri', 12), background='#303841', foreground='#D8DEE9')
+        self.teacher_display.grid(row=2, column=0, padx=1, pady=(0, 1), sticky='NSWE')
+        self.teacher_display.bindtags((f'click:{id(self)}', *self.teacher_display.bindtags()))
+
+        self.update_mapped_class(tt_class)  # Display the class data of the class in the timeslot
+        self.add_event_indicator()  # Add an event indicator
+        self.cache_children()
+
+    def update_mapped_class(self, tt_class) -> None:
+        """ Update the display labels to either display the current event or display empty and update the class data appropriately. """
+
+        ## Update the cells stored by the previous and new classes
+        if self.tt_class is not None:
+            self.tt_class.cells.discard(self)
+        if tt_class is not None:
+            tt_class.cells.add(self)
+
+        self.tt_class = tt_class
+
+        if tt_class is None:  # If no class is assigned to the cell
+            ## Reset the class data variables
+            self.name = None
+            self.room = None
+            self.teacher = None
+
+            ## Configure the display labels to be blank
+            self.name_display.configure(textvariable=self.root.null_text_variable)
+            self.teacher_display.configure(textvariable=self.root.null_text_variable)
+            self.room_display.configure(textvariable=self.root.null_text_variable)
+        else:
+            ## Set the class data variables to the values of the class
+            self.name = self.tt_class.name_disp
+            self.room = self.tt_class.room_disp
+            self.teacher = self.tt_class.teacher_disp
+
+            ## Update the class data variables to display the class data
+            self.name_display.configure(textvariable=self.name)
+            self.teacher_display.configure(textvariable=self.teacher)
+            self.room_display.configure(textvariable=self.room)
+
+
+class CanvasGrid:
+    """
+    Draws the cells of a timetable on a single canvas, as an alternative to creating a frame of widgets for each cell (see `CanvasCell`).
+    The canvas is placed on the grid of the table underneath the session headers, and the cells are laid out to match the rows and columns of the headers.
+    Hovering and clicking are handled by hit-testing the items under the pointer, so only the items of the cells that change state are reconfigured.
+
+    :param root: (TimeTable) The root timetable widget.
+    :param master: The frame containing the table.
+    """
+
+    def __init__(self, root, master) -> None:
+        self.root: TimeTable = root
+        self.master = master
+
+        self.items: dict[int, CanvasCell] = dict()  # The cell that each canvas item belongs to, used for hit-testing
+        self.cells: set[CanvasCell] = set()
+        self.hovered: Optional[CanvasCell] = None  # The cell under the pointer
+        self.layout_after: Optional[str] = None  # The scheduled call to lay out the cells
+
+        ## The fonts of the cell text, which are also used to measure the height of each line
+        self.fonts = (tkfont.Font(master, family='Calibri', size=12, weight='bold'), tkfont.Font(master, family='Calibri', size=12))
+
+        self.canvas = tk.Canvas(master, background='#222', highlightthickness=0, borderwidth=0)
+        self.canvas.bind('<Motion>', self.motion)
+        self.canvas.bind('<Leave>', lambda v: self.hover(None))
+        self.canvas.bind('<Button-1>', self.click)
+        self.canvas.bind('<Configure>', lambda v: self.schedule_layout())  # Move the cells when the table is resized
+
+    def grid(self, num_sessions: int) -> None:
+        """
+        Place the canvas on the grid of the table, spanning the columns of the days and the rows of the sessions.
+        The requested size of the canvas is set so that the rows and columns are at least as large as those of a table of widget cells.
+
+        :param num_sessions: The number of rows in the table, including the breaks between sessions
+        """
+
+        if num_sessions == 0:
+            self.canvas.grid_remove()
+            return
+
+        line_heights = [font.metrics('linespace') + 4 for font in (self.fonts[0], self.fonts[1], self.fonts[1])]  # The height of the name, room, and teacher rows of a cell
+        self.canvas.configure(width=7 * 106, height=num_sessions * (sum(line_heights) + 4))
+        self.canvas.grid(row=1, column=1, rowspan=num_sessions, columnspan=7, sticky='NSWE')
+
+    def add(self, cell, items: Iterable[int]) -> None:
+        """
+        Register the items of a cell for hit-testing and schedule the cell to be laid out.
+
+        :param cell: (CanvasCell) The cell the items belong to
+        :param items: The ids of the canvas items
+        """
+
+        self.cells.add(cell)
+        self.items.update(dict.fromkeys(items, cell))
+        self.schedule_layout()
+
+    def remove(self, cell, items: Iterable[int]) -> None:
+        """
+        Remove the items of a cell from the canvas.
+
+        :param cell: (CanvasCell) The cell the items belong to
+        :param items: The ids of the canvas items
+        """
+
+        if self.hovered is cell:
+            self.hovered = None
+
+        self.cells.discard(cell)
+        for item in items:
+            self.items.pop(item, None)
+            self.canvas.delete(item)
+
+    def schedule_layout(self) -> None:
+        """ Lay out the cells when the program is next idle, so that several changes to the table are laid out at once """
+        if self.layout_after is None:
+            self.layout_after = self.canvas.after_idle(self.layout)
+
+    def layout(self) -> None:
+        """ Move the items of each cell whose position on the grid of the table has changed """
+
+        self.master.update_idletasks()  # Apply any pending changes to the grid, so that the bounding boxes of its rows and columns are up to date
+        self.layout_after = None
+
+        x0, y0 = self.canvas.winfo_x(), self.canvas.winfo_y()  # The position of the canvas on the grid
+        for cell in self.cells:
+            ## Get the area of the cell’s timeslot on the grid, excluding the space between the cells
+            if cell.weekend:
+                x, y, width, height = self.master.grid_bbox(cell.day + 1, 1, cell.day + 1, len(self.root.sessions))
+            else:
+                x, y, width, height = self.master.grid_bbox(cell.day + 1, self.root.model.get_timeslot_index(cell.session) + 1)
+            rect = (x - x0 + int(cell.day == 0), y - y0 + int(cell.session == 0), x - x0 + width - 1, y - y0 + height - 1)
+
+            if rect != cell.rect:
+                cell.place(rect)
+
+    def cell_at(self, x: int, y: int):
+        """
+        Get the cell at a point on the canvas.
+
+        :param x: The x coordinate of the point
+        :param y: The y coordinate of the point
+        :return: (Optional[CanvasCell]) The cell, or None if there is no cell at the point
+        """
+
+        for item in reversed(self.canvas.find_overlapping(x, y, x, y)):  # Check the topmost items first
+            if item in self.items:
+                return self.items[item]
+
+        return None
+
+    def hover(self, cell) -> None:
+        """
+        Highlight the cell under the pointer, and un-highlight the previous cell.
+
+        :param cell: (Optional[CanvasCell]) The cell under the pointer
+        """
+
+        if cell is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.leave()
+            self.hovered = cell
+            if cell is not None:
+                cell.enter()
+
+    def motion(self, event: tk.Event) -> None:
+        """ Update the highlighted cell when the pointer moves """
+        self.hover(self.cell_at(event.x, event.y))
+
+    def click(self, event: tk.Event) -> None:
+        """ Toggle the selection of the cell that was clicked """
+
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            cell.toggle_selected()
+
+
+class CanvasCell(TimetableCell):
+    """
+    A cell in a timetable drawn as a set of items on the canvas of a `CanvasGrid`.
+    Weekday cells display the name, room, and teacher of their class, and weekend cells display a single line of text.
+
+    :param root: (TimeTable) The root timetable widget.
+    :param master: (CanvasGrid) The canvas grid to draw the cell on.
+    :param day: The day index of the cell.
+    :param session: The session index of the cell.
+    :param tt_class: The cell’s class data object.
+    :param weekend: Whether or not the cell is on a weekend day.
+    """
+
+    def __init__(self, root, master: CanvasGrid, day: int, session: int, tt_class: Optional[TimetableClass], weekend: bool = False) -> None:
+        super().__init__(root, master, day, session, None, weekend)
+
+        self.canvas = master.canvas
+        self.rect: Optional[tuple[int, int, int, int]] = None  # The area of the canvas covered by the cell
+        self.traces: list[tuple[tk.StringVar, str]] = []  # The traces that update the displayed text when the mapped class is edited
+
+        self.tag = f'cell{id(self)}'  # A tag shared by all the items of the cell
+        formatting = self.root.cell_state_config[self.state]
+
+        ## Draw the border of the cell, and a box for each line of text in the cell
+        self.border = self.canvas.create_rectangle(0, 0, 0, 0, width=0, fill=formatting[1], tags=(self.tag,))
+        fonts = master.fonts[:1] if weekend else (master.fonts[0], master.fonts[1], master.fonts[1])
+        self.boxes = [self.canvas.create_rectangle(0, 0, 0, 0, width=0, fill=formatting[0]['background'], tags=(self.tag, f'{self.tag}.box')) for _ in fonts]
+        self.texts = [self.canvas.create_text(0, 0, font=font, fill=formatting[0]['foreground'], justify='center', anchor='n' if weekend else 'center', tags=(self.tag, f'{self.tag}.text')) for font in fonts]
+        self.line_heights = [font.metrics('linespace') + 4 for font in fonts]
+
+        ## Add an event type indicator to the top right of the cell
+        self.events_indicator = self.canvas.create_image(0, 0, anchor='ne', state='hidden', tags=(self.tag,))
+
+        if weekend:
+            self.name = ['Saturday', 'Sunday'][day - 5]
+            self.canvas.itemconfigure(self.texts[0], text='Homework', width=75)
+        else:
+            self.canvas.itemconfigure(self.texts[0], width=100)
+            self.update_mapped_class(tt_class)  # Display the class data of the class in the timeslot
+
+        master.add(self, (self.border, *self.boxes, *self.texts, self.events_indicator))
+
+    def update_mapped_class(self, tt_class) -> None:
+        """ Update the displayed text to either display the class data or display empty and update the class data appropriately. """
+
+        ## Update the cells stored by the previous and new classes
+        if self.tt_class is not None:
+            self.tt_class.cells.discard(self)
+        if tt_class is not None:
+            tt_class.cells.add(self)
+
+        self.tt_class = tt_class
+
+        ## Stop displaying the data of the previous class
+        for variable, name in self.traces:
+            variable.trace_remove('write', name)
+        self.traces.clear()
+
+        if tt_class is None:  # If no class is assigned to the cell
+            ## Reset the class data variables
+            self.name = None
+            self.room = None
+            self.teacher = None
+
+            for text in self.texts:
+                self.canvas.itemconfigure(text, text=self.root.null_text_variable.get())
+        else:
+            ## Set the class data variables to the values of the class
+            self.name = self.tt_class.name_disp
+            self.room = self.tt_class.room_disp
+            self.teacher = self.tt_class.teacher_disp
+
+            ## Display the class data, and update the displayed text whenever it is edited
+            for text, variable in zip(self.texts, (self.name, self.room, self.teacher)):
+                self.canvas.itemconfigure(text, text=variable.get())
+                self.traces.append((variable, variable.trace_add('write', lambda *args, text=text, variable=variable: self.canvas.itemconfigure(text, text=variable.get()))))
+
+    def place(self, rect: tuple[int, int, int, int]) -> None:
+        """
+        Move the items of the cell to fill an area of the canvas.
+
+        :param rect: The area in the format (left, top, right, bottom)
+        """
+
+        self.rect = rect
+        left, top, right, bottom = rect
+
+        self.canvas.coords(self.border, left, top, right, bottom)
+
+        ## Stack the boxes from the bottom of the cell, so that the first box fills the remaining space (as the name label does in a widget cell)
+        box_bottom = bottom - 1
+        for i in reversed(range(len(self.boxes))):
+            box_top = top + 1 if i == 0 else box_bottom - self.line_heights[i]
+            self.canvas.coords(self.boxes[i], left + 1, box_top, right - 1, box_bottom)
+            self.canvas.coords(self.texts[i], (left + right) / 2, box_top + 2 if self.weekend else (box_top + box_bottom) / 2)
+            box_bottom = box_top - 1
+
+        self.canvas.coords(self.events_indicator, right - 2, top + 2)
+
+    def set_indicator(self, type_id: Optional[int]) -> None:
+        """
+        Display the icon of an event type in the cell’s event indicator
+
+        :param type_id: The id of the event type to display. Leave blank to display no icon.
+        """
+
+        if type_id is None:
+            self.canvas.itemconfigure(self.events_indicator, state='hidden')
+        else:
+            self.canvas.itemconfigure(self.events_indicator, image=self.root.event_types.icons[type_id], state='normal')
+
+    def grid(self) -> None:
+        """ Move the cell to the position on the grid corresponding to the cell’s timeslot """
+        self.master.schedule_layout()
+
+    def destroy(self) -> None:
+        """ Remove the cell from the timetable """
+
+        super().destroy()
+
+        for variable, name in self.traces:
+            variable.trace_remove('write', name)
+        self.traces.clear()
+
+        self.master.remove(self, (self.border, *self.boxes, *self.texts, self.events_indicator))
 
-        ## Create a label to display the contents of the cell
-        self.name_display = tk.Label(self.frame, text='Homework', relief='flat', wraplength=75, font=('Calibri', 12, 'bold'), background='#303841', foreground='#D8DEE9', anchor='n')
-        self.name_display.grid(row=0, column=0, padx=1, pady=1, sticky='NSWE')
-        self.name_display.bindtags((f'click:{id(self)}', *self.name_display.bindtags()))
+    def update_elems(self) -> None:
+        """ Updates the colours of the cell’s items to match the current state """
+        border, background, foreground = self.root.cell_state_styles[self.state]  # Get the precomputed colours for the current state
 
-        self.add_event_indicator()  # Add an event indicator
+        self.canvas.itemconfigure(self.border, fill=border)  # Set the cell’s border colour
+        self.canvas.itemconfigure(f'{self.tag}.box', fill=background)  # Set the background colour of the lines of text
+        self.canvas.itemconfigure(f'{self.tag}.text', fill=foreground)
 
 
-class SessionCell(TimetableCell):
+class UpcomingEventHeader(tk.Frame):
     """
-    A class representing a single timeslot for a weekday in a timetable.
+    A header displayed above the upcoming events on a single day.
 
-    :param root: (TimeTable) The root timetable widget.
-    :param master: The parent element.
-    :param day: The day index of the cell.
-    :param session: The session index of the cell.
-    :param tt_class: The cell’s class data object.
+    :param root: (TimeTable) The root timetable widget
     """
 
-    def __init__(self, root, master, day: int, session: int, tt_class: TimetableClass) -> None:
-        ## Get the text variables corresponding to the class in the timeslot
-        self.name = tt_class.name_disp
-        self.room = tt_class.room_disp
-        self.teacher = tt_class.teacher_disp
-
-        super().__init__(root, master, day, session, tt_class)
-
-        ## Create a label to display the name of the class
-        self.name_display = tk.Label(self.frame, textvariable=self.name, relief='flat', wraplength=100, font=('Calibri', 12, 'bold'), background='#303841', foreground='#D8DEE9')
-        self.name_display.grid(row=0, column=0, padx=1, pady=1, sticky='NSWE')
-        self.name_display.bindtags((f'click:{id(self)}', *self.name_display.bindtags()))
+    def __init__(self, root, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.root: TimeTable = root
 
-        ## Create a label to display the name of the classroom
-        self.room_display = tk.Label(self.frame, textvariable=self.room, relief='flat', font=('Calibri', 12), background='#303841', foreground='#D8DEE9')
-        self.room_display.grid(row=1, column=0, padx=1, pady=(0, 1), sticky='NSWE')
-        self.room_display.bindtags((f'click:{id(self)}', *self.room_display.bindtags()))
+        self.configure(background='#000')
 
-        ## Create a label to display the name of the teacher
-        self.teacher_display = tk.Label(self.frame, textvariable=self.teacher, relief='flat', font=('Calibri', 12), background='#303841', foreground='#D8DEE9')
-        self.teacher_display.grid(row=2, column=0, padx=1, pady=(0, 1), sticky='NSWE')
-        self.teacher_display.bindtags((f'click:{id(self)}', *self.teacher_display.bindtags()))
+        ## Create a frame to hold the header labels
+        frame = tk.Frame(self, background='#4F565E')
+        frame.pack(side='top', expand=True, fill='x', padx=(0, 0), pady=(20, 0))
 
-        self.add_event_indicator()  # Add an event indicator
+        ## Add the header labels
+        self.day_label = tk.Label(frame, background='#66587D', foreground='#D8DEE9', font=('Calibri', 13, 'bold'), image=self.root.master.pixel, compound='center', height=20)
+        self.day_label.pack(side='left', expand=True, fill='x', padx=(1, 1), pady=1)
+        tk.Label(frame, background='#c678dd', image=self.root.master.pixel, compound='center', width=46, height=20).pack(side='left', padx=(0, 1), pady=1)
 
-    def update_mapped_class(self, tt_class) -> None:
-        """ Update the display labels to either display the current event or display empty and update the class data appropriately. """
-        self.tt_class = tt_class
+    def set_item(self, item: tuple[int, int]) -> None:
+        """
+        Update the header to display a day.
 
-        if tt_class is None:  # If no class is assigned to the cell
-            ## Reset the class data variables
-            self.name = None
-            self.room = None
-            self.teacher = None
+        :param item: The week and day number to display
+        """
 
-            ## Configure the display labels to be blank
-            self.name_display.configure(textvariable=self.root.null_text_variable)
-            self.teacher_display.configure(textvariable=self.root.null_text_variable)
-            self.room_display.configure(textvariable=self.root.null_text_variable)
-        else:
-            ## Set the class data variables to the values of the class
-            self.name = self.tt_class.name_disp
-            self.room = self.tt_class.room_disp
-            self.teacher = self.tt_class.teacher_disp
+        week, day = item
+        self.day_label.configure(text=f'{["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][day]} Week {week}')
 
-            ## Update the class data variables to display the class data
-            self.name_display.configure(textvariable=self.name)
-            self.teacher_display.configure(textvariable=self.teacher)
-            self.room_display.configure(textvariable=self.room)
+    def release(self) -> None:
+        """ Called when the header is hidden """
+        pass
 
 
 class UpcomingEvent(tk.Frame):
     """
     A widget that displays information about upcoming events.
+    Widgets are reused for different events as the list of upcoming events is scrolled (see `set_item`).
 
     :param root: (TimeTable) The root timetable widget
     :param event: The widget’s associated event
     """
 
-    def __init__(self, root, event: Event, *args, **kwargs) -> None:
+    def __init__(self, root, event: Optional[Event], *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-        self.event: Event = event
+        self.event: Optional[Event] = None
         self.root: TimeTable = root
 
         ## Configure the widget’s grid
@@ -1720,7 +1278,7 @@ class UpcomingEvent(tk.Frame):
         ## Configure the widget’s formatting
         self.configure(background='#000', padx=2)
 
-        self.due_after: Optional[str] = None
+        self.due_deadline: Optional[float] = None  # The time at which the 'time until due' display is next refreshed (see `TimeTable.schedule_due_update`)
         self.event_date: Optional[datetime.datetime] = None
 
         ## Define default formatting for UI elements
@@ -1734,10 +1292,10 @@ class UpcomingEvent(tk.Frame):
         frame.grid(row=0, column=0, sticky='nswe', padx=0, pady=(20, 3))
         frame.columnconfigure(1, weight=1)
 
-        self.event_type_display = tk.Label(frame, image=self.root.master.icons[self.event.event_type.get() + '-Mask'], height=20, width=23, background=EVENT_TYPE_COLOUR_MAPPING[self.event.event_type.get()][0], highlightthickness=1, highlightbackground='#3B434C')
+        self.event_type_display = tk.Label(frame, height=20, width=23, highlightthickness=1, highlightbackground='#3B434C')
         self.event_type_display.grid(row=0, column=0, sticky='nswe', padx=0, pady=(0, 0))
 
-        self.event_title_display = tk.Label(frame, image=self.root.master.pixel, compound='center', anchor='w', height=20, text=' ', textvariable=self.event.title, background=EVENT_TYPE_COLOUR_MAPPING[self.event.event_type.get()][1], foreground='#D8DEE9', font=('Calibri', 13, 'bold'), highlightthickness=1, highlightbackground='#3B434C')
+        self.event_title_display = tk.Label(frame, image=self.root.master.pixel, compound='center', anchor='w', height=20, text=' ', foreground='#D8DEE9', font=('Calibri', 13, 'bold'), highlightthickness=1, highlightbackground='#3B434C')
         self.event_title_display.grid(row=0, column=1, sticky='nswe', padx=(1, 0), pady=(0, 0))
 
         ## ---------------------------------------- Event Time Info ---------------------------------------
@@ -1770,12 +1328,13 @@ class UpcomingEvent(tk.Frame):
         self.session_display.grid(row=1, column=2, sticky='nswe', padx=(2, 0), pady=(0, 0))
 
         ## --------------------------------------- Event Text Display -------------------------------------
-        self.event_text_display = tk.Label(self, image=self.root.master.pixel, anchor='nw', text=self.event.text, background='#303841', foreground='#D8DEE9', font=('Calibri', 11), compound='center', highlightthickness=1, highlightbackground='#3B434C')
+        self.event_text_display = tk.Label(self, image=self.root.master.pixel, anchor='nw', background='#303841', foreground='#D8DEE9', font=('Calibri', 11), compound='center', highlightthickness=1, highlightbackground='#3B434C')
         self.event_text_display.grid(row=3, column=0, sticky='nswe', padx=0, pady=(0, 3))
 
         MouseoverButton(self, text='View Event', command=lambda: self.root.view(self.event), image=self.root.master.pixel, height=18, width=100, highlightthickness=1, **buttonconfig).grid(row=4, column=0, sticky='nswe', padx=0, pady=(0, 0))  # .grid(row=1, column=1, sticky='nswe', padx=(0, 1), pady=(0, 0))
 
-        self.update_event_time()  # Update the values of the data displays
+        if event is not None:
+            self.set_item(event)  # Display the event
 
         ## Todo:
         ##    [x] Update Times
@@ -1788,54 +1347,89 @@ class UpcomingEvent(tk.Frame):
         ##    [ ] View method for timetable
         ##    [ ] Update time when edited
 
+    def set_item(self, event: Event) -> None:
+        """
+        Update the widget to display an event.
+
+        :param event: The event to display
+        """
+
+        self.release()  # Detach the widget from the previous event
+
+        self.event = event
+        event.display_widget = self
+
+        ## Update the displayed event data
+        self.event_title_display.configure(textvariable=event.title_variable())
+        self.event_text_display.configure(text=event.text)
+        self.update_event_type()
+        self.update_event_time()
+
+    def release(self) -> None:
+        """ Detach the widget from its event and stop updating the displayed time. Called when the widget is hidden. """
+
+        self.due_deadline = None  # Stop refreshing the 'time until due' display
+
+        if self.event is not None and self.event.display_widget is self:
+            self.event.display_widget = None
+        self.event = None
+
     def update_event_type(self) -> None:
         """ Update the formatting of the event type and title displays to match the event type """
-        etype = self.event.event_type.get()  # Get the event type name
-        colour_mapping = EVENT_TYPE_COLOUR_MAPPING[etype]  # Get the colour formatting associated with the event type
+        type_id = self.event.type_id  # Get the id of the event type
+        event_types = self.root.event_types
 
         ## Update the background colours of the event type and title displays
-        self.event_type_display.configure(image=self.root.master.icons[etype + '-Mask'], background=colour_mapping[0])
-        self.event_title_display.configure(background=colour_mapping[1])
+        self.event_type_display.configure(image=self.root.master.get_event_type_mask(event_types, type_id), background=event_types.colours[type_id])
+        self.event_title_display.configure(background=event_types.backgrounds[type_id])
+
+    def update_due_time(self, now: Optional[float] = None) -> None:
+        """
+        Update the displayed 'time until due' and schedule the next update
+
+        :param now: The current timestamp. Leave blank to use the current time.
+        """
 
-    def update_due_time(self) -> None:
-        """ Update the displayed 'time until due' and schedule the next update """
         ## Todo: format bg of cells with events
-        print('update_due')
+        if now is None:
+            now = time.time()
 
-        time_remaining = self.get_time_remaining()  # Get the days, hours, minutes, and seconds until the start of the event
+        time_remaining = self.get_time_remaining(now)  # Get the days, hours, minutes, and seconds until the start of the event
         tr_icon = 'passed-event' if time_remaining[0] else 'upcoming-event'  # Get the icon to use for the 'time until due' display based on if the event has passed or not.
-        time_remaining_str = self.time_remaining_str(time_remaining)  # Get the string to display
 
-        ## Update the configuration of the 'time until due' display
-        self.time_remaining_display.configure(text=f'Due {time_remaining_str}', image=self.root.master.icons[tr_icon], compound='left')  # Update the displayed text in the time remaining display
-
-        ## Get the number of milliseconds until the display needs to be updated again based on the “precision” of the displayed time
+        ## Get the number of seconds between updates of the display based on the “precision” of the displayed time
         if time_remaining[1] > 5:  # If the time difference is more than 5 days, set the update interval to one day
-            after_ms = 86400000
+            interval = 86400
         elif time_remaining[1]:  # If the time difference is one or more day(s), set the update interval to one hour
-            after_ms = 3600000
+            interval = 3600
         elif time_remaining[2]:  # If the time difference is one or more hour(s), set the update interval to one minute
-            after_ms = 60000
+            interval = 60
         else:  # Otherwise, set the update interval to one second.
-            after_ms = 1000
+            interval = 1
+
+        time_remaining_str = self.time_remaining_str(time_remaining)  # Get the string to display
+
+        ## Update the configuration of the 'time until due' display
+        self.time_remaining_display.configure(text=f'Due {time_remaining_str}', image=self.root.master.icons[tr_icon], compound='left')  # Update the displayed text in the time remaining display
 
-        self.due_after = self.after(after_ms, self.update_due_time)  # Schedule the next screen update
+        ## Schedule the next update for when the displayed value next changes.
+        ## This aligns the updates to the event’s start time, and events start on whole minutes, so the widgets updating at the same interval are refreshed on the same tick.
+        delay = (self.event_date.timestamp() - now) % interval or interval
+        self.root.schedule_due_update(self, now + delay)
 
     def update_event_time(self) -> None:
         """ Update the stored starting timestamp of the widget’s associated event and update the displayed time values. """
 
         self.event_date = self.get_date()  # Get the datetime date object representing the start of the associated event.
 
-        if self.due_after is not None:  # Cancel the scheduled UI element update if one exists
-            self.after_cancel(self.due_after)
-
         self.update_due_time()  # Update the displayed time until due
 
         ## Get the class name to display
         if self.event.day > 4:
             event_class_name = 'All Day'
         else:
-            event_class_name = self.root.classes[self.root.class_mapping[self.event.day][self.event.session]].name().replace('\n', ' ')
+            tt_class = self.root.tt_elements[self.event.day][self.event.session].tt_class  # Get the class mapped to the event’s timeslot
+            event_class_name = '' if tt_class is None else tt_class.name().replace('\n', ' ')
 
         ## Update the displayed time information.
         self.date_display.configure(text=f'{self.event_date.day}{"ˢᵗ" if str(self.event_date.day)[-1] == "1" else ["ᵗʰ", "ʳᵈ"][str(self.event_date.day)[-1] == "2"]} {self.event_date.strftime("%b")}'.format(hours=self.event_date.hour) + '\n' + self.event_date.strftime(f'%H:%M %p').strip('0'))
@@ -1844,20 +1438,16 @@ class UpcomingEvent(tk.Frame):
 
     def get_date(self) -> datetime.datetime:
         """ Get the datetime date object corresponding to the start timestamp of the widget’s associated event. """
-        event_timestamp = self.root.start_timestamp  # Get the timestamp of the starting week for the timetable
-
-        hour, minute = self.root.sessiontimes[self.root.get_timeslot_index(self.event.session)]  # Get the hours and minutes of the start time for the session
+        return self.root.model.get_start_time(*self.event.timeslot)
 
-        ## Calculate the number of seconds since the timetable start timestamp that the event occurs at.
-        event_timestamp += 604800 * self.event.week + 86400 * self.event.day + 3600 * hour + 60 * minute
-
-        event_date = datetime.datetime.fromtimestamp(event_timestamp)  # Convert the timestamp into a datetime date
-        return event_date
+    def get_time_remaining(self, now: float) -> list[int | bool]:
+        """
+        Get the time remaining until or times since the start of the event
 
-    def get_time_remaining(self) -> list[int | bool]:
-        """ Get the time remaining until or times since the start of the event """
+        :param now: The current timestamp
+        """
 
-        time_remaining = self.event_date.timestamp() - datetime.datetime.now().timestamp()  # Calculate the difference in time between the start of the event and the current time
+        time_remaining = self.event_date.timestamp() - now  # Calculate the difference in time between the start of the event and the current time
         is_negative = time_remaining < 0  # Check if the event has already passed (i.e.: the time remaining is negative).
         time_remaining = abs(time_remaining)  # Get the absolute value of the time difference
 
@@ -1886,6 +1476,9 @@ class UpcomingEvent(tk.Frame):
 
         is_negative = time_remaining.pop(0)  # Remove the first element from the time remaining list (a boolean describing if the event has passed or not)
 
+        if not any(time_remaining):  # If the event starts within the current second, there is no non-zero part to display
+            return 'now'
+
         idx = 0  # Declare a variable to hold the starting index of the components in the time difference list to include in the output string
 
         if time_remaining[0] > 5:  # If the time difference is more than 5 days
@@ -1913,7 +1506,8 @@ class UpcomingEvent(tk.Frame):
 
 class TimeTable:
     """
-    Manages a single timetable and its supporting UI elements
+    Manages a single timetable and its supporting UI elements.
+    The timetable data is stored in a `TimetableModel`, which does not depend on Tkinter. This class displays the model and applies the user’s edits to it.
 
     :param master: (Window) The root window widget
     :param classes: The names of each class in the timetable
@@ -1924,15 +1518,14 @@ class TimeTable:
     :param day_start_time: The time at which the first timeslot on the timetable column starts
     :param sessions: The mapping for the names, types, and times for each class in the timetable in the format [name, type (is not break), end time]
     :param start_date: The start timestamp from which to calculate the current week
+    :param num_weeks: The number of weeks in the term
+    :param event_types: The custom event types of the timetable (see `EventTypeRegistry`)
+    :param recovered: Whether the timetable data was recovered from the journal of a previous session, rather than read from the saved timetable file
     """
 
-    def __init__(self, master, classes: list[str], teachers: list[str], rooms: list[str], class_mapping: list[list[int]], event_data: list[dict], day_start_time: str, sessions: list[tuple[str, bool, str]], start_date: int) -> None:
+    def __init__(self, master, classes: list[str], teachers: list[str], rooms: list[str], class_mapping: list[list[int]], event_data: list[dict], day_start_time: str, sessions: list[tuple[str, bool, str]], start_date: int, num_weeks: int = DEFAULT_NUM_WEEKS, event_types: Optional[list[dict]] = None, recovered: bool = False) -> None:
         self.master: Window = master
 
-        self.class_mapping = class_mapping
-        self.start_timestamp = start_date
-        self.day_start_time = day_start_time
-
         ## Create a container to hold the entire timetable
         self.display_frame = tk.Frame(master, background='#222')
         self.display_frame.columnconfigure(1, weight=1)
@@ -1940,22 +1533,19 @@ class TimeTable:
         self.display_frame.rowconfigure(0, weight=1)
         self.grid = self.display_frame.grid
 
-        self.events = list(map(lambda v: Event(self, **v), event_data))  # Create an event object for each event in the event data dictionary and add them to a list
-        self.events.sort(key=list)  # Sort the list of events by their timeslot obtained by converting the event to an iterable
-
-        ## Convert the class data to class objects
-        self.classes = []
-        for name, room, teacher in zip(classes, rooms, teachers):
-            self.classes.append(TimetableClass(self, name, room, teacher))
-
-        self.active_cell: Optional[WeekendCell | SessionCell] = None
+        self.active_cell: Optional[TimetableCell] = None
         self.day = 0
         self.pause_text_event = False
-        self.event_types = ['Event', 'Info', 'Reminder', 'Bookmark', 'Assignment', 'Test']
-        self.current_savefile_contents: Optional[str] = None
-        self.events_saved = True
         self.formatting_update_after: Optional[str] = None
 
+        ## Crash recovery. Changes are recorded in a journal next to the timetable file, and a full snapshot is periodically written to an autosave file so the journal stays short.
+        self.journal_after: Optional[str] = None  # The scheduled call to write pending changes to the journal
+        self.autosave_after: Optional[str] = None  # The scheduled call to write an autosave snapshot
+
+        ## Countdown scheduling. The 'time until due' displays of all upcoming event widgets are refreshed by a single timer, which fires at the earliest deadline in a heap and updates every widget due at that time.
+        self.due_after: Optional[str] = None  # The scheduled call to refresh the widgets at the earliest deadline
+        self.due_after_deadline: Optional[float] = None  # The deadline that the scheduled call was made for
+
         ## Create empty and null text string variables to use as placeholders (e.g.: when an event is added or deleted)
         self.empty_text_variable = tk.StringVar(self.display_frame, '')
         self.null_text_variable = tk.StringVar(self.display_frame, '<Null>')
@@ -1967,26 +1557,13 @@ class TimeTable:
             'highlighted': ({'background': '#343C44', 'foreground': '#D4D6D7'}, '#3B434C')
         }
 
+        ## Precompute the arguments for setting the colours of a cell in each state, in the format (border, background, foreground)
+        self.cell_state_styles = {state: (border, config['background'], config['foreground']) for state, (config, border) in self.cell_state_config.items()}
+        self.display_frame.tk.eval(CELL_STATE_PROC)  # Define the procedure used to apply the colours to widget cells
+
         self.active_header_config = {'background': '#8C3841', 'foreground': '#D4D6D7', 'font': ('Calibri', 13, 'bold'), 'highlightbackground': '#963D49'}
         self.inactive_header_config = {'background': '#424D59', 'foreground': '#D4D6D7', 'font': ('Calibri', 13), 'highlightbackground': '#4F565E'}
 
-        self.flags = [0]  # Flags for post-loading actions
-
-        self.num_weeks = 12
-
-        self.week = self.get_week(datetime.datetime.now().timestamp())  # Calculate the current week number
-        if self.week >= self.num_weeks:
-            self.week = 0
-            self.flags[0]  = 1
-
-        self.sessions, self.sessiontimes = self.get_sessiontimes(sessions)  # Calculate the time index for each session and get the session data to display
-
-        self.timeslot_idx = self.get_session(datetime.datetime.now())  # Declare a variable containing the session to calculate time (will never be NULL)
-        if self.timeslot_idx is None:
-            self.timeslot_idx = 11
-
-        self.timeslot_idx -= 1
-
         ## ======================================== User Interface ========================================
 
         ## ----------------------------------------- Week Display -----------------------------------------
@@ -1997,21 +1574,12 @@ class TimeTable:
 
         tk.Label(frame, background='#303841', borderwidth=0, relief='flat', foreground='#D8DEE9', font=('Calibri', 12, 'bold'), text='Week', highlightthickness=1, highlightbackground='#3B434C').grid(row=0, columnspan=2, column=0, sticky='nswe', pady=(1, 0))
 
-        self.week_slider = tk.Scale(frame, orient='vertical', resolution=1, command=self.update_week, from_=0, to=11, borderwidth=0, relief='flat', border=0, showvalue=False, sliderlength=50, sliderrelief='flat', width=10, troughcolor='#444B53', highlightthickness=0, background='#696F75', activebackground='#858C93')
+        self.week_slider = tk.Scale(frame, orient='vertical', resolution=1, command=self.update_week, from_=0, borderwidth=0, relief='flat', border=0, showvalue=False, sliderlength=50, sliderrelief='flat', width=10, troughcolor='#444B53', highlightthickness=0, background='#696F75', activebackground='#858C93')
         self.week_slider.grid(row=1, column=0, sticky='ns', padx=(0, 1), pady=(1, 1), rowspan=12)
-        self.week_slider.set(self.week)  # Set the week slider to the current week number
 
-        self.weekframe = tk.Frame(frame, background='#222')
-        self.weekframe.grid(row=1, column=1, sticky='NSWE', pady=(0, 0))
-        self.weekframe.rowconfigure(list(range(self.num_weeks)), weight=1)
-        self.weekframe.columnconfigure(1, weight=1, minsize=150)
-        self.week_elems = []
-
-        ## Add the week display elements to the week frame
-        for i in range(self.num_weeks):
-            frame = WeekFrame(self, i, self.weekframe, background='#303841', highlightbackground='#3B434C', highlightthickness=1)
-            frame.grid(row=i, column=1, sticky='nswe', padx=(0, 0), pady=(int(i == 0), 1))
-            self.week_elems.append(frame)
+        ## Create a virtualised strip of week displays. Week display widgets are only created for the visible weeks, and are reused as the strip is scrolled.
+        self.week_strip = VirtualScrollableFrame(frame, create_row=lambda master, kind: WeekFrame(self, None, master, background='#303841', highlightbackground='#3B434C', highlightthickness=1), bind_row=lambda row, week: row.set_item(week), row_height=lambda week: 42, padx=0, c_width=150, c_highlightthickness=0, c_background='#222', c_yscrollincrement=42)
+        self.week_strip.grid(row=1, column=1, sticky='NSWE', pady=(0, 0))
 
         ## ------------------------------------------ Edit Sidebar ----------------------------------------
 
@@ -2060,7 +1628,9 @@ class TimeTable:
 
         self.event_entry.configure(yscrollcommand=self.event_scrollbar.set)
 
-        self.event_entry._orig = str(self.event_entry) + '_orig'
+        ## Route the text widget’s commands through `_proxy`. The widget command is renamed first, and the colour delegator added by `IndentText.enable_highlighting` is later layered on top of the proxy.
+        self.event_entry._orig = str(self.event_entry) + '_proxied'
+        self.event_entry.tk.call('rename', str(self.event_entry), self.event_entry._orig)
         self.event_entry.tk.createcommand(str(self.event_entry), self._proxy)
 
         self.event_entry.bind('<<Edit>>', lambda v: self.update_button_states())
@@ -2089,10 +1659,10 @@ class TimeTable:
 
         tk.Label(self.buttonframe, background='#424D59', foreground='#D8DEE9', font=('Calibri', 12), text='Type', width=5).grid(row=0, column=5, padx=(1, 1), pady=(0, 1), sticky='nswe')
 
-        self.event_type_combobox = ttk.Combobox(self.buttonframe, style='Custom.TCombobox', background='#303841', foreground='#D8DEE9', values=self.event_types, state='disabled')
+        self.event_type_combobox = ttk.Combobox(self.buttonframe, style='Custom.TCombobox', background='#303841', foreground='#D8DEE9', state='disabled')
         self.event_type_combobox.grid(row=0, column=6, sticky='nswe', padx=(0, 1), pady=(0, 1))
         self.event_type_combobox.bind('<<ComboboxSelected>>', lambda v: self.edit_event_type())
-        self.tt_elements: list[list[SessionCell | WeekendCell]] = []
+        self.tt_elements: list[list[TimetableCell]] = []
 
         ## ----------------------------------------- Class Edit UI ----------------------------------------
 
@@ -2110,7 +1680,7 @@ class TimeTable:
 
         tk.Label(buttonframe, background='#424D59', foreground='#D8DEE9', font=('Calibri', 12), text='Session', width=7).grid(row=0, column=0, padx=(1, 1), pady=(1, 1), sticky='nswe')
 
-        self.class_name_combobox = ttk.Combobox(buttonframe, style='Custom.TCombobox', background='#303841', foreground='#D8DEE9', values=classes, state='disabled')
+        self.class_name_combobox = ttk.Combobox(buttonframe, style='Custom.TCombobox', background='#303841', foreground='#D8DEE9', state='disabled')
         self.class_name_combobox.grid(row=0, column=1, sticky='nswe', padx=(0, 1), pady=(1, 1), columnspan=2)
         self.class_name_combobox.bind('<<ComboboxSelected>>', lambda v: self.edit_class())
 
@@ -2154,7 +1724,8 @@ class TimeTable:
         self.event_vscrollbar = ttk.Scrollbar(events_frame, orient='vertical', style='Custom.Vertical.TScrollbar')
         self.event_vscrollbar.grid(row=0, column=1, sticky='ns', padx=(0, 0), pady=0)
 
-        self.upcoming_events_frame = ScrollableFrame(events_frame, vscrollbar=self.event_vscrollbar, c_highlightthickness=1, c_background='#000', c_highlightbackground='#3B434C', f_background='#000')
+        ## Create a virtualised list of upcoming events. Items are either events, or (week, day) tuples for the header above the events on each day.
+        self.upcoming_events_frame = VirtualScrollableFrame(events_frame, create_row=self.create_upcoming_row, bind_row=lambda row, item: row.set_item(item), row_height=self.upcoming_row_height, row_kind=lambda item: 'header' if isinstance(item, tuple) else 'event', release_row=lambda row: row.release(), padx=1, vscrollbar=self.event_vscrollbar, c_highlightthickness=1, c_background='#000', c_highlightbackground='#3B434C')
         self.upcoming_events_frame.grid(row=0, column=0, sticky='nswe', padx=(0, 1), pady=0)
 
         ## ----------------------------------------- Table Display ----------------------------------------
@@ -2162,7 +1733,6 @@ class TimeTable:
         self.table_frame = tk.Frame(self.display_frame, background='#222')
         self.table_frame.grid(column=1, row=0, sticky='NSWE')
         self.table_frame.columnconfigure(list(range(1, 8)), weight=1)
-        self.table_frame.rowconfigure(list(range(1, len(self.sessions))), weight=1)
 
         ## ---------------------------------------- Table Generation --------------------------------------
 
@@ -2176,148 +1746,303 @@ class TimeTable:
             header.grid(row=0, column=n + 1, sticky='NSWE', padx=(int(n == 0), 1), pady=(1, 0))
             self.dotw_headers.append(header)  # Add the header to the list
 
+        self.session_labels: list[tk.Label] = []  # The header label of each session, including the breaks between sessions
         self.session_headers: list[tk.Label] = []  # Define a list to store the session headers
         self.active_session_header: Optional[int] = None  # Define a variable to store the active session header
 
-        self.session_break_idxs = [[], []]  # Define a list to store the index of session breaks and the total row offset from session breaks
-
-        ## Add a header for each period in the day, plus the breaks between sessions
-        for n, session_data in enumerate(self.sessions):  # Iterate through each session in the timetable data
-            name, is_normal = session_data  # Get the data for the session
-
-            ## Add a header label
-            header = tk.Label(self.table_frame, text=name, background='#424D59' if is_normal else '#303841', foreground='#D4D6D7' if is_normal else '#D8DEE9', highlightthickness=1, highlightbackground='#4F565E', borderwidth=0, font=('Calibri', 13), image=master.pixel, compound='center', width=15, height=19)
-            header.grid(row=n + 1, column=0, columns=1 if is_normal else 6, sticky='NSWE', padx=(1, int(not is_normal)), pady=(int(n == 0), 1))
-
-            ## Add the label to the corresponding list depending on weather or not it is a session break
-            if is_normal:
-                self.session_headers.append(header)
-            else:
-                self.session_break_idxs[0].append(n)  # Add the grid index to the session break list
-                self.session_break_idxs[1].append(n - len(self.session_break_idxs[0]))  # Add the total row offset to the session break list
-                self.table_frame.rowconfigure(n + 1, weight=0)  # Configure the grid so that session breaks do not expand
-
-        ## Add the timetable cells for the table body
-        for daynum, sessions in enumerate(self.class_mapping):  # Iterate through the columns (days) in the class mapping
-            self.tt_elements.append([])  # Add a new empty list to the timetable cell array
-            for sessionnum, class_idx in enumerate(sessions):  # Iterate through the session mapping for the day
-                cell = SessionCell(self, self.table_frame, daynum, sessionnum, self.classes[class_idx])  # Create a cell for at the current column and row index with the corresponding class mapping
-                self.tt_elements[-1].append(cell)  # Add the cell to the list
-                cell.grid()  # Add the cell to the display grid
+        self.table_layout: tuple[int, tuple[int, ...]] = (0, ())  # The number of timeslots displayed in the table and the indexes of the breaks between sessions
 
-        ## Add a cell for each of the weekends
-        for i in range(2):
-            cell = WeekendCell(self, self.table_frame, i)
-            self.tt_elements.append([cell])
-            cell.grid()
+        ## Add a cell for each of the weekends, using the renderer set by `TABLE_RENDERER`. The cells for the weekdays are added when the timetable data is loaded.
+        if TABLE_RENDERER == 'canvas':
+            self.cell_grid: Optional[CanvasGrid] = CanvasGrid(self, self.table_frame)
+            self.create_cell: Callable[[int, int, Optional[TimetableClass]], TimetableCell] = partial(CanvasCell, self, self.cell_grid)
+            self.weekend_cells: list[TimetableCell] = [CanvasCell(self, self.cell_grid, i + 5, 0, None, True) for i in range(2)]
+        else:
+            self.cell_grid = None
+            self.create_cell = partial(SessionCell, self, self.table_frame)
+            self.weekend_cells = [WeekendCell(self, self.table_frame, i) for i in range(2)]
 
         ## Add a marker for the current session
         self.current_session_marker = tk.Frame(self.table_frame, background='#8C3841', highlightthickness=1, highlightbackground='#969CA3')
         self.current_session_marker.bind('<Button-1>', lambda v: self.select(self.day, self.timeslot_idx))
         pywinstyles.set_opacity(self.current_session_marker.winfo_id(), 0.2)
 
-        self.upcoming_event_headers = dict()  # Declare a dictionary to hold the header widgets indexed by the day and week number
-        self.upcoming_events: list[UpcomingEvent | tk.Frame] = []  # Declare a list to hold the upcoming event widgets
+        ## Update the displayed timeslot whenever the current timeslot changes
+        self.clock = TimeslotClock(self.display_frame.after, self.display_frame.after_cancel, self.get_current_timeslot, self.get_next_timeslot_change)
+        self.clock.subscribe(self.timeslot_changed)
 
-        ## Iterate through the events that have not already occurred.
-        for i in filter(lambda v: v >= (self.week, self.day, self.get_session(datetime.datetime.now())), self.events):
-            ## Todo: add the event header generation to a function
-            ## If there is not a header for the event's day and week number
-            if (i.week, i.day) not in self.upcoming_event_headers:
-                ## Create a header frame and add it to the scrollable frame
-                header = tk.Frame(self.upcoming_events_frame.frame, background='#4F565E')
-                header.pack(side='top', expand=True, fill='x', padx=(1, 1), pady=(20, 0))
-                header.event = (i.week, i.day, 0)  # Set the event data used to compare event times for the header widget
+        self.load(classes, teachers, rooms, class_mapping, event_data, day_start_time, sessions, start_date, num_weeks, event_types, recovered)  # Display the timetable data
 
-                ## Add a label to the header frame
-                tk.Label(header, text=f'{["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][i.day]} Week {i.week}', background='#66587D', foreground='#D8DEE9', font=('Calibri', 13, 'bold'), image=self.master.pixel, compound='center', height=20).pack(side='left', expand=True, fill='x', padx=(1, 1), pady=1)
-                tk.Label(header, background='#c678dd', image=self.master.pixel, compound='center', width=46, height=20).pack(side='left', padx=(0, 1), pady=1)
+    def load(self, classes: list[str], teachers: list[str], rooms: list[str], class_mapping: list[list[int]], event_data: list[dict], day_start_time: str, sessions: list[tuple[str, bool, str]], start_date: int, num_weeks: int = DEFAULT_NUM_WEEKS, event_types: Optional[list[dict]] = None, recovered: bool = False) -> bool:
+        """
+        Load timetable data into the timetable.
+        The existing widgets are reused, so cells and session headers are only created or destroyed where the number of sessions differs from the previous data.
+        The parameters are the same as those of the class (see `read_timetable`). Call `unload` first if data is already loaded.
 
-                self.upcoming_events.append(header)  # Add the header to the list of upcoming event widgets
-                self.upcoming_event_headers.update({(i.week, i.day): header})  # Add the header to the header dictionary keyed by the day and week number
+        :return: Whether the layout of the table changed
+        """
 
-            ## Create an upcoming event widget for the event
-            upcoming_event = UpcomingEvent(self, i, self.upcoming_events_frame.frame)
-            upcoming_event.pack(side='top', expand=True, fill='x', padx=(1, 1), pady=(0, 0))
+        self.load_id = object()  # Identifies the loaded data, so that the results of saves made before the data was replaced are ignored
 
-            i.display_widget = upcoming_event  # Set the event’s display widget
-            self.upcoming_events.append(upcoming_event)  # Add the upcoming event widget to the list.
+        ## Store the timetable data in a model, creating an event object for each event in the event data
+        self.model = TimetableModel(classes, teachers, rooms, class_mapping, event_data, day_start_time, sessions, start_date, num_weeks, event_types, event_factory=partial(Event, self))
+        self.master.load_event_type_icons(self.event_types)  # Create the icons for the event types, including any types registered by the events
 
-        self.increment_timeslot()  # Update the displayed timeslot
+        ## Create an object to display and edit each class
+        self.classes: list[TimetableClass] = [TimetableClass(self, data) for data in self.model.classes]
+        self.classes_by_id: dict[int, TimetableClass] = {tt_class.id: tt_class for tt_class in self.classes}  # The classes keyed by their stable identifier
 
-    def change_week(self) -> None:
-        """ Change the current start timestamp and update the week accordingly """
-        self.start_timestamp = self.master.get_start_week(allow_cancel=True)
-        self.week = self.get_week(datetime.datetime.now().timestamp())
-        self.update_week(self.week)
+        self.events_saved = True
 
-    def get_sessiontimes(self, data: list[tuple[str, bool, str]]) -> tuple[list[list[str, bool]], list[list[int]]]:
-        """
-        Get the timestamp of each 'period change' and format the session data for use by the program.
+        ## Save-state tracking. Every modification increments the revision counter, so checking whether the timetable is saved is a single comparison against the last saved revision.
+        self.revision = 0  # The revision number of the timetable data currently in memory
+        self.saved_revision = 0  # The revision number of the timetable data that was last written to disk
+        self.saved_hash: Optional[str] = None  # A hash of the saved timetable data, only computed when a deep comparison is requested
 
-        :param data: The session data to process
-        :return: A list containing each session’s name and type, as well as a list containing the 'period change' indexes
-        """
+        ## Crash recovery
+        self.journal = Journal(self.master.filename)
+        self.journal_pending: dict[tuple[int, int, int] | str, Optional[Event] | bool] = dict()  # The changes waiting to be written to the journal, keyed by the event timeslot, 'classes', or 'term'
+        self.autosave_revision = 0  # The revision of the timetable data in the latest autosave snapshot
 
-        session_times = [list(map(int, self.day_start_time.split(':')))]  # Define a list to contain the hour and minute of each 'period change' with an initial value of the day start timestamp.
+        ## Countdown scheduling
+        self.due_heap: list[tuple[float, int, UpcomingEvent]] = []  # The next refresh deadline (as a timestamp) of each upcoming event widget
+        self.due_counter = itertools.count()  # Breaks ties between widgets with the same deadline, so the widgets themselves are never compared
 
-        for idx, time in enumerate(swapaxes(data)[2]):  # Iterate through the session data
-            if time == '-1':  # If the session’s end time is '-1' (i.e.: until the end of the day), add [-1, -1] to the 'period change' time list
-                session_times.append([-1, -1])
-            else:
-                ## Add the session’s end time to the 'period change' time list
-                t = list(map(int, time.split(':')))
-                session_times.append(t)
+        self.flags = [0]  # Flags for post-loading actions
+
+        self.week = self.model.get_week(datetime.datetime.now().timestamp())  # Calculate the current week number
+        if self.week >= self.num_weeks:
+            self.week = 0
+            self.flags[0]  = 1
 
-        return swapaxes(swapaxes(data)[:2]), session_times
+        self.timeslot_idx = self.model.get_timeslot(datetime.datetime.now())  # Declare a variable containing the session to calculate time (will never be NULL)
 
-    def get_week(self, now: float) -> int:
-        """
-        Get the week number from the current timestamp.
+        ## Update the week displays
+        self.week_slider.configure(to=self.num_weeks - 1)
+        self.week_slider.set(self.week)  # Set the week slider to the current week number
+        self.week_strip.set_items(range(self.num_weeks))
+        self.week_strip.see(self.week)
+        self.events.observe_counts(self.week_counts_changed)  # Update the displayed event type counts whenever they change
 
-        :param now: The current timestamp.
-        :return: The number of weeks since the starting timestamp (ie: the current week number).
-        """
+        ## Update the values of the event type and class pickers
+        self.event_type_combobox.configure(values=self.event_types.names)
+        self.class_name_combobox.configure(values=classes)
 
-        return int((now - self.start_timestamp) // (86400 * 7))
+        layout_changed = self.update_table()  # Map the classes to the timetable cells, adding or removing cells if the number of sessions changed
 
-    @staticmethod
-    def validate_session(now: datetime.datetime, h1: int, m1: int, h2: int, m2: int) -> bool:
+        ## Display the events in the current week
+        for day in self.tt_elements:
+            for cell in day:
+                event = self.events.get(self.week, cell.day, cell.session)
+                if cell.current_event is not event:
+                    cell.set_event(event)
+
+        self.event_entry.edit_reset()  # Clear the undo history of the event text entry
+        self.update_active_event()
+
+        ## Add the events that have not already occurred to the upcoming events list, with a header before the first event on each day
+        upcoming_items = []
+        for i in self.events.iter_from(self.week, self.day, self.model.get_session(datetime.datetime.now()) or 0):
+            if not upcoming_items or (upcoming_items[-1].week, upcoming_items[-1].day) != (i.week, i.day):
+                upcoming_items.append((i.week, i.day))
+            upcoming_items.append(i)
+
+        self.upcoming_events_frame.set_items(upcoming_items)
+
+        self.clock.start()  # Display the current timeslot and start updating it when it changes
+
+        ## Keep a copy of the saved timetable data so that unsaved changes can be undone without reading the timetable file
+        if recovered:  # If the data was recovered, it does not match the timetable file, so mark it as unsaved
+            self.saved_data: Optional[dict] = None
+            self.revision = 1
+            self.check_saved()
+        else:
+            self.saved_data = self.model.get_data()
+            self.update_save_buttons()
+
+        return layout_changed
+
+    def unload(self) -> None:
+        """ Write any pending changes to the journal and stop the scheduled updates of the loaded timetable data """
+
+        self.flush_journal()  # Write any pending changes to the journal, so they can be recovered if the timetable is reopened
+
+        if self.autosave_after is not None:
+            self.display_frame.after_cancel(self.autosave_after)
+            self.autosave_after = None
+
+        if self.due_after is not None:
+            self.display_frame.after_cancel(self.due_after)
+            self.due_after = None
+            self.due_after_deadline = None
+
+        self.clock.stop()
+
+        ## Deselect the active cell
+        if self.active_cell is not None:
+            self.active_cell.state = 'normal'
+            self.active_cell.update_elems()
+            self.active_cell = None
+
+    def reload(self, *args: Any, **kwargs: Any) -> bool:
         """
-        Check if the input time is within the input time range
+        Replace the displayed timetable data, reusing the existing widgets.
+        The arguments are the same as those of `load`.
 
-        :param now: The input time to compare.
-        :param h1: The 'hours' part of the start of the time range.
-        :param m1: The 'minutes' part of the start of the time range.
-        :param h2: The 'hours' part of the end of the time range.
-        :param m2: The 'minutes' part of the end of the time range.
-        :return: Whether or not the input time is within the input time range.
+        :return: Whether the layout of the table changed
         """
 
-        if h2 == -1 and m2 == -1:  # If the time range extends until the end of the day
-            return now.hour > h1 or now.hour == h1 and now.minute > m2
-        elif h1 == h2:
-            return now.hour == h1 and m1 <= now.minute <= m2
-        else:
-            return (now.hour == h1 and now.minute >= m1) or (now.hour == h2 and now.minute < m2)
+        self.unload()
+        return self.load(*args, **kwargs)
 
-    def get_session(self, now: datetime.datetime) -> Optional[int]:
+    def update_table(self) -> bool:
         """
-        Get the index of the session at the input time.
+        Update the session headers and cells of the table to match the sessions and class mapping of the model.
+        Existing headers and cells are reconfigured, and are only created or destroyed where the number of sessions differs.
 
-        :param now: The time to check
-        :return: The index of the session at the input time
+        :return: Whether the layout of the table changed
         """
 
-        for n, i in enumerate(zip(*swapaxes(self.sessiontimes[:-1]), *swapaxes(self.sessiontimes[1:]))):  # Iterate through the session start and end times
-            if self.validate_session(now, *i):  # If the input time is within the session start and end times, return the index of the session
-                return n
+        old_layout = self.table_layout
 
-        ## If the current time is not within any session
-        if now.hour > 14 or (now.hour == 45 and now.minute > 45):  # Check if the session is after 14:45 and if so, return the index of the last session, otherwise return None.
-            return 10
-        else:
-            return None
+        ## Reset the formatting of the active headers
+        if self.active_dotw_header is not None:
+            self.dotw_headers[self.active_dotw_header].configure(**self.inactive_header_config)
+            self.active_dotw_header = None
+        if self.active_session_header is not None:
+            self.session_headers[self.active_session_header].configure(**self.inactive_header_config)
+            self.active_session_header = None
+        self.current_session_marker.grid_remove()
+
+        self.session_headers = []
+
+        ## Reset the row weights of the table, so that the rows expand except for the session breaks
+        rows = max(len(self.session_labels), len(self.sessions))
+        if old_layout[0] != len(self.sessions):
+            self.table_frame.rowconfigure(list(range(1, rows + 1)), weight=0)
+        if len(self.sessions) > 1:
+            self.table_frame.rowconfigure(list(range(1, len(self.sessions))), weight=1)
+
+        ## Add a header for each period in the day, plus the breaks between sessions
+        for n, session_data in enumerate(self.sessions):  # Iterate through each session in the timetable data
+            name, is_normal = session_data  # Get the data for the session
+            config = dict(text=name, background='#424D59' if is_normal else '#303841', foreground='#D4D6D7' if is_normal else '#D8DEE9')
+
+            ## Reuse the existing header label, or add a header label if there are more sessions than before
+            if n < len(self.session_labels):
+                header = self.session_labels[n]
+                header.configure(**config)
+            else:
+                header = tk.Label(self.table_frame, highlightthickness=1, highlightbackground='#4F565E', borderwidth=0, font=('Calibri', 13), image=self.master.pixel, compound='center', width=15, height=19, **config)
+                self.session_labels.append(header)
+            header.grid(row=n + 1, column=0, columns=1 if is_normal else 6, sticky='NSWE', padx=(1, int(not is_normal)), pady=(int(n == 0), 1))
+
+            ## Add the label to the list of session headers unless it is a session break
+            if is_normal:
+                self.session_headers.append(header)
+            else:
+                self.table_frame.rowconfigure(n + 1, weight=0)  # Configure the grid so that session breaks do not expand
+
+        ## Remove the headers of sessions that no longer exist
+        for header in self.session_labels[len(self.sessions):]:
+            header.destroy()
+        del self.session_labels[len(self.sessions):]
+
+        self.table_layout = (len(self.session_labels), tuple(self.session_break_idxs[0]))
+        layout_changed = old_layout != self.table_layout
+
+        ## Map the classes to the cells for the table body, reusing the existing cells
+        class_mapping = self.model.mapping
+        weekday_cells = self.tt_elements[:-len(self.weekend_cells)]
+        for daynum, sessions in enumerate(class_mapping):  # Iterate through the columns (days) in the class mapping
+            if daynum == len(weekday_cells):
+                weekday_cells.append([])
+            cells = weekday_cells[daynum]
+
+            for sessionnum, class_data in enumerate(sessions):  # Iterate through the session mapping for the day
+                tt_class = None if class_data is None else self.classes[class_data.idx]
+                if sessionnum < len(cells):
+                    cells[sessionnum].update_mapped_class(tt_class)
+                else:
+                    cell = self.create_cell(daynum, sessionnum, tt_class)  # Create a cell for at the current column and row index with the corresponding class mapping
+                    cells.append(cell)
+                    cell.grid()  # Add the cell to the display grid
+                    layout_changed = True
+
+            ## Remove the cells of sessions that no longer exist
+            for cell in cells[len(sessions):]:
+                cell.destroy()
+                layout_changed = True
+            del cells[len(sessions):]
+
+        ## Remove the columns of days that no longer exist
+        for cells in weekday_cells[len(class_mapping):]:
+            for cell in cells:
+                cell.destroy()
+            layout_changed = True
+        del weekday_cells[len(class_mapping):]
+
+        self.tt_elements = weekday_cells + [[cell] for cell in self.weekend_cells]
+
+        if self.cell_grid is not None:  # Stretch the canvas of the cells over the rows of the sessions
+            self.cell_grid.grid(len(self.sessions))
+
+        ## If the sessions changed, move the cells to their new rows
+        if layout_changed:
+            for day in self.tt_elements:
+                for cell in day:
+                    cell.grid()
+
+        return layout_changed
+
+    def change_week(self) -> None:
+        """ Change the current start timestamp and update the week accordingly """
+        self.start_timestamp = self.master.get_start_week(allow_cancel=True, num_weeks=self.num_weeks)
+        self.week = self.model.get_week(datetime.datetime.now().timestamp())
+        self.update_week(self.week)
+
+    ## ------------------------------------ Timetable Data -------------------------------------
+    ## The timetable data is stored in the model. These properties give the UI direct access to it.
+
+    @property
+    def events(self) -> EventStore:
+        return self.model.events
+
+    @property
+    def event_types(self) -> EventTypeRegistry:
+        return self.model.event_types
+
+    @property
+    def sessions(self) -> list[tuple[str, bool]]:
+        return self.model.sessions
+
+    @property
+    def sessiontimes(self) -> list[list[int]]:
+        return self.model.sessiontimes
+
+    @property
+    def session_break_idxs(self) -> list[list[int]]:
+        return self.model.session_break_idxs
+
+    @property
+    def day_start_time(self) -> str:
+        return self.model.day_start_time
+
+    @property
+    def start_timestamp(self) -> int:
+        return self.model.start_timestamp
+
+    @start_timestamp.setter
+    def start_timestamp(self, value: int) -> None:
+        self.model.start_timestamp = value
+
+    @property
+    def num_weeks(self) -> int:
+        return self.model.num_weeks
+
+    @num_weeks.setter
+    def num_weeks(self, value: int) -> None:
+        self.model.num_weeks = value
 
     def update_list_format(self) -> None:
         """ Update the numbering type of the selected text or current line to match the value set by the user. """
@@ -2433,26 +2158,42 @@ class TimeTable:
         self.update_week(event.week)
         self.tt_elements[event.day][event.session].toggle_selected()
 
-    def increment_timeslot(self) -> None:
-        """
-        Increment the current session number, update the displayed session and day, and get the time to the next period change
+    def get_current_timeslot(self, now: datetime.datetime) -> tuple[datetime.date, int]:
         """
+        Get the timeslot at the input time, used by the timeslot clock
 
-        now = datetime.datetime.now()  # Get the current time
+        :param now: The time to check
+        :return: The date and the timeslot index at the input time
+        """
 
         ## TODO: make sure this works correctly
-        if now.weekday() > 4:  # Check if the current day is a weekend
-            self.timeslot_idx = 0  # Set the current timeslot to 0
-            update_time = self.sessiontimes[0]
-        else:
-            self.timeslot_idx = (self.timeslot_idx + 1) % (len(self.sessions) + 1)  # Increment the current timeslot index
-            update_time = (self.sessiontimes[:-1] + [24, 1])[self.timeslot_idx + 1]  # Get the timestamp for the end of the current timeslot
+        if now.weekday() > 4:  # Weekends are displayed as a single timeslot
+            return now.date(), 0
+
+        return now.date(), self.model.get_timeslot(now)
+
+    def get_next_timeslot_change(self, now: datetime.datetime) -> datetime.datetime:
+        """
+        Get the time of the next timeslot change after the input time, used by the timeslot clock
+
+        :param now: The time to check
+        """
 
-        update_ms = (3600000 * (update_time[0] - now.hour)) + (60000 * (update_time[1] - now.minute)) - now.second  # Calculate the time in milliseconds until the end of the timeslot
+        midnight = datetime.datetime.combine(now.date(), datetime.time())
+        if now.weekday() > 4:  # The timeslot only changes at midnight on weekends
+            return midnight + datetime.timedelta(days=1)
 
-        self.update_timeslot_display()  # Update the displayed timeslot
+        return midnight + datetime.timedelta(minutes=self.model.get_next_session_change(now))
+
+    def timeslot_changed(self, timeslot: tuple[datetime.date, int]) -> None:
+        """
+        Update the current session number and the displayed session and day. Called by the timeslot clock when the timeslot changes.
+
+        :param timeslot: The new date and timeslot index
+        """
 
-        self.display_frame.after(update_ms, self.increment_timeslot)  # Call the function again after the calculated time
+        self.timeslot_idx = timeslot[1]
+        self.update_timeslot_display()
 
     def update_timeslot_display(self) -> None:
         """ Update the displayed timeslot in the timetable """
@@ -2470,7 +2211,7 @@ class TimeTable:
             self.active_session_header = None
 
         ## If the current week is the same as the displayed week
-        if self.week == self.get_week(now.timestamp()):
+        if self.week == self.model.get_week(now.timestamp()):
             if self.active_dotw_header is None:
                 self.active_dotw_header = self.day  # Update the index of the active header
                 self.dotw_headers[self.active_dotw_header].configure(**self.active_header_config)  # Configure the colours of the active header
@@ -2513,25 +2254,63 @@ class TimeTable:
 
     def save_timetable(self, filename: Optional[str] = None, encoding: str = 'utf-8') -> None:
         """
-        Get all timetable data and save as a JSON file
+        Get all timetable data and save as a JSON file.
+        The timetable data is read on the main thread, then written to disk on the window’s save engine thread.
         """
 
         ## Get the path to save at
         if filename is None:
             filename = self.master.filename
 
-        json_data = self.get_json()  # Get the json formatted text to save
+        data = self.model.get_data()  # Take a snapshot of the timetable data
+        chunks = list(iter_timetable_json(data))  # Convert the snapshot to json formatted text as a list of chunks
+        self.master.save_engine.submit(filename, chunks, encoding, token=(self.load_id, self.revision, data))  # Queue the snapshot to be written
+        self.master.poll_saves()  # Start polling for the result of the write
 
-        try:  # Attempt to save the file
-            with open(filename, 'w', encoding=encoding) as writefile:  # Open the output file and write the json text
-                writefile.write(json_data)
+    def save_completed(self, filename: str, revision: int, data: Optional[dict], error: Optional[Exception]) -> None:
+        """
+        Update the save state of the timetable after a snapshot has been written to disk.
+        Called by the window when the save engine reports the result of a write.
+
+        :param filename: The path the snapshot was written to
+        :param revision: The revision of the timetable data in the snapshot
+        :param data: The timetable data in the snapshot. None if the snapshot is an autosave.
+        :param error: The exception raised while writing the snapshot, if any
+        """
+
+        if filename == self.journal.autosave_path:  # If the snapshot is an autosave, the journal entries it includes are no longer needed
+            if error is None:
+                if revision <= self.saved_revision:  # If the timetable file was saved with a newer revision before the autosave finished, the autosave is stale, so remove it
+                    if os.path.exists(filename):
+                        os.remove(filename)
+                    return
+                self.autosave_revision = revision
+                self.journal.compact(revision)
+            return
 
-            self.master.display_popup('Saved Successfully')  # Display a popup that the file was saved
-            self.current_savefile_contents = multireplace(json_data, {'\n': '', '    ': '', '\t': ''})  # Update the string containing the timetable data that is currently saved
-            self.events_saved = True
-            self.update_save_buttons()  # Disable save button
-        except PermissionError:
+        if isinstance(error, PermissionError):
             self.master.display_popup('Could not save: Permission Denied')  # Display a popup that the file could not be saved due to a permission error
+            return
+        elif error is not None:
+            self.master.display_popup(f'Could not save: {error.strerror if isinstance(error, OSError) else error}')
+            return
+
+        self.master.display_popup('Saved Successfully')  # Display a popup that the file was saved
+
+        if filename == self.master.filename:  # If the snapshot was written to the timetable file (rather than a copy), mark its revision as saved
+            self.saved_hash = None  # The hash of the saved data is recomputed from the file if it is needed
+            self.saved_revision = revision
+            self.saved_data = data
+            self.check_saved()  # Update the save buttons
+
+            ## Remove the recovery data that is included in the saved file
+            if self.journal.timetable_path != filename:  # If the timetable was saved as a new file, move the journal records to the new file’s journal
+                journal, self.journal = self.journal, Journal(filename)
+                self.journal.records = list(journal.records)
+                journal.discard()
+            self.journal.compact(revision)  # Remove the journal records made before the snapshot
+            if self.autosave_revision <= revision and os.path.exists(self.journal.autosave_path):  # Remove the autosave if it is older than the snapshot
+                os.remove(self.journal.autosave_path)
 
     def update_save_buttons(self) -> None:
         """
@@ -2544,19 +2323,126 @@ class TimeTable:
         self.saveas_button.configure(state=state)
         self.save_button.configure(state=state)
 
-    def check_saved(self, json_data: str) -> bool:
+    def mark_changed(self, *parts: str) -> None:
+        """
+        Record a modification to the timetable data and update the save state.
+        Called by every action that edits the classes, class mapping, events, or term length.
+
+        :param parts: The parts of the timetable data that were modified ('classes', 'mapping', 'events', 'term'). Changes to the classes, class mapping, and term length are recorded in the journal.
+        """
+
+        self.revision += 1  # Increment the revision counter
+
+        if self.events_saved:  # Only update the save buttons when the save state changes
+            self.events_saved = False
+            self.update_save_buttons()
+
+        if 'classes' in parts or 'mapping' in parts:  # Record the change to the classes in the journal
+            self.journal_pending['classes'] = True
+        if 'term' in parts:  # Record the change to the term length in the journal
+            self.journal_pending['term'] = True
+        self.schedule_journal()
+
+    def mark_event_changed(self, event, deleted: bool = False) -> None:
+        """
+        Record a modification to an event and update the save state.
+
+        :param event: (Event) The event that was created, edited, or deleted
+        :param deleted: Whether the event was deleted
+        """
+
+        self.journal_pending[(event.week, event.day, event.session)] = None if deleted else event  # Only the latest change to each event is written to the journal
+        self.mark_changed('events')
+
+    def schedule_journal(self) -> None:
+        """
+        Schedule the pending changes to be written to the journal, and schedule an autosave snapshot.
+        Both are delayed until the user stops editing, so that a burst of edits (e.g.: typing) is written as a single journal record.
+        """
+
+        if self.journal_after is not None:
+            self.display_frame.after_cancel(self.journal_after)
+        self.journal_after = self.display_frame.after(1000, self.flush_journal)
+
+        if self.autosave_after is not None:
+            self.display_frame.after_cancel(self.autosave_after)
+        self.autosave_after = self.display_frame.after(30000, self.autosave)
+
+    def flush_journal(self) -> None:
+        """ Write the pending changes to the journal """
+
+        if self.journal_after is not None:
+            self.display_frame.after_cancel(self.journal_after)
+            self.journal_after = None
+
+        if not self.journal_pending:
+            return
+
+        ## Convert the pending changes to journal records
+        records = []
+        for key, value in self.journal_pending.items():
+            if key == 'classes':
+                records.append({'op': 'classes', **self.model.get_class_data()})
+            elif key == 'term':
+                records.append({'op': 'term', 'num_weeks': self.num_weeks})
+            elif value is None:
+                records.append({'op': 'delete_event', 'week': key[0], 'day': key[1], 'session': key[2]})
+            else:
+                records.append({'op': 'event', 'data': value.get_data()})
+
+        self.journal_pending.clear()
+
+        try:
+            self.journal.append(records, self.revision)
+        except OSError:  # The journal is only used for recovery, so failing to write it should not interrupt the user
+            pass
+
+    def autosave(self) -> None:
+        """ Write a snapshot of the timetable data to the autosave file, so that the journal can be compacted """
+
+        self.autosave_after = None
+        self.flush_journal()
+
+        if self.revision in (self.saved_revision, self.autosave_revision):  # If the snapshot would not contain any new changes, there is no need to write it
+            return
+
+        chunks = list(iter_timetable_json(self.model.get_data()))
+        self.master.save_engine.submit(self.journal.autosave_path, chunks, token=(self.load_id, self.revision, None))
+        self.master.poll_saves()
+
+    @staticmethod
+    def hash_json(json_data: str) -> str:
+        """
+        Get a hash of JSON formatted timetable data, ignoring indentation and line breaks.
+
+        :param json_data: The JSON formatted timetable data to hash
+        :return: The hex digest of the data
+        """
+
+        return hashlib.sha1(multireplace(json_data, {'\n': '', '    ': '', '\t': ''}).encode('utf-8')).hexdigest()
+
+    def check_saved(self, deep: bool = False) -> bool:
         """
         Check if the current timetable data matches the saved timetable data.
 
-        :param json_data: The JSON formatted timetable data to check
+        :param deep: Whether to compare the contents of the timetable if the revision has changed since the last save.
+                     This detects edits that have been reverted by the user, but requires serialising the timetable.
+        :return: Whether the timetable is saved
         """
 
-        if self.current_savefile_contents is None:  # If the savefile contents string is empty, set its value to the contents of the existing timetable data file
-            with open(self.master.filename, encoding='utf-8') as file:
-                self.current_savefile_contents = multireplace(''.join(file.readlines()), {'\n': '', '    ': '', '\t': ''})
+        if self.revision != self.saved_revision and deep:  # If the data has been modified, compare the hash of the current data to the hash of the saved data
+            if self.saved_hash is None:  # If the saved data has not been hashed, hash the contents of the existing timetable data file
+                with open(self.master.filename, encoding='utf-8') as file:
+                    self.saved_hash = self.hash_json(file.read())
+
+            if self.hash_json(self.model.get_json()) == self.saved_hash:  # If the modifications have been reverted, mark the current revision as saved
+                self.saved_revision = self.revision
+
+        saved = self.revision == self.saved_revision  # Check if the current revision has been saved
+        if saved != self.events_saved:  # Update the state of the `save` and `save as` buttons if the save state has changed
+            self.events_saved = saved
+            self.update_save_buttons()
 
-        self.events_saved = multireplace(json_data, {'\n': '', '    ': '', '\t': ''}) == self.current_savefile_contents  # Check if the saved timetable matches the current timetable
-        self.update_save_buttons()  # Update the state of the `save` and `save as` buttons
         return self.events_saved  # Return the result
 
     def edit_event_type(self) -> None:
@@ -2565,13 +2451,21 @@ class TimeTable:
         """
         ## Todo: update bg formatting of cells with events
 
-        self.check_saved(self.get_json())  # Check if the file is saved to update the save/saveas buttons
-        self.week_elems[self.week].edit_event_type(self.active_cell.current_event)  # Update the event type count for the selected event’s week.
-
         if self.active_cell is not None and self.active_cell.current_event is not None:  # If a cell is selected which has an event
-            self.active_cell.events_indicator.configure(image=self.master.icons[self.active_cell.current_event.type()])  # Update the displayed event type icon for the cell
-            if self.active_cell.current_event.display_widget is not None:  # If the active cell’s current event has an upcoming event widget, update the formatting of said widget.
-                self.active_cell.current_event.display_widget.update_event_type()
+            event = self.active_cell.current_event
+
+            num_types = len(self.event_types)
+            event.set_type(event.type_variable().get())  # Copy the selected type to the event
+            if len(self.event_types) > num_types:  # If the type was not registered yet, create its icon and add it to the type picker
+                self.master.load_event_type_icons(self.event_types)
+                self.event_type_combobox.configure(values=self.event_types.names)
+
+            self.mark_event_changed(event)  # Update the save state of the timetable
+            self.events.retype(event)  # Update the event type counts for the selected event’s week.
+
+            self.active_cell.set_indicator(event.type_id)  # Update the displayed event type icon for the cell
+            if event.display_widget is not None:  # If the active cell’s current event has an upcoming event widget, update the formatting of said widget.
+                event.display_widget.update_event_type()
 
     def get_session_index(self, timeslot: int = None) -> int | None:
         """
@@ -2581,24 +2475,7 @@ class TimeTable:
         :return: The session index corresponding to the input timeslot
         """
 
-        ## Get the timeslot
-        if timeslot is None:
-            timeslot = self.timeslot_idx
-
-        if timeslot == len(self.sessions) or timeslot in self.session_break_idxs[0]:  # Check if the current timeslot is a break or is not displayed on the table
-            return None
-        else:
-            return timeslot - sum(map(lambda v: timeslot > v, self.session_break_idxs[0]))  # Otherwise, subtract the offset caused by the session breaks
-
-    def get_timeslot_index(self, session: int) -> int | None:
-        """
-        Get the timeslot index corresponding to the input session
-
-        :param session: The input session to process.
-        :return: The timeslot index corresponding to the input session
-        """
-
-        return session + sum(map(lambda v: session > v, self.session_break_idxs[1]))  # Add the offset caused by the session breaks and return the result
+        return self.model.get_session_index(self.timeslot_idx if timeslot is None else timeslot)
 
     def update_week(self, value: str | int) -> None:
         """
@@ -2607,21 +2484,31 @@ class TimeTable:
         :param value: The index of the new week to use
         """
 
-        events = list(filter(lambda v: v.week in [int(value), self.week], self.events))  # Get all events that occur in the current and new week
-
-        ## Configure the formatting of the week displays to match the new week
-        self.week_elems[self.week].numlabel.configure(font=('Arial', 11))
-        self.week_elems[int(value)].numlabel.configure(font=('Arial', 11, 'bold'))
+        old_events = self.events.week(self.week)  # Get the events that occur in the current week
+        new_events = self.events.week(int(value))  # Get the events that occur in the new week
 
+        old_week = self.week
         self.week = int(value)  # Convert the value string returned by the slider element to an integer and update the current week number
 
-        ## Iterate through events that occur in the new and current weeks and update the associated cells
-        for event in events:
-            cell = self.tt_elements[event.day][event.session]
-            cell.update_event()
+        ## Configure the formatting of the week displays to match the new week and scroll the new week into view
+        self.refresh_week(old_week)
+        self.refresh_week(self.week)
+        self.week_strip.see(self.week)
+
+        ## Update the cells whose displayed event changes between the current and new weeks in a single pass
+        update_active = False
+        for day, session in old_events.keys() | new_events.keys():
+            cell = self.tt_elements[day][session]
+            event = new_events.get((day, session))
+            if cell.current_event is not event:
+                cell.set_event(event)
+                update_active |= cell.state == 'active'
+
+        if update_active:  # Only update the root’s active event once, if the active cell changed
+            self.update_active_event()
 
         ## Update the data displayed on the timetable
-        if self.week != self.get_week(datetime.datetime.now().timestamp()):  # If the current displayed week is not the actual week
+        if self.week != self.model.get_week(datetime.datetime.now().timestamp()):  # If the current displayed week is not the actual week
             if self.current_session_marker.grid_info():  # If the timeslot marker is displayed, hide it and reset the formatting of the active headers
                 self.current_session_marker.grid_remove()
                 session = self.get_session_index()
@@ -2637,6 +2524,144 @@ class TimeTable:
                     self.session_headers[session].configure(**self.active_header_config)
                 self.dotw_headers[self.day].configure(**self.active_header_config)
 
+    def refresh_week(self, week: int) -> None:
+        """
+        Update the week display of a week
+
+        :param week: The week number to update
+        """
+
+        if 0 <= week < len(self.week_strip.items):
+            self.week_strip.update_item(week)
+
+    def week_counts_changed(self, weeks: set[int]) -> None:
+        """
+        Update the event type counters of the displayed weeks. Called by the event store when its type counts change.
+
+        :param weeks: The week numbers whose type counts changed
+        """
+
+        for week, row in self.week_strip.visible_rows():  # Weeks that are not displayed are updated when they are scrolled into view
+            if week in weeks:
+                row.update_counts()
+
+    def scroll_weeks(self, event: tk.Event) -> str:
+        """
+        Scroll the week strip with the mousewheel
+
+        :param event: The mousewheel event
+        """
+
+        self.week_strip.canvas.yview_scroll(round(event.delta / -120), 'units')
+        return 'break'  # Prevent the other scrollable frames from scrolling
+
+    def change_term_length(self) -> None:
+        """ Prompt the user for the number of weeks in the term and update the week displays accordingly """
+
+        num_weeks = sd.askinteger('Term Length', 'Enter the number of weeks in the term:', initialvalue=self.num_weeks, minvalue=1, maxvalue=104, parent=self.master)
+        if num_weeks is None or num_weeks == self.num_weeks:  # If the user pressed cancel or did not change the term length
+            return
+
+        self.num_weeks = num_weeks
+        self.week_slider.configure(to=self.num_weeks - 1)
+        self.week_strip.set_items(range(self.num_weeks))
+
+        if self.week >= self.num_weeks:  # If the displayed week is no longer in the term, display the last week
+            self.week_slider.set(self.num_weeks - 1)
+        else:
+            self.week_strip.see(self.week)
+
+        self.mark_changed('term')
+
+    def create_upcoming_row(self, master, kind: Literal['header', 'event']) -> UpcomingEventHeader | UpcomingEvent:
+        """
+        Create a widget to display items in the upcoming events list
+
+        :param master: The parent widget
+        :param kind: The kind of item the widget displays
+        """
+
+        if kind == 'header':
+            return UpcomingEventHeader(self, master)
+        return UpcomingEvent(self, None, master)
+
+    def schedule_due_update(self, widget: UpcomingEvent, deadline: float) -> None:
+        """
+        Schedule an upcoming event widget’s 'time until due' display to be refreshed.
+        Replaces any refresh already scheduled for the widget.
+
+        :param widget: The widget to refresh
+        :param deadline: The timestamp at which to refresh the widget
+        """
+
+        widget.due_deadline = deadline  # Older heap entries for the widget no longer match, so they are skipped when they are popped
+        heapq.heappush(self.due_heap, (deadline, next(self.due_counter), widget))
+
+        ## If the widget is due before the scheduled refresh, reschedule the timer
+        if self.due_after_deadline is None or deadline < self.due_after_deadline:
+            self.schedule_due_timer()
+
+    def schedule_due_timer(self) -> None:
+        """ Schedule the timer for the earliest deadline in the heap """
+
+        if self.due_after is not None:
+            self.display_frame.after_cancel(self.due_after)
+            self.due_after = None
+            self.due_after_deadline = None
+
+        ## Discard the entries of widgets that have been hidden or rescheduled
+        while self.due_heap and self.due_heap[0][2].due_deadline != self.due_heap[0][0]:
+            heapq.heappop(self.due_heap)
+
+        if not self.due_heap:
+            return
+
+        deadline = self.due_heap[0][0]
+        after_ms = max(int((deadline - time.time()) * 1000) + 1, 0)  # Round up, so the timer does not fire before the display changes
+
+        self.due_after = self.display_frame.after(after_ms, self.update_due_times)
+        self.due_after_deadline = deadline
+
+    def update_due_times(self) -> None:
+        """ Refresh every upcoming event widget whose deadline has passed in a single pass, then schedule the timer for the next deadline """
+
+        self.due_after = None
+        self.due_after_deadline = None
+
+        now = time.time()
+        try:
+            while self.due_heap and self.due_heap[0][0] <= now:
+                deadline, _, widget = heapq.heappop(self.due_heap)
+                if widget.due_deadline == deadline:  # Skip widgets that have been hidden or rescheduled since the entry was added
+                    try:
+                        widget.update_due_time(now)
+                    except Exception:  # Log the error and keep refreshing the other widgets, so one widget cannot stop every countdown
+                        print(format_exc(), file=sys.stderr)
+        finally:
+            self.schedule_due_timer()  # Always re-arm the shared timer
+
+    @staticmethod
+    def upcoming_row_height(item: tuple[int, int] | Event) -> int:
+        """
+        Estimate the height of an item in the upcoming events list, before it is displayed
+
+        :param item: The item to estimate the height of
+        """
+
+        if isinstance(item, tuple):
+            return 44
+        return 178 + 18 * item.text.count('\n')
+
+    def upcoming_index(self, timeslot: tuple[int, int, int]) -> int:
+        """
+        Get the index of the first item in the upcoming events list at or after a timeslot.
+        Headers are ordered before the events on their day.
+
+        :param timeslot: The timeslot in (week, day, session) format. Use a session number of -1 to find the header of a day.
+        """
+
+        return bisect.bisect_left(self.upcoming_events_frame.items, timeslot, key=lambda v: (*v, -1) if isinstance(v, tuple) else v.timeslot)
+
     def create_event(self) -> None:
         """
         Create an event for the current selected cell
@@ -2644,51 +2669,28 @@ class TimeTable:
 
         ## TODO: test behaviour when an event already exists
         if self.active_cell is not None:  # If a cell is selected
-            event = Event(self, self.week, self.active_cell.day, self.active_cell.session, '', None, 'Event', 'Untitled Event')  # Create an event
-            self.events.append(event)  # Add the new event object to the event list
-            self.events.sort(key=list)  # Sort the list of events by their timeslot obtained by converting the event to an iterable
+            event = self.model.create_event(self.week, self.active_cell.day, self.active_cell.session)  # Create an untitled event
+            idx = self.events.add(event)  # Add the new event object to the event store and get its index in timeslot order
             self.active_cell.set_event(event)  # Set the event of the current cell to the newly created event
             self.update_active_event()  # Update the timetable’s active event
             self.event_entry.focus_set()  # Set the focus into the event text entry widget
-            self.check_saved(self.get_json())  # Update the save state for the timetable
-            self.week_elems[self.week].add_event(event)  # Add the event to its corresponding week to update the appropriate event type counter
-
-            ## If the event has not already passed, insert it into the upcoming event widgets at the appropriate index
-            if event >= (self.week, self.day, self.get_session(datetime.datetime.now())):
-                move_widgets = list(filter(lambda v: event <= v.event, self.upcoming_events))  # Get the upcoming event widgets that occur after the event
-
-                ## Remove all the widgets that occur after the newly created event from the geometry manager
-                for i in move_widgets:
-                    i.pack_forget()
+            self.mark_event_changed(event)  # Update the save state for the timetable
 
+            ## If the event has not already passed, insert it into the upcoming events list at the appropriate index
+            if idx >= self.events.bisect(self.week, self.day, self.model.get_session(datetime.datetime.now()) or 0):
                 ## Todo: notifications and reminders for events
                 ## Todo: event priorities
 
-                ## Create an upcoming event widget and add it to the geometry manager
-                if (event.week, event.day) not in self.upcoming_event_headers:  # If there is not a header for the event’s day and week number
-                    ## Create a header frame and add it to the scrollable frame
-                    header = tk.Frame(self.upcoming_events_frame.frame, background='#4F565E')
-                    header.event = (event.week, event.day, 0)  # Set the event data used to compare event times for the header widget
-                    header.pack(side='top', expand=True, fill='x', padx=(1, 1), pady=(20, 0))
-
-                    ## Add a label to the header frame
-                    tk.Label(header, text=f'{["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][event.day]} Week {event.week}', background='#66587D', foreground='#D8DEE9', font=('Calibri', 13, 'bold'), image=self.master.pixel, compound='center', height=20).pack(side='left', expand=True, fill='x', padx=(1, 1), pady=1)
-                    tk.Label(header, background='#c678dd', image=self.master.pixel, compound='center', width=46, height=20).pack(side='left', padx=(0, 1), pady=1)
-
-                    self.upcoming_events.append(header)  # Add the header to the list of upcoming event widgets
-                    self.upcoming_event_headers.update({(event.week, event.day): header})  # Add the header to the header dictionary keyed by the day and week number
-
-                ## Create an upcoming event widget for the event
-                upcoming_event = UpcomingEvent(self, event, self.upcoming_events_frame.frame)
-                upcoming_event.pack(side='top', expand=True, fill='x', padx=(1, 1), pady=(10, 0))
+                position = self.upcoming_index(event.timeslot)
+                header_position = self.upcoming_index((event.week, event.day, -1))
 
-                event.display_widget = upcoming_event  # Set the new event’s display widget
+                ## If there is not a header for the event’s day and week number, add one before the event
+                items = self.upcoming_events_frame.items
+                if header_position == len(items) or not isinstance(items[header_position], tuple):
+                    self.upcoming_events_frame.insert(position, (event.week, event.day))
+                    position += 1
 
-                self.upcoming_events.insert(len(self.upcoming_events) - len(move_widgets), upcoming_event)  # Insert the upcoming event widget into the list at the appropriate index
-
-                ## Re-add the upcoming event widget to the geometry manager
-                for i in move_widgets:
-                    i.pack(side='top', expand=True, fill='x', padx=(1, 1), pady=(10, 0))
+                self.upcoming_events_frame.insert(position, event)
 
     def _proxy(self, *args: tuple[Any]) -> Any:
         """ Called whenever an event occurs in the element. Raises an '<<Edit>>' event when the text is edited and a '<<Change>> event when the cursor is moved'. """
@@ -2723,84 +2725,65 @@ class TimeTable:
 
         if self.active_cell is not None and self.active_cell.current_event is not None:  # If the selected cell with an event
             event = self.active_cell.current_event  # Get the event object of the selected cell
-            self.events.remove(event)  # Remove the event from the event list
-            self.week_elems[self.week].remove_event(event)  # Remove the event from the stored events in the week element corresponding to the event’s week
+            self.events.remove(event)  # Remove the event from the event store
             self.active_cell.set_event(None)  # Reset the selected cell’s current event
             self.update_active_event()  # Update the timetable’s displayed event
-            self.check_saved(self.get_json())  # Update the timetable’s save-state
+            self.mark_event_changed(event, deleted=True)  # Update the timetable’s save-state
 
-            if event.display_widget is not None:  # If the deleted event has a display widget
-                ## If the deleted event is the only one on the day, remove the header element associated with the event’s week and day
-                if not any([isinstance(v, UpcomingEvent) and v.event.day == event.day and v.event.week == event.week for v in self.upcoming_events]):
-                    elem = self.upcoming_event_headers.pop((event.week, event.day))
-                    self.upcoming_events.remove(elem)
-                    elem.destroy()
+            ## If the deleted event is in the upcoming events list, remove it
+            items = self.upcoming_events_frame.items
+            position = self.upcoming_index(event.timeslot)
+            if position < len(items) and items[position] is event:
+                self.upcoming_events_frame.remove(position)
 
-                self.upcoming_events.remove(event.display_widget)  # Remove the display widget from the list of upcoming event widgets
-                event.display_widget.destroy()  # Destroy the display widget
+                ## If the deleted event was the only one on the day, remove the header for the day
+                if isinstance(items[position - 1], tuple) and (position == len(items) or isinstance(items[position], tuple)):
+                    self.upcoming_events_frame.remove(position - 1)
 
-    def get_json(self) -> str:
+    def update_button_states(self) -> None:
         """
-        Get the JSON formatted text representing the timetable data
+        Update the save state of the timetable and update the state of the save and saveas buttons
         """
 
-        ## Todo: behaviour when quoting characters are in text
-        ## Todo: add all day events / allow the user to specify event duration
-
-        ## Get the name, room, and teacher of each class
-        classes, rooms, teachers = swapaxes([list(v) for v in self.classes])
-
-        ## Initiate a buffer with the names, rooms, and events of each class represented in JSON format
-        buffer = (
-            '{\n'
-            f'    "classes": {list(classes)},\n'
-            f'    "teachers": {list(teachers)},\n'
-            f'    "rooms": {list(rooms)},\n'
-            '    "timetable": [\n'
-        ).replace("'", '"')
+        if self.pause_text_event:  # If text events are paused, unpause them and skip the rest of the function
+            self.pause_text_event = False
+            return
 
-        ## Add the class mapping to the buffer
-        for i in self.class_mapping:
-            buffer += f'        {i},\n'
+        if self.active_cell is not None and self.active_cell.current_event is not None:  # If a cell is selected with an event
+            event = self.active_cell.current_event
+            text = self.event_entry.get(1.0, tk.END).strip('\n')  # Get the text currently in the event text entry
 
-        ## Add the 'events' key to the buffer
-        buffer = buffer[:-2] + '\n    ],\n    "events": ['
+            if text != event.text:  # If the text has been edited, update the event’s text and the timetable’s save-state
+                event.text = text
+                if event.display_widget is not None:  # If the selected cell’s event has an upcoming event widget, update the text of said widget.
+                    self.upcoming_events_frame.update_item(self.upcoming_index(event.timeslot))
+                self.mark_event_changed(event)
 
-        ## Add the events to the buffer
-        for num, event in enumerate(self.events):  # Iterate through all of the stored events
-            buffer += ',' if buffer[-1] == '}' else ''  # Add a comma to the buffer
-            event_data = []  # Define an empty list to store the lines of event data
-            for k, v in event.get_data().items():  # Get the event data from the event and add each item to the event data list as a string
-                event_data.append(f'"{k}": {v}')
-            buffer += f'\n        {{\n            ' + ',\n            '.join(event_data) + '\n        }'  # Add the event data to the buffer with the appropriate formatting
+    def add_class(self, name: str, room: str, teacher: str) -> TimetableClass:
+        """
+        Create a new class and add it to the list of classes
 
-        ## .replace("'", '"')
-        buffer += '\n    ],\n    "sessions": [\n'  # Add the 'sessions' key to the buffer
+        :param name: The name of the class
+        :param room: The name/number of the class’s room
+        :param teacher: The name of the class’s teacher
+        :return: The new class
+        """
 
-        session_data = []  # Define a list to store the lines of session data
-        for session, time in zip(self.sessions, self.sessiontimes[1:]):  # Iterate through each session
-            session_data.append(f'        ["{session[0]}", {"true" if session[1] else "false"}, "' + (f'{time[0]:>02n}:{time[1]:<02n}' if time[0] != -1 else '-1') + '"]')  # Add the formatted session data to the list
-        buffer += ',\n'.join(session_data)  # Add the session data to the buffer with the appropriate formatting
-        buffer += f'\n    ],\n    "day_start": "{self.day_start_time}",\n    "start_date_timestamp": {self.start_timestamp}\n}}'  # Add the day and term start times to the buffer
-        return buffer  # Return the result
+        tt_class = TimetableClass(self, self.model.add_class(name, room, teacher))
+        self.classes.append(tt_class)
+        self.classes_by_id[tt_class.id] = tt_class
+        return tt_class
 
-    def update_button_states(self) -> None:
-        """
-        Update the save state of the timetable and update the state of the save and saveas buttons
+    def map_class(self, cell: TimetableCell, tt_class: Optional[TimetableClass]) -> None:
         """
+        Map a class to the timeslot of a cell
 
-        if self.active_cell is not None and self.active_cell.current_event is not None:  # If a cell is selected with an event
-            self.active_cell.current_event.text = self.event_entry.get(1.0, tk.END).strip('\n')  # Set the cell’s event’s text to the text currently in the event text entry
-            if self.active_cell.current_event.display_widget is not None:  # If the selected cell’s event has an upcoming event widget, update the text of said widget.
-                self.active_cell.current_event.display_widget.event_text_display.configure(text=self.active_cell.current_event.text)
+        :param cell: The cell to map the class to
+        :param tt_class: The class to map, or None to leave the timeslot empty
+        """
 
-        if self.pause_text_event:  # If text events are paused, unpause them and skip the rest of the function
-            self.pause_text_event = False
-        else:  # Otherwise, update the save state of the timetable
-            if self.event_entry.get(1.0, tk.END).strip('\n') != self.active_cell.current_event.text.strip('\n'):
-                self.events_saved = False
-            else:
-                self.check_saved(self.get_json())
+        self.model.map_class(cell.day, cell.session, None if tt_class is None else tt_class.data)
+        cell.update_mapped_class(tt_class)
 
     def edit_class_names(self) -> None:
         """
@@ -2809,7 +2792,7 @@ class TimeTable:
 
         values = [v.name_disp.get() for v in self.classes]  # Get all the stored class names
         self.class_name_combobox.configure(values=values)  # Update the list of possible values in the combobox
-        self.check_saved(self.get_json())  # Update the timetable’s save-state
+        self.mark_changed('classes')  # Update the timetable’s save-state
 
     def new_class(self) -> None:
         """
@@ -2819,15 +2802,14 @@ class TimeTable:
         ## Todo: implement timetable_class class
 
         idx = len(self.classes)  # Get the index of the new class
-        self.classes.append(TimetableClass(self, f'<Class-{idx}>', '', ''))
-        self.active_cell.update_mapped_class(self.classes[-1])  # Update the class data mapping of the current cell
+        self.map_class(self.active_cell, self.add_class(f'<Class-{idx}>', '', ''))  # Update the class data mapping of the current cell
 
         self.class_name_combobox.configure(values=[v.name_disp.get() for v in self.classes])
         self.class_name_combobox.current(idx)  # Set the value of the class selector combobox to the new class
 
         self.update_active_event()
 
-        self.check_saved(self.get_json())  # Update the timetable’s save-state
+        self.mark_changed('classes', 'mapping')  # Update the timetable’s save-state
 
     def delete_class(self, confirm: bool = True) -> None:
         """
@@ -2844,7 +2826,7 @@ class TimeTable:
         tt_class.destroy()  # Destroy the deleted class
 
         self.class_name_combobox.set('')  # Delete the contents of the class name selection combobox
-        self.check_saved(self.get_json())  # Update the save state of the timetable
+        self.mark_changed('classes', 'mapping')  # Update the save state of the timetable
 
         ## Clear the class data entries
         self.name_entry.configure(textvariable=self.empty_text_variable, state='disabled')
@@ -2868,13 +2850,11 @@ class TimeTable:
             self.class_name_combobox.current(self.active_cell.tt_class.get_idx())  # Set the value of the class selection combobox to the class mapping of the selected cell
         else:
             # self.active_cell.class_data_idx = self.class_name_combobox.current()  # Set the mapping of the selected cell to the value of the class selection combobox
-            self.active_cell.update_mapped_class(self.classes[idx])
-
-        self.class_mapping[self.active_cell.day][self.active_cell.session] = idx  # Update the class mapping of the current cell in the mapping table.
+            self.map_class(self.active_cell, self.classes[idx])  # Update the class mapping of the current cell
 
         self.update_active_event()
 
-        self.check_saved(self.get_json())  # Update the save state of the timetable
+        self.mark_changed('mapping')  # Update the save state of the timetable
 
     def update_active_event(self) -> None:
         """
@@ -2929,9 +2909,9 @@ class TimeTable:
 
             ## Enable the 'delete event' button and the event type picker. Update the current value of the event type picker.
             self.delete_button.configure(state='normal')
-            self.event_type_combobox.configure(state='normal', textvariable=self.active_cell.current_event.event_type)
+            self.event_type_combobox.configure(state='readonly', textvariable=self.active_cell.current_event.type_variable())  # Only registered types can be picked, so typing a name does not register a type for each keystroke
 
-            self.event_title_entry.configure(textvariable=self.active_cell.current_event.title)  # Set the text variable of the event title entry to the event’s title string var.
+            self.event_title_entry.configure(textvariable=self.active_cell.current_event.title_variable())  # Set the text variable of the event title entry to the event’s title string var.
 
             self.pause_text_event = True  # Pause text events
 
@@ -2940,6 +2920,8 @@ class TimeTable:
         Define what happens when the class is deleted
         """
 
+        self.unload()  # Write any pending changes to the journal and stop the scheduled updates
+
         self.display_frame.destroy()  # Close the window
         del self  # Remove the class from memory
 
@@ -2967,69 +2949,11 @@ class Window(tk.Tk):
 
         self.pixel = tk.PhotoImage(width=1, height=1)  # Create a transparent 1px by 1px image. When used as the image for a widget such as a button or label, it allows for the size of said widget to be adjusted in pixels rather than arbitrary units.
 
-        ## Load the SVG icons stored on disk to a dictionary
-        self.icons = load_images(
-            [
-                ('icons/dotpoints.svg', 'dotpoints', 18),
-                ('icons/numbering3.svg', 'numbering', 18),
-                ('icons/lettering.svg', 'lettering', 18),
-
-                ('icons/calendar.svg', 'calendar', 20),
-                ('icons/saveas.svg', 'saveas', 20),
-                ('icons/savecopy.svg', 'savecopy', 20),
-                ('icons/new_timetable.svg', 'new', 23),
-                ('icons/import.svg', 'import', 20),
-                ('icons/export.svg', 'export', 20),
-                ('icons/pdf_icon.svg', 'pdf', 20),
-                ('icons/xls_icon.svg', 'xls', 20),
-                ('icons/csv_icon.svg', 'csv', 20),
-                ('icons/help_icon.svg', 'help', 20),
-                ('icons/about_icon.svg', 'about', 20),
-                ('icons/win_icon2.svg', 'window_icon2', 64),
-                ('icons/Upcoming3.svg', 'passed-event', 20),
-                ('icons/passed2.svg', 'upcoming-event', 20)
-            ]
-        )
-
-        ## Add the other SVGs to the icon dictionary
-        self.icons.update(
-            {
-                ## Event type icons for display
-                'Event': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#e06c75"><path d="M504 256c0 136.997-111.043 248-248 248S8 392.997 8 256C8 119.083 119.043 8 256 8s248 111.083 248 248zm-248 50c-25.405 0-46 20.595-46 46s20.595 46 46 46 46-20.595 46-46-20.595-46-46-46zm-43.673-165.346l7.418 136c.347 6.364 5.609 11.346 11.982 11.346h48.546c6.373 0 11.635-4.982 11.982-11.346l7.418-136c.375-6.874-5.098-12.654-11.982-12.654h-63.383c-6.884 0-12.356 5.78-11.981 12.654z"/></svg>', scaletowidth=10),
-                'Info': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#528bff"><path d="M256 8C119.043 8 8 119.083 8 256c0 136.997 111.043 248 248 248s248-111.003 248-248C504 119.083 392.957 8 256 8zm0 110c23.196 0 42 18.804 42 42s-18.804 42-42 42-42-18.804-42-42 18.804-42 42-42zm56 254c0 6.627-5.373 12-12 12h-88c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h12v-64h-12c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h64c6.627 0 12 5.373 12 12v100h12c6.627 0 12 5.373 12 12v24z"/></svg>', scaletowidth=12),
-                'Reminder': tksvg.SvgImage(data=b'<svg viewBox="0 0 448 512" fill="#56b6c2"><path d="M224 512c35.32 0 63.97-28.65 63.97-64H160.03c0 35.35 28.65 64 63.97 64zm215.39-149.71c-19.32-20.76-55.47-51.99-55.47-154.29 0-77.7-54.48-139.9-127.94-155.16V32c0-17.67-14.32-32-31.98-32s-31.98 14.33-31.98 32v20.84C118.56 68.1 64.08 130.3 64.08 208c0 102.3-36.15 133.53-55.47 154.29-6 6.45-8.66 14.16-8.61 21.71.11 16.4 12.98 32 32.1 32h383.8c19.12 0 32-15.6 32.1-32 .05-7.55-2.61-15.27-8.61-21.71z"/></svg>', scaletowidth=12),
-                'Bookmark': tksvg.SvgImage(data=b'<svg viewBox="0 0 384 512" fill="#98c379"><path d="M0 512V48C0 21.49 21.49 0 48 0h288c26.51 0 48 21.49 48 48v464L192 400 0 512z"/></svg>', scaletowidth=12),
-                'Assignment': tksvg.SvgImage(data=b'<svg viewBox="0 0 576 512" fill="#c678dd"><path d="M542.22 32.05c-54.8 3.11-163.72 14.43-230.96 55.59-4.64 2.84-7.27 7.89-7.27 13.17v363.87c0 11.55 12.63 18.85 23.28 13.49 69.18-34.82 169.23-44.32 218.7-46.92 16.89-.89 30.02-14.43 30.02-30.66V62.75c.01-17.71-15.35-31.74-33.77-30.7zM264.73 87.64C197.5 46.48 88.58 35.17 33.78 32.05 15.36 31.01 0 45.04 0 62.75V400.6c0 16.24 13.13 29.78 30.02 30.66 49.49 2.6 149.59 12.11 218.77 46.95 10.62 5.35 23.21-1.94 23.21-13.46V100.63c0-5.29-2.62-10.14-7.27-12.99z"/></svg>', scaletowidth=12),
-                'Test': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#abb2bf"><path d="M79.18 282.94a32.005 32.005 0 0 0-20.24 20.24L0 480l4.69 4.69 92.89-92.89c-.66-2.56-1.57-5.03-1.57-7.8 0-17.67 14.33-32 32-32s32 14.33 32 32-14.33 32-32 32c-2.77 0-5.24-.91-7.8-1.57l-92.89 92.89L32 512l176.82-58.94a31.983 31.983 0 0 0 20.24-20.24l33.07-84.07-98.88-98.88-84.07 33.07zM369.25 28.32L186.14 227.81l97.85 97.85 199.49-183.11C568.4 67.48 443.73-55.94 369.25 28.32z"/></svg>', scaletowidth=12),
-
-                ## Inverse 'masks' of the event icons for 'masking out' the background of the type display for the upcoming event widgets
-                'Event-Mask': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#303841"><path d="M504 256c0 136.997-111.043 248-248 248S8 392.997 8 256C8 119.083 119.043 8 256 8s248 111.083 248 248zm-248 50c-25.405 0-46 20.595-46 46s20.595 46 46 46 46-20.595 46-46-20.595-46-46-46zm-43.673-165.346l7.418 136c.347 6.364 5.609 11.346 11.982 11.346h48.546c6.373 0 11.635-4.982 11.982-11.346l7.418-136c.375-6.874-5.098-12.654-11.982-12.654h-63.383c-6.884 0-12.356 5.78-11.981 12.654z"/></svg>', scaletowidth=20),
-                'Info-Mask': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#303841"><path d="M256 8C119.043 8 8 119.083 8 256c0 136.997 111.043 248 248 248s248-111.003 248-248C504 119.083 392.957 8 256 8zm0 110c23.196 0 42 18.804 42 42s-18.804 42-42 42-42-18.804-42-42 18.804-42 42-42zm56 254c0 6.627-5.373 12-12 12h-88c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h12v-64h-12c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h64c6.627 0 12 5.373 12 12v100h12c6.627 0 12 5.373 12 12v24z"/></svg>', scaletowidth=20),
-                'Reminder-Mask': tksvg.SvgImage(data=b'<svg viewBox="0 0 448 512" fill="#303841"><path d="M224 512c35.32 0 63.97-28.65 63.97-64H160.03c0 35.35 28.65 64 63.97 64zm215.39-149.71c-19.32-20.76-55.47-51.99-55.47-154.29 0-77.7-54.48-139.9-127.94-155.16V32c0-17.67-14.32-32-31.98-32s-31.98 14.33-31.98 32v20.84C118.56 68.1 64.08 130.3 64.08 208c0 102.3-36.15 133.53-55.47 154.29-6 6.45-8.66 14.16-8.61 21.71.11 16.4 12.98 32 32.1 32h383.8c19.12 0 32-15.6 32.1-32 .05-7.55-2.61-15.27-8.61-21.71z"/></svg>', scaletowidth=20),
-                'Bookmark-Mask': tksvg.SvgImage(data=b'<svg viewBox="0 0 384 512" fill="#303841"><path d="M0 512V48C0 21.49 21.49 0 48 0h288c26.51 0 48 21.49 48 48v464L192 400 0 512z"/></svg>', scaletowidth=18),
-                'Assignment-Mask': tksvg.SvgImage(data=b'<svg viewBox="0 0 576 512" fill="#303841"><path d="M542.22 32.05c-54.8 3.11-163.72 14.43-230.96 55.59-4.64 2.84-7.27 7.89-7.27 13.17v363.87c0 11.55 12.63 18.85 23.28 13.49 69.18-34.82 169.23-44.32 218.7-46.92 16.89-.89 30.02-14.43 30.02-30.66V62.75c.01-17.71-15.35-31.74-33.77-30.7zM264.73 87.64C197.5 46.48 88.58 35.17 33.78 32.05 15.36 31.01 0 45.04 0 62.75V400.6c0 16.24 13.13 29.78 30.02 30.66 49.49 2.6 149.59 12.11 218.77 46.95 10.62 5.35 23.21-1.94 23.21-13.46V100.63c0-5.29-2.62-10.14-7.27-12.99z"/></svg>', scaletowidth=21),
-                'Test-Mask': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#303841"><path d="M79.18 282.94a32.005 32.005 0 0 0-20.24 20.24L0 480l4.69 4.69 92.89-92.89c-.66-2.56-1.57-5.03-1.57-7.8 0-17.67 14.33-32 32-32s32 14.33 32 32-14.33 32-32 32c-2.77 0-5.24-.91-7.8-1.57l-92.89 92.89L32 512l176.82-58.94a31.983 31.983 0 0 0 20.24-20.24l33.07-84.07-98.88-98.88-84.07 33.07zM369.25 28.32L186.14 227.81l97.85 97.85 199.49-183.11C568.4 67.48 443.73-55.94 369.25 28.32z"/></svg>', scaletowidth=20),
-
-                'restore': None,
-                'version': None,
-                'new_event': None,
-                'new_class': None,
-                'delete_event': None,
-                'delete_class': None,
-                'bug': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M256 0c53 0 96 43 96 96v3.6c0 15.7-12.7 28.4-28.4 28.4H188.4c-15.7 0-28.4-12.7-28.4-28.4V96c0-53 43-96 96-96zM41.4 105.4c12.5-12.5 32.8-12.5 45.3 0l64 64c.7 .7 1.3 1.4 1.9 2.1c14.2-7.3 30.4-11.4 47.5-11.4H312c17.1 0 33.2 4.1 47.5 11.4c.6-.7 1.2-1.4 1.9-2.1l64-64c12.5-12.5 32.8-12.5 45.3 0s12.5 32.8 0 45.3l-64 64c-.7 .7-1.4 1.3-2.1 1.9c6.2 12 10.1 25.3 11.1 39.5H480c17.7 0 32 14.3 32 32s-14.3 32-32 32H416c0 24.6-5.5 47.8-15.4 68.6c2.2 1.3 4.2 2.9 6 4.8l64 64c12.5 12.5 12.5 32.8 0 45.3s-32.8 12.5-45.3 0l-63.1-63.1c-24.5 21.8-55.8 36.2-90.3 39.6V240c0-8.8-7.2-16-16-16s-16 7.2-16 16V479.2c-34.5-3.4-65.8-17.8-90.3-39.6L86.6 502.6c-12.5 12.5-32.8 12.5-45.3 0s-12.5-32.8 0-45.3l64-64c1.9-1.9 3.9-3.4 6-4.8C101.5 367.8 96 344.6 96 320H32c-17.7 0-32-14.3-32-32s14.3-32 32-32H96.3c1.1-14.1 5-27.5 11.1-39.5c-.7-.6-1.4-1.2-2.1-1.9l-64-64c-12.5-12.5-12.5-32.8 0-45.3z"/></svg>', scaletowidth=20),
-                'feature': None,
-
-                'save': tksvg.SvgImage(data=b'<svg viewBox="0 0 448 512" fill="#D4D4D4"><path d="M48 96V416c0 8.8 7.2 16 16 16H384c8.8 0 16-7.2 16-16V170.5c0-4.2-1.7-8.3-4.7-11.3l33.9-33.9c12 12 18.7 28.3 18.7 45.3V416c0 35.3-28.7 64-64 64H64c-35.3 0-64-28.7-64-64V96C0 60.7 28.7 32 64 32H309.5c17 0 33.3 6.7 45.3 18.7l74.5 74.5-33.9 33.9L320.8 84.7c-.3-.3-.5-.5-.8-.8V184c0 13.3-10.7 24-24 24H104c-13.3 0-24-10.7-24-24V80H64c-8.8 0-16 7.2-16 16zm80-16v80H272V80H128zm32 240a64 64 0 1 1 128 0 64 64 0 1 1 -128 0z"/></svg>', scaletowidth=20),
-                'load': tksvg.SvgImage(data=b'<svg viewBox="0 0 576 512" fill="#D4D4D4"><path d="M88.7 223.8L0 375.8V96C0 60.7 28.7 32 64 32H181.5c17 0 33.3 6.7 45.3 18.7l26.5 26.5c12 12 28.3 18.7 45.3 18.7H416c35.3 0 64 28.7 64 64v32H144c-22.8 0-43.8 12.1-55.3 31.8zm27.6 16.1C122.1 230 132.6 224 144 224H544c11.5 0 22 6.1 27.7 16.1s5.7 22.2-.1 32.1l-112 192C453.9 474 443.4 480 432 480H32c-11.5 0-22-6.1-27.7-16.1s-5.7-22.2 .1-32.1l112-192z"/></svg>', scaletowidth=20),
-
-                'undo': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M48.5 224H40c-13.3 0-24-10.7-24-24V72c0-9.7 5.8-18.5 14.8-22.2s19.3-1.7 26.2 5.2L98.6 96.6c87.6-86.5 228.7-86.2 315.8 1c87.5 87.5 87.5 229.3 0 316.8s-229.3 87.5-316.8 0c-12.5-12.5-12.5-32.8 0-45.3s32.8-12.5 45.3 0c62.5 62.5 163.8 62.5 226.3 0s62.5-163.8 0-226.3c-62.2-62.2-162.7-62.5-225.3-1L185 183c6.9 6.9 8.9 17.2 5.2 26.2s-12.5 14.8-22.2 14.8H48.5z"/></svg>', scaletowidth=20),
-                'redo': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M463.5 224H472c13.3 0 24-10.7 24-24V72c0-9.7-5.8-18.5-14.8-22.2s-19.3-1.7-26.2 5.2L413.4 96.6c-87.6-86.5-228.7-86.2-315.8 1c-87.5 87.5-87.5 229.3 0 316.8s229.3 87.5 316.8 0c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0c-62.5 62.5-163.8 62.5-226.3 0s-62.5-163.8 0-226.3c62.2-62.2 162.7-62.5 225.3-1L327 183c-6.9 6.9-8.9 17.2-5.2 26.2s12.5 14.8 22.2 14.8H463.5z"/></svg>', scaletowidth=20),
-                'settings': tksvg.SvgImage(data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M352 320c88.4 0 160-71.6 160-160c0-15.3-2.2-30.1-6.2-44.2c-3.1-10.8-16.4-13.2-24.3-5.3l-76.8 76.8c-3 3-7.1 4.7-11.3 4.7H336c-8.8 0-16-7.2-16-16V118.6c0-4.2 1.7-8.3 4.7-11.3l76.8-76.8c7.9-7.9 5.4-21.2-5.3-24.3C382.1 2.2 367.3 0 352 0C263.6 0 192 71.6 192 160c0 19.1 3.4 37.5 9.5 54.5L19.9 396.1C7.2 408.8 0 426.1 0 444.1C0 481.6 30.4 512 67.9 512c18 0 35.3-7.2 48-19.9L297.5 310.5c17 6.2 35.4 9.5 54.5 9.5zM80 408a24 24 0 1 1 0 48 24 24 0 1 1 0-48z"/></svg>', scaletowidth=20),
-            }
-        )
-
         self.filename: Optional[str] = None
 
+        self.save_engine = SaveEngine()  # Writes timetable files on a worker thread
+        self.save_poll_after: Optional[str] = None
+
         self.popup_elem = None
         self.popup_after = None
         self.enable_popup_animation = True  # Set to `False` to disable popup animations
@@ -3059,6 +2983,55 @@ class Window(tk.Tk):
             with open('window_settings.json', encoding='utf-8') as winsettingsfile:  # Otherwise, load the window config JSON file to a dictionary
                 self.window_settings = json.load(winsettingsfile)
 
+        ## Add the SVG icons stored on disk to the icon dictionary. Each icon is loaded the first time it is used, and rasterised icons are cached on disk, so the SVGs are only rendered the first time they are loaded.
+        self.icon_cache = IconCache(ICON_CACHE_DIR, self.settings['ui_scaling'])
+        self.icons = LazyIconMap()
+        for file, name, width in [
+            ('icons/dotpoints.svg', 'dotpoints', 18),
+            ('icons/numbering3.svg', 'numbering', 18),
+            ('icons/lettering.svg', 'lettering', 18),
+
+            ('icons/calendar.svg', 'calendar', 20),
+            ('icons/saveas.svg', 'saveas', 20),
+            ('icons/savecopy.svg', 'savecopy', 20),
+            ('icons/new_timetable.svg', 'new', 23),
+            ('icons/import.svg', 'import', 20),
+            ('icons/export.svg', 'export', 20),
+            ('icons/pdf_icon.svg', 'pdf', 20),
+            ('icons/xls_icon.svg', 'xls', 20),
+            ('icons/csv_icon.svg', 'csv', 20),
+            ('icons/help_icon.svg', 'help', 20),
+            ('icons/about_icon.svg', 'about', 20),
+            ('icons/win_icon2.svg', 'window_icon2', 64),
+            ('icons/Upcoming3.svg', 'passed-event', 20),
+            ('icons/passed2.svg', 'upcoming-event', 20)
+        ]:
+            self.icons.add(name, partial(load_image, file, width, cache=self.icon_cache))
+
+        ## The event type icons, keyed by their SVG data and width, so that timetables with the same event types share the same images (see `load_event_type_icons`)
+        self.event_type_images: dict[tuple[bytes, int], tk.PhotoImage] = dict()
+
+        ## Add the other SVGs to the icon dictionary
+        self.icons.add_all(
+            {
+                'restore': None,
+                'version': None,
+                'new_event': None,
+                'new_class': None,
+                'delete_event': None,
+                'delete_class': None,
+                'bug': partial(self.icon_cache.get, data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M256 0c53 0 96 43 96 96v3.6c0 15.7-12.7 28.4-28.4 28.4H188.4c-15.7 0-28.4-12.7-28.4-28.4V96c0-53 43-96 96-96zM41.4 105.4c12.5-12.5 32.8-12.5 45.3 0l64 64c.7 .7 1.3 1.4 1.9 2.1c14.2-7.3 30.4-11.4 47.5-11.4H312c17.1 0 33.2 4.1 47.5 11.4c.6-.7 1.2-1.4 1.9-2.1l64-64c12.5-12.5 32.8-12.5 45.3 0s12.5 32.8 0 45.3l-64 64c-.7 .7-1.4 1.3-2.1 1.9c6.2 12 10.1 25.3 11.1 39.5H480c17.7 0 32 14.3 32 32s-14.3 32-32 32H416c0 24.6-5.5 47.8-15.4 68.6c2.2 1.3 4.2 2.9 6 4.8l64 64c12.5 12.5 12.5 32.8 0 45.3s-32.8 12.5-45.3 0l-63.1-63.1c-24.5 21.8-55.8 36.2-90.3 39.6V240c0-8.8-7.2-16-16-16s-16 7.2-16 16V479.2c-34.5-3.4-65.8-17.8-90.3-39.6L86.6 502.6c-12.5 12.5-32.8 12.5-45.3 0s-12.5-32.8 0-45.3l64-64c1.9-1.9 3.9-3.4 6-4.8C101.5 367.8 96 344.6 96 320H32c-17.7 0-32-14.3-32-32s14.3-32 32-32H96.3c1.1-14.1 5-27.5 11.1-39.5c-.7-.6-1.4-1.2-2.1-1.9l-64-64c-12.5-12.5-12.5-32.8 0-45.3z"/></svg>', scaletowidth=20),
+                'feature': None,
+
+                'save': partial(self.icon_cache.get, data=b'<svg viewBox="0 0 448 512" fill="#D4D4D4"><path d="M48 96V416c0 8.8 7.2 16 16 16H384c8.8 0 16-7.2 16-16V170.5c0-4.2-1.7-8.3-4.7-11.3l33.9-33.9c12 12 18.7 28.3 18.7 45.3V416c0 35.3-28.7 64-64 64H64c-35.3 0-64-28.7-64-64V96C0 60.7 28.7 32 64 32H309.5c17 0 33.3 6.7 45.3 18.7l74.5 74.5-33.9 33.9L320.8 84.7c-.3-.3-.5-.5-.8-.8V184c0 13.3-10.7 24-24 24H104c-13.3 0-24-10.7-24-24V80H64c-8.8 0-16 7.2-16 16zm80-16v80H272V80H128zm32 240a64 64 0 1 1 128 0 64 64 0 1 1 -128 0z"/></svg>', scaletowidth=20),
+                'load': partial(self.icon_cache.get, data=b'<svg viewBox="0 0 576 512" fill="#D4D4D4"><path d="M88.7 223.8L0 375.8V96C0 60.7 28.7 32 64 32H181.5c17 0 33.3 6.7 45.3 18.7l26.5 26.5c12 12 28.3 18.7 45.3 18.7H416c35.3 0 64 28.7 64 64v32H144c-22.8 0-43.8 12.1-55.3 31.8zm27.6 16.1C122.1 230 132.6 224 144 224H544c11.5 0 22 6.1 27.7 16.1s5.7 22.2-.1 32.1l-112 192C453.9 474 443.4 480 432 480H32c-11.5 0-22-6.1-27.7-16.1s-5.7-22.2 .1-32.1l112-192z"/></svg>', scaletowidth=20),
+
+                'undo': partial(self.icon_cache.get, data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M48.5 224H40c-13.3 0-24-10.7-24-24V72c0-9.7 5.8-18.5 14.8-22.2s19.3-1.7 26.2 5.2L98.6 96.6c87.6-86.5 228.7-86.2 315.8 1c87.5 87.5 87.5 229.3 0 316.8s-229.3 87.5-316.8 0c-12.5-12.5-12.5-32.8 0-45.3s32.8-12.5 45.3 0c62.5 62.5 163.8 62.5 226.3 0s62.5-163.8 0-226.3c-62.2-62.2-162.7-62.5-225.3-1L185 183c6.9 6.9 8.9 17.2 5.2 26.2s-12.5 14.8-22.2 14.8H48.5z"/></svg>', scaletowidth=20),
+                'redo': partial(self.icon_cache.get, data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M463.5 224H472c13.3 0 24-10.7 24-24V72c0-9.7-5.8-18.5-14.8-22.2s-19.3-1.7-26.2 5.2L413.4 96.6c-87.6-86.5-228.7-86.2-315.8 1c-87.5 87.5-87.5 229.3 0 316.8s229.3 87.5 316.8 0c12.5-12.5 12.5-32.8 0-45.3s-32.8-12.5-45.3 0c-62.5 62.5-163.8 62.5-226.3 0s-62.5-163.8 0-226.3c62.2-62.2 162.7-62.5 225.3-1L327 183c-6.9 6.9-8.9 17.2-5.2 26.2s12.5 14.8 22.2 14.8H463.5z"/></svg>', scaletowidth=20),
+                'settings': partial(self.icon_cache.get, data=b'<svg viewBox="0 0 512 512" fill="#D4D4D4"><path d="M352 320c88.4 0 160-71.6 160-160c0-15.3-2.2-30.1-6.2-44.2c-3.1-10.8-16.4-13.2-24.3-5.3l-76.8 76.8c-3 3-7.1 4.7-11.3 4.7H336c-8.8 0-16-7.2-16-16V118.6c0-4.2 1.7-8.3 4.7-11.3l76.8-76.8c7.9-7.9 5.4-21.2-5.3-24.3C382.1 2.2 367.3 0 352 0C263.6 0 192 71.6 192 160c0 19.1 3.4 37.5 9.5 54.5L19.9 396.1C7.2 408.8 0 426.1 0 444.1C0 481.6 30.4 512 67.9 512c18 0 35.3-7.2 48-19.9L297.5 310.5c17 6.2 35.4 9.5 54.5 9.5zM80 408a24 24 0 1 1 0 48 24 24 0 1 1 0-48z"/></svg>', scaletowidth=20),
+            }
+        )
+
         self.call('wm', 'iconphoto', str(self), self.icons['window_icon2'])  # Set the icon of the window
         self.tk.call('tk', 'scaling', self.settings['ui_scaling'])  # Update the scaling of the window
         self.protocol('WM_DELETE_WINDOW', lambda: self.close_handler())  # Add a handler for when the window is closed
@@ -3143,6 +3116,9 @@ class Window(tk.Tk):
 
         self.style.layout('Custom.Vertical.TScrollbar', [('Vertical.Scrollbar.trough', {'sticky': 'ns', 'children': [('Vertical.Scrollbar.thumb', {'unit': '1', 'sticky': 'nswe', 'children': [('Vertical.Scrollbar.grip', {'sticky': ''})]})]})])
 
+        ## Preload the icons used in the last session in the background, so menus and dialogs open without rendering their icons
+        self.icons.preload(self, LazyIconMap.load_trace(ICON_TRACE_FILE))
+
     def undo(self) -> None:
         """ Call the timetable event entry widget’s undo function """
         ## Todo: add undo/redo for other actions (eg: adding, deleting, and editing classes and events)
@@ -3166,24 +3142,22 @@ class Window(tk.Tk):
         if not file_exists(filename):  # If the specified file does not exist, return.
             return
 
+        ## Todo: Warn the user if the file is not saved
+
+        timetable_data = read_timetable(filename)  # Read the timetable from the input file
+        if timetable_data is None:  # If the timetable could not be read, keep the current timetable
+            return
+
         ## Update the stored filenames
         self.filename = filename  # Update the current filename
         self.top_bar.filename_display.configure(text=filename)  # Update the displayed filename
         self.settings.update({'default.path': filename})  # Update the stored filename
 
-        ## Todo: Update the existing timetable object instead of creating a new one
-        ## Todo: Warn the user if the file is not saved
-
-        ## Create a new timetable object
-        self.timetable.destroy()  # Destroy the existing timetable object
-        timetable_data = read_timetable(filename)  # Read the timetable from the input file
-        self.timetable = TimeTable(self, *timetable_data)  # Create a new timetable object
-        self.timetable.grid(row=1, column=0, sticky='nswe')  # Display the timetable object
-
-        ## Update the window size
-        self.update_idletasks()  # Wait for the running tasks to complete (i.e.: until the new UI has loaded)
-        ## Update the minimum size of the window to fit the timetable
-        self.wm_minsize(window.timetable.display_frame.winfo_width() - 47, window.timetable.display_frame.winfo_height() + window.top_bar.winfo_height() - 34)
+        ## Load the timetable into the existing timetable object
+        if self.timetable.reload(*timetable_data):  # If the layout of the table changed, update the window size
+            self.update_idletasks()  # Wait for the running tasks to complete (i.e.: until the new UI has loaded)
+            ## Update the minimum size of the window to fit the timetable
+            self.wm_minsize(window.timetable.display_frame.winfo_width() - 47, window.timetable.display_frame.winfo_height() + window.top_bar.winfo_height() - 34)
 
     def export_timetable(self, mode: Literal['xls', 'csv', 'pdf']) -> None:
         """
@@ -3199,12 +3173,33 @@ class Window(tk.Tk):
             case 'csv':
                 mb.showinfo('Not Implemented', 'This feature has not been implemented yet.')
             case 'pdf':
+                from timetable_pdf import ExportAsPDFMenu  # Import the PDF export module the first time it is used, so reportlab is not loaded at startup
                 ExportAsPDFMenu(self)  # Show the 'export to pdf' UI
 
     def undo_all(self) -> None:
         """ Undo all unsaved changes to the current file """
-        ## Todo: implement (load the saved file)
-        mb.showinfo('Not Implemented', 'This feature has not been implemented yet.')
+
+        if self.timetable.check_saved():  # If there are no unsaved changes, there is nothing to undo
+            return
+
+        ## Ask the user to confirm
+        if mb.askokcancel('Undo All?', 'Do you really want to undo all unsaved changes to this timetable?') is not True:
+            return
+
+        data = self.timetable.saved_data  # Get the timetable data from the last save
+
+        if data is None:  # If the timetable was recovered and has not been saved since, the saved data is not in memory, so read it from the timetable file
+            timetable_data = read_timetable(self.filename, check_recovery=False)  # The recovery data holds the changes being undone, so do not offer to recover it
+            if timetable_data is None:  # If the timetable file could not be read, keep the current timetable
+                return
+        else:
+            timetable_data = timetable_args(data)
+
+        ## Remove the existing timetable data and its recovery data
+        self.timetable.unload()
+        self.timetable.journal.discard()
+
+        self.timetable.load(*timetable_data)  # Load the saved data into the existing timetable object
 
     def show_about(self) -> None:
         """ Show information about the program """
@@ -3239,20 +3234,59 @@ class Window(tk.Tk):
         """ Show the settings UI """
         SettingsWindow(self, background='#303841')
 
+    def load_event_type_icons(self, event_types: EventTypeRegistry) -> None:
+        """
+        Create the icon images for the event types in a registry that do not have them yet.
+        The mask images are only shown in the upcoming events list, so they are created when they are first used (see `get_event_type_mask`).
+
+        :param event_types: The event type registry of a timetable
+        """
+
+        for type_id in range(len(event_types)):
+            if event_types.icons[type_id] is None:
+                event_types.icons[type_id] = self.get_event_type_image(*event_types.svg(type_id))
+
+    def get_event_type_mask(self, event_types: EventTypeRegistry, type_id: int) -> tk.PhotoImage:
+        """
+        Get the mask image of an event type, creating it the first time it is used
+
+        :param event_types: The event type registry of a timetable
+        :param type_id: The id of the event type
+        """
+
+        mask = event_types.masks[type_id]
+        if mask is None:
+            mask = event_types.masks[type_id] = self.get_event_type_image(*event_types.svg(type_id, mask=True))
+        return mask
+
+    def get_event_type_image(self, data: bytes, width: int) -> tk.PhotoImage:
+        """
+        Get an event type image, creating it if it has not been created yet
+
+        :param data: The SVG data of the image
+        :param width: The width to scale the image to
+        """
+
+        image = self.event_type_images.get((data, width))
+        if image is None:
+            image = self.event_type_images[(data, width)] = self.icon_cache.get(data=data, scaletowidth=width)
+        return image
+
     @staticmethod
-    def get_start_week(week: Optional[int] = None, allow_cancel: bool = False) -> int | None:
+    def get_start_week(week: Optional[int] = None, allow_cancel: bool = False, num_weeks: int = DEFAULT_NUM_WEEKS) -> int | None:
         """
         Get the timestamp of the starting week.
         The output of this function is used to calculate the current week number.
 
         :param week: The current week number. Leave unspecified to prompt the user to enter a week number.
         :param allow_cancel: Weather to allow the user to cancel updating the stating week timestamp.
+        :param num_weeks: The number of weeks in the term
         :return: The calculated timestamp for the starting week of the term
         """
 
         ## Get the week number
         if week is None:
-            week = sd.askinteger('Setup', 'Enter the current week:', initialvalue=1, minvalue=1, maxvalue=11)  # Prompt the user for a week number
+            week = sd.askinteger('Setup', 'Enter the current week:', initialvalue=1, minvalue=1, maxvalue=num_weeks)  # Prompt the user for a week number
             if week is None:  # If the user pressed cancel
                 if allow_cancel:  # Return if cancelling is allowed, otherwise set the week number to 0
                     return
@@ -3289,13 +3323,24 @@ class Window(tk.Tk):
 
         ## Attempt to save the timetable
         try:
-            if not self.timetable.check_saved(self.timetable.get_json()):  # If the timetable has unsaved changes, prompt the user to save
+            if not self.timetable.check_saved(deep=True):  # If the timetable has unsaved changes, prompt the user to save
                 ans = mb.askyesnocancel('Unsaved Data', 'Do you want to save your changes to this timetable?')
                 if ans is None:  # If the user presses 'cancel', return.
                     return
                 elif ans:  # If the user presses 'yes', save the timetable and continue.
                     self.timetable.save_timetable()
 
+            ## Wait for any pending writes to complete before closing. If a write failed, keep the window open so the user can try again.
+            self.save_engine.join()
+            for filename, token, error in self.save_engine.poll():
+                if error is not None and filename != self.timetable.journal.autosave_path:
+                    mb.showerror('Failed to Save', f'Could not save "{filename}".\n\n{error}')
+                    return
+
+            ## The timetable is either saved or the user chose to discard the changes, so the recovery data is no longer needed
+            self.timetable.destroy()
+            self.timetable.journal.discard()
+
             ## Get the current window state, position and size and save them to a JSON file
             json_object = json.dumps({'window.geometry': self.winfo_geometry(), 'window.state': self.state()}, indent=4, separators=(', ', ': '))
             with open('window_settings.json', 'w', encoding='utf-8') as file:
@@ -3306,12 +3351,31 @@ class Window(tk.Tk):
             with open('settings.json', 'w', encoding='utf-8') as file:
                 file.write(json_object)
 
+            self.icons.save_trace(ICON_TRACE_FILE)  # Save the names of the icons used in this session, so they can be preloaded next time
+
         except Exception:  # Catch all exceptions with a broad exception clause, otherwise the program may get 'stuck open'
             ## Prompt the user that the program failed to save
             mb.showerror('Failed to Save', f'An error occurred while attempting to close.\nAs a result, some data may be unsaved.\n\n{sys.exc_info()[1]}\n{sys.exc_info()[2]}\n\n{format_exc()}')
 
         self.destroy()  # Destroy the window
 
+    def poll_saves(self) -> None:
+        """
+        Report the results of completed writes from the save engine to the timetable they were saved from.
+        Reschedules itself until all pending writes have completed.
+        """
+
+        if self.save_poll_after is not None:
+            self.after_cancel(self.save_poll_after)
+            self.save_poll_after = None
+
+        for filename, (load_id, revision, data), error in self.save_engine.poll():
+            if load_id is self.timetable.load_id:  # Ignore results for timetable data that has since been closed or replaced
+                self.timetable.save_completed(filename, revision, data, error)
+
+        if self.save_engine.busy():  # If there are writes that have not completed, check again shortly
+            self.save_poll_after = self.after(50, self.poll_saves)
+
     def display_popup(self, text: str, ms: int = 2000) -> None:
         """
         Display a popup at the bottom of the screen.
@@ -3386,16 +3450,19 @@ TIMETABLE_JSON_TEMPLATE = '''{
         ["6", true, "-1"]
     ],
     "day_start": "7:15",
-    "start_date_timestamp": %s
+    "start_date_timestamp": %s,
+    "num_weeks": 12
 }'''
 
 
-def read_timetable(path: str, encoding: str = 'utf-8') -> tuple[list[str], list[str], list[str], Any, list[dict], str, list[list[str, bool, str]], int] | None:
+def read_timetable(path: str, encoding: str = 'utf-8', check_recovery: bool = True) -> tuple[list[str], list[str], list[str], Any, list[dict], str, list[list[str, bool, str]], int, int, list[dict], bool] | None:
     """
-    Read a timetable from a JSON file
+    Read a timetable from a JSON file.
+    If the timetable has unsaved changes from a previous session that did not close properly, the user is prompted to recover them.
 
     :param path: The path to read.
     :param encoding: The encoding of the target file.
+    :param check_recovery: Whether to check for unsaved changes from a previous session.
     :return: The data read from the timetable file to be passed directly to a timetable object.
     """
 
@@ -3408,6 +3475,16 @@ def read_timetable(path: str, encoding: str = 'utf-8') -> tuple[list[str], list[
         with open(path, 'w', encoding=encoding) as eventfile:
             eventfile.write(TIMETABLE_JSON_TEMPLATE % int(datetime.datetime.now().timestamp()))
 
+    ## If there is recovery data for the target file, ask the user whether to recover it
+    if check_recovery and has_recovery_data(path):
+        if mb.askyesno('Recover Timetable', f'"{path}" has unsaved changes from a previous session.\nDo you want to recover them?'):
+            try:
+                return *timetable_args(recover_timetable(path, encoding)), True
+            except (json.decoder.JSONDecodeError, KeyError, OSError):  # If the recovery data cannot be read, prompt the user and read the timetable file instead
+                mb.showwarning('Recovery Failed', f'Could not recover the unsaved changes to "{path}".\n\n{sys.exc_info()[1]}')
+
+        discard_recovery_data(path)
+
     try:  # Try to read the target file
         with open(path, encoding=encoding) as readfile:
             data = json.load(readfile)
@@ -3415,8 +3492,8 @@ def read_timetable(path: str, encoding: str = 'utf-8') -> tuple[list[str], list[
         mb.showwarning('JSON Decode Error', f'Could not load "{path}".\nReason: JSON Decode Error\n\n{sys.exc_info()[1]}')
         return
 
-    ## Otherwise, return the data from the json file. Todo: return the dictionary rather than the value of each key
-    return data['classes'], data['teachers'], data['rooms'], data['timetable'], data['events'], data['day_start'], data['sessions'], data['start_date_timestamp']
+    ## Otherwise, return the data from the json file
+    return *timetable_args(data), False
 
 
 def increment_numbering(indent: str) -> str:
@@ -3465,28 +3542,231 @@ def increment_numbering(indent: str) -> str:
     return indent  # Return the result
 
 
-def load_images(data: list[tuple[str, str, int]], linecolour: str = '#D4D4D4', highlightcolour: str = '#6FB0DB') -> dict:
+class IconCache:
+    """
+    A content-addressed disk cache of rasterised SVG icons.
+    Each icon is stored as a PNG file named after a hash of its SVG data (including any colours formatted into it) and its width, so warm starts load the PNG with `tk.PhotoImage` rather than parsing and rendering the SVG.
+    The cache is cleared whenever the UI scaling changes.
+
+    :param directory: The directory to store the cached icons in
+    :param scaling: The UI scaling of the window
+    """
+
+    VERSION = 1  # Increment to invalidate the caches written by older versions of the program
+
+    def __init__(self, directory: str, scaling: float) -> None:
+        self.directory = directory
+        self.scaling = scaling
+        self.enabled = True  # Whether the cache directory can be used. If not, icons are rendered every time.
+
+        ## If the cache was written with a different UI scaling, clear it
+        stamp = f'{self.VERSION} {scaling}'
+        stamp_path = os.path.join(directory, 'scaling')
+        try:
+            with open(stamp_path, encoding='utf-8') as file:
+                cached_stamp = file.read()
+        except OSError:
+            cached_stamp = None
+
+        if cached_stamp != stamp:
+            try:
+                self.clear()
+                os.makedirs(directory, exist_ok=True)
+                with open(stamp_path, 'w', encoding='utf-8') as file:
+                    file.write(stamp)
+            except OSError:  # If the cache directory cannot be written to, disable the cache
+                self.enabled = False
+
+    def path(self, data: bytes, width: int) -> str:
+        """
+        Get the path of the cached image for an icon
+
+        :param data: The SVG data of the icon
+        :param width: The width to scale the icon to
+        """
+
+        key = hashlib.sha1(data + f'\0{width}\0{self.scaling}'.encode()).hexdigest()
+        return os.path.join(self.directory, f'{key}.png')
+
+    def get(self, data: bytes | str, scaletowidth: int) -> tk.PhotoImage:
+        """
+        Get an icon from the cache, rendering the SVG and adding it to the cache if it is not already cached
+
+        :param data: The SVG data of the icon
+        :param scaletowidth: The width to scale the icon to
+        """
+
+        path = self.path(data.encode() if isinstance(data, str) else data, scaletowidth)
+
+        if self.enabled and os.path.exists(path):
+            try:
+                return tk.PhotoImage(file=path)
+            except tk.TclError:  # If the cached image cannot be read, render it again
+                pass
+
+        image = tksvg.SvgImage(data=data, scaletowidth=scaletowidth)
+        if self.enabled:
+            self.store(image, path)
+
+        return image
+
+    @staticmethod
+    def store(image: tk.PhotoImage, path: str) -> None:
+        """
+        Write a rendered icon to the cache. The image is written to a temporary file first, so that a partially written file is never read.
+
+        :param image: The rendered icon
+        :param path: The path of the cached image
+        """
+
+        temp_path = path + '.tmp'
+        try:
+            image.write(temp_path, format='png')
+            os.replace(temp_path, path)
+        except (tk.TclError, OSError):  # The cache is only an optimisation, so failing to write it is not an error
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def clear(self) -> None:
+        """ Remove all the cached icons """
+
+        if not os.path.isdir(self.directory):
+            return
+
+        for name in os.listdir(self.directory):
+            if name.endswith('.png'):
+                os.remove(os.path.join(self.directory, name))
+
+
+class LazyIconMap:
+    """
+    A dictionary of icons which loads each icon the first time it is accessed.
+    The names of the accessed icons are recorded in the order they were first used, so that the icons used in one session can be preloaded in the background at the start of the next.
     """
-    Load a list of SVG files, configure the line and highlight colour, scale to a specified size and add each image to a dictionary with a specified key.
 
-    :param data: A list containing the images to load. This parameter should be in the format [path to image, image key, scale width].
-    :param linecolour: The colour to format the linecolour field in the loaded SVG files.
-    :param highlightcolour: The colour to format the highlightcolour field in the loaded SVG files.
-    :return: A dictionary of tkinter svg images loaded from files with their specified keys.
+    def __init__(self) -> None:
+        self.loaders: dict[str, Callable[[], Optional[tk.PhotoImage]]] = dict()  # The functions used to load the icons that have not been loaded yet
+        self.images: dict[str, Optional[tk.PhotoImage]] = dict()  # The loaded icons
+        self.used: dict[str, None] = dict()  # The names of the icons that have been accessed, in the order they were first accessed
+
+    def add(self, name: str, loader: Optional[Callable[[], Optional[tk.PhotoImage]]]) -> None:
+        """
+        Add an icon to the dictionary
+
+        :param name: The key of the icon
+        :param loader: A function that loads the icon. Leave as None for an entry without an icon.
+        """
+
+        if loader is None:
+            self.images[name] = None
+        else:
+            self.loaders[name] = loader
+            self.images.pop(name, None)
+
+    def add_all(self, loaders: dict[str, Optional[Callable[[], Optional[tk.PhotoImage]]]]) -> None:
+        """
+        Add several icons to the dictionary
+
+        :param loaders: A dictionary of the functions that load each icon, with the icon keys as keys
+        """
+
+        for name, loader in loaders.items():
+            self.add(name, loader)
+
+    def load(self, name: str) -> Optional[tk.PhotoImage]:
+        """ Get an icon, loading it if it has not been loaded yet, without recording that it was used """
+
+        if name not in self.images:
+            self.images[name] = self.loaders.pop(name)()
+
+        return self.images[name]
+
+    def __getitem__(self, name: str) -> Optional[tk.PhotoImage]:
+        image = self.load(name)
+        self.used[name] = None
+        return image
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.images or name in self.loaders
+
+    def preload(self, widget: tk.Misc, names: Iterable[str]) -> None:
+        """
+        Load icons in the background. One icon is loaded each time the event loop is idle, so that loading the icons does not block user input.
+
+        :param widget: The widget used to schedule the idle callbacks
+        :param names: The keys of the icons to load
+        """
+
+        pending = [v for v in names if v in self.loaders]
+        pending.reverse()  # Pop the icons in the order they were given
+
+        def load_next() -> None:
+            while pending:
+                name = pending.pop()
+                if name in self.loaders:  # Skip icons that have been loaded since the preload was scheduled
+                    self.load(name)
+                    break
+
+            if pending:
+                widget.after(1, widget.after_idle, load_next)  # Wait for the next time the event loop is idle
+
+        if pending:
+            widget.after(1, widget.after_idle, load_next)
+
+    def save_trace(self, path: str) -> None:
+        """
+        Save the names of the icons used in this session to a file
+
+        :param path: The path of the file
+        """
+
+        try:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(list(self.used), file)
+        except OSError:  # The trace is only used to preload icons, so failing to write it is not an error
+            pass
+
+    @staticmethod
+    def load_trace(path: str) -> list[str]:
+        """
+        Load the names of the icons used in the last session from a file
+
+        :param path: The path of the file
+        :return: The names of the icons, or an empty list if the file could not be read
+        """
+
+        try:
+            with open(path, encoding='utf-8') as file:
+                names = json.load(file)
+        except (OSError, ValueError):
+            return []
+
+        return [v for v in names if isinstance(v, str)] if isinstance(names, list) else []
+
+
+def load_image(file: str, width: int, linecolour: str = '#D4D4D4', highlightcolour: str = '#6FB0DB', cache: Optional[IconCache] = None) -> Optional[tk.PhotoImage]:
+    """
+    Load an SVG file, configure the line and highlight colour and scale it to a specified size.
+
+    :param file: The path to the image to load
+    :param width: The width to scale the image to
+    :param linecolour: The colour to format the linecolour field in the loaded SVG file.
+    :param highlightcolour: The colour to format the highlightcolour field in the loaded SVG file.
+    :param cache: The icon cache to load the image through. Leave blank to render the image.
+    :return: A tkinter image loaded from the file, or None if the file does not exist
     """
 
-    images = dict()  # Declare a dictionary to hold the images
+    if not file_exists(file):  # If the target file does not exist, there is no image
+        return None
 
-    for file, name, width in data:  # Iterate through the data list
-        if file_exists(file):  # If the target file exists
-            with open(file) as svg_file:  # Open and read the target file
-                svg_data = svg_file.readlines()
-                ## Format the colour fields in the SVG data and create a tkinter-compatible image using said data.
-                images.update({name: tksvg.SvgImage(data=''.join(svg_data).format(linecolour=linecolour, highlightcolour=highlightcolour), scaletowidth=width)})
-        else:  # If the target file does not exist, set the value for the specified key to be Null
-            images.update({name: None})
+    with open(file) as svg_file:  # Open and read the target file
+        svg_data = svg_file.read().format(linecolour=linecolour, highlightcolour=highlightcolour)  # Format the colour fields in the SVG data
 
-    return images  # Return the dictionary of images
+    ## Create a tkinter-compatible image using said data.
+    if cache is not None:
+        return cache.get(data=svg_data, scaletowidth=width)
+    else:
+        return tksvg.SvgImage(data=svg_data, scaletowidth=width)
 
 
 def find_data_file() -> str:
@@ -3812,8 +4092,8 @@ if platform.system() == 'Windows':
     ctypes.windll.shcore.SetProcessDpiAwareness(window.settings['dpi_awareness'])
 
 if window.timetable.flags[0]:
-    window.timetable.start_timestamp = window.get_start_week()
-    window.timetable.week = window.timetable.get_week(datetime.datetime.now().timestamp())
+    window.timetable.start_timestamp = window.get_start_week(num_weeks=window.timetable.num_weeks)
+    window.timetable.week = window.timetable.model.get_week(datetime.datetime.now().timestamp())
     window.timetable.update_week(window.timetable.week)
 
 if file_exists('first_time_setup.txt') and getattr(sys, 'frozen', True):  # Check if this is the first time the program is being run as an executable
@@ -0,0 +1,109 @@
+"""
+Benchmark for highlighting the timetable cells as the mouse moves across the table.
+
+Sweeps a highlight across a grid of cells, as `TimetableCell.enter` and `TimetableCell.leave` do when the pointer crosses each cell, comparing three ways of applying the colours of a state:
+    - Per child: querying the children of the cell with `winfo_children` and configuring each child separately (as `update_elems` did before)
+    - Cached: configuring the children cached when the cell was created
+    - Procedure: applying a precomputed style bundle to the cached children with a single call to a Tcl procedure (as `WidgetCell.update_elems` does)
+
+The cells use the same widgets as a `SessionCell`. Requires a display.
+
+Usage: python benchmarks/bench_cell_hover.py [number of sweeps]
+"""
+
+from statistics import median
+from time import perf_counter
+import tkinter as tk
+import sys
+
+## The same procedure as `CELL_STATE_PROC` in the main script
+CELL_STATE_PROC = '''
+proc timetable_cell_state {frame border background foreground children} {
+    $frame configure -background $border
+    foreach child $children {
+        $child configure -background $background -foreground $foreground
+    }
+}
+'''
+
+CELL_STATE_CONFIG = {
+    'normal': ({'background': '#303841', 'foreground': '#D8DEE9'}, '#3B434C'),
+    'highlighted': ({'background': '#343C44', 'foreground': '#D4D6D7'}, '#3B434C')
+}
+CELL_STATE_STYLES = {state: (border, config['background'], config['foreground']) for state, (config, border) in CELL_STATE_CONFIG.items()}
+
+
+class Cell:
+    """ A cell with the same widgets as a `SessionCell` """
+
+    def __init__(self, master, day: int, session: int) -> None:
+        self.frame = tk.Frame(master, background='#3B434C')
+        self.frame.grid(row=session, column=day, sticky='nswe', padx=(0, 1), pady=(0, 1))
+        self.frame.columnconfigure(0, weight=1)
+
+        for row, text in enumerate(('Class', 'Room', 'Teacher')):
+            tk.Label(self.frame, text=text, font=('Calibri', 12), background='#303841', foreground='#D8DEE9').grid(row=row, column=0, padx=1, pady=(int(row == 0), 1), sticky='nswe')
+        tk.Label(self.frame, width=1, height=1, background='#303841').grid(row=0, column=0, sticky='NE')
+
+        self.children = tuple(str(elem) for elem in self.frame.winfo_children())
+        self.child_widgets = self.frame.winfo_children()
+
+    def per_child(self, state: str) -> None:
+        formatting = CELL_STATE_CONFIG[state]
+        self.frame.configure(background=formatting[1])
+        for elem in self.frame.winfo_children():
+            elem.configure(**formatting[0])
+
+    def cached(self, state: str) -> None:
+        formatting = CELL_STATE_CONFIG[state]
+        self.frame.configure(background=formatting[1])
+        for elem in self.child_widgets:
+            elem.configure(**formatting[0])
+
+    def procedure(self, state: str) -> None:
+        self.frame.tk.call('timetable_cell_state', self.frame, *CELL_STATE_STYLES[state], self.children)
+
+
+def sweep(root, cells: list[Cell], method: str, number: int) -> float:
+    """
+    Time sweeping the highlight across every cell.
+
+    :param root: The root window
+    :param cells: The cells in the order the pointer crosses them
+    :param method: The name of the method used to apply the colours of a state
+    :param number: The number of sweeps
+    :return: The median time per cell crossed in seconds
+    """
+
+    times = []
+    for _ in range(number):
+        start = perf_counter()
+        for cell in cells:
+            getattr(cell, method)('highlighted')  # The pointer enters the cell
+            getattr(cell, method)('normal')  # The pointer leaves the cell
+        root.update_idletasks()  # Include the time taken to redraw the cells
+        times.append((perf_counter() - start) / len(cells))
+
+    return median(times)
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    root = tk.Tk()
+    root.eval(CELL_STATE_PROC)
+
+    ## A weekday grid of 5 days with 11 sessions, crossed row by row
+    cells = [Cell(root, day, session) for session in range(11) for day in range(5)]
+    root.update()
+
+    print(f'{len(cells)} cells, median of {number} sweeps\n')
+    print(f'{"":12}{"µs per cell":>14}')
+    for method in ('per_child', 'cached', 'procedure'):
+        print(f'{method:12}{sweep(root, cells, method, number) * 1e6:14.1f}')
+
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
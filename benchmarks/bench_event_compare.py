@@ -0,0 +1,125 @@
+"""
+Micro-benchmark for event timeslot comparisons on a large timetable.
+
+Compares the `Timeslot` comparisons used by `Event` against the previous comparisons, which were dispatched through `multipledispatch`.
+The previous implementation is only measured if `multipledispatch` is installed.
+
+Usage: python benchmarks/bench_event_compare.py [number of events]
+"""
+
+from operator import attrgetter
+from timeit import timeit
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Import modules from the repository root
+
+from timetable_model import Timeslot, EventStore
+
+try:
+    from multipledispatch import dispatch
+except ImportError:
+    dispatch = None
+
+
+if dispatch is not None:
+    class DispatchEvent:
+        """ The timeslot comparisons of `Event` before they were moved to `Timeslot` """
+
+        def __init__(self, week: int, day: int, session: int) -> None:
+            self.week = week
+            self.day = day
+            self.session = session
+
+        @dispatch(tuple)
+        def __eq__(self, other) -> bool:
+            return other == (self.week, self.day, self.session)
+
+        @dispatch(object)
+        def __eq__(self, other) -> bool:
+            return tuple(other) == (self.week, self.day, self.session)
+
+        def __iter__(self):
+            yield self.week
+            yield self.day
+            yield self.session
+
+        @dispatch(tuple)
+        def __ge__(self, other: tuple) -> bool:
+            if len(other) == 2:
+                return self.day > other[0] or (self.day == other[0] and self.session >= other[1])
+            else:
+                return self.week > other[0] or (self.week == other[0] and self.day > other[1]) or (self.week == other[0] and self.day == other[1] and self.session >= other[2])
+
+        @dispatch(object)
+        def __ge__(self, other) -> bool:
+            return self.day > other.day or (self.day == other.day and self.session >= other.session)
+
+        @dispatch(tuple)
+        def __le__(self, other: tuple) -> bool:
+            if len(other) == 2:
+                return self.day < other[0] or (self.day == other[0] and self.session <= other[1])
+            else:
+                return self.week < other[0] or (self.week == other[0] and self.day < other[1]) or (self.week == other[0] and self.day == other[1] and self.session <= other[2])
+
+        @dispatch(object)
+        def __le__(self, other) -> bool:
+            return self.day < other.day or (self.day == other.day and self.session <= other.session)
+
+
+def run(cls, sort_key, slots: list[tuple[int, int, int]], now: tuple[int, int, int], number: int) -> dict[str, float]:
+    """
+    Time the event comparisons made when loading and editing a timetable.
+
+    :param cls: The event class to benchmark
+    :param sort_key: The key used to sort events of the class by their timeslot
+    :param slots: The timeslot of each event
+    :param now: The timeslot to compare the events to
+    :param number: The number of times to run each benchmark
+    :return: The average time of each benchmark in milliseconds
+    """
+
+    events = [cls(*v) for v in slots]
+
+    benchmarks = {
+        'filter >= (upcoming events)': lambda: [v for v in events if v >= now],
+        'filter == (cell lookup)': lambda: [v for v in events if v == now],
+        'sort by timeslot': lambda: sorted(events, key=sort_key),
+    }
+
+    return {name: timeit(func, number=number) / number * 1000 for name, func in benchmarks.items()}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    number = 20
+
+    ## Create events on random unique timeslots, with 11 sessions per day
+    random.seed(0)
+    slots = random.sample([(w, d, s) for w in range(count // 77 + 1) for d in range(7) for s in range(11)], count)
+    now = (len(slots) // 154, 3, 5)
+
+    print(f'{count} events, average of {number} runs (ms)\n')
+
+    results = {'Timeslot': run(Timeslot, attrgetter('timeslot'), slots, now, number)}
+    if dispatch is not None:
+        results['multipledispatch'] = run(DispatchEvent, list, slots, now, number)
+    else:
+        print('multipledispatch is not installed, so only the current implementation is measured\n')
+
+    ## Time the index lookups that replace the filters
+    store = EventStore((Timeslot(*v) for v in slots), 11)
+    results['Timeslot'].update({
+        'EventStore.iter_from': timeit(lambda: list(store.iter_from(*now)), number=number) / number * 1000,
+        'EventStore.get': timeit(lambda: store.get(*now), number=number) / number * 1000,
+    })
+
+    names = list(results)
+    print(f'{"":32}' + ''.join(f'{v:>20}' for v in names))
+    for benchmark in results['Timeslot']:
+        print(f'{benchmark:32}' + ''.join(f'{results[v][benchmark]:20.3f}' if benchmark in results[v] else f'{"-":>20}' for v in names))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark for switching between timetable files.
+
+Compares rebuilding the table (destroying every header and cell and creating new ones, as `Window.load_timetable` did before) against reloading it in place (reconfiguring the existing widgets, and only adding or removing cells where the number of sessions differs).
+The main script starts the program when it is imported, so the table is rebuilt with widgets that use the same layout as the session headers and `SessionCell` widgets. Requires a display.
+
+Usage: python benchmarks/bench_file_switch.py [number of switches]
+"""
+
+from statistics import median
+from time import perf_counter
+import tkinter as tk
+import random
+import sys
+
+LABELCONFIG = dict(relief='flat', background='#303841', foreground='#D8DEE9')
+
+
+class Cell:
+    """ A cell with the same widgets as a `SessionCell` widget """
+
+    def __init__(self, master, day: int, session: int) -> None:
+        self.day = day
+        self.session = session
+
+        self.frame = tk.Frame(master, background='#3B434C')
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.bind('<Enter>', lambda v: None)
+        self.frame.bind('<Leave>', lambda v: None)
+
+        self.labels = []
+        for row, font in enumerate((('Calibri', 12, 'bold'), ('Calibri', 12), ('Calibri', 12))):
+            label = tk.Label(self.frame, font=font, **LABELCONFIG)
+            label.grid(row=row, column=0, padx=1, pady=(int(row == 0), 1), sticky='NSWE')
+            self.labels.append(label)
+
+        tk.Label(self.frame, width=1, height=1, background='#303841').grid(row=0, column=0, sticky='NE')
+
+    def set_class(self, values: tuple[str, str, str]) -> None:
+        """ Display the data of a class """
+        for label, value in zip(self.labels, values):
+            label.configure(text=value)
+
+    def grid(self) -> None:
+        self.frame.grid(row=self.session + 1, column=self.day + 1, sticky='nswe', padx=(int(self.day == 0), 1), pady=(int(self.session == 0), 1))
+
+
+def timetable(num_sessions: int, seed: int) -> tuple[list[str], list[list[tuple[str, str, str]]]]:
+    """ Generate the session names and class mapping of a random timetable """
+
+    rng = random.Random(seed)
+    classes = [(f'Class {i}', f'Room {i}', f'Teacher {i}') for i in range(12)]
+    return [f'Session {i}' for i in range(num_sessions)], [[rng.choice(classes) for _ in range(num_sessions)] for _ in range(5)]
+
+
+class Table:
+    """ A table of session headers and cells that can be rebuilt or reloaded in place """
+
+    def __init__(self, master) -> None:
+        self.frame = tk.Frame(master, background='#222')
+        self.frame.grid(row=0, column=0, sticky='nswe')
+        self.frame.columnconfigure(list(range(1, 6)), weight=1)
+        self.headers: list[tk.Label] = []
+        self.cells: list[list[Cell]] = [[] for _ in range(5)]
+
+    def rebuild(self, sessions: list[str], mapping: list[list[tuple[str, str, str]]]) -> None:
+        """ Destroy the table and create it again """
+
+        for widget in self.headers + [cell.frame for day in self.cells for cell in day]:
+            widget.destroy()
+        self.headers, self.cells = [], [[] for _ in range(5)]
+        self.reload(sessions, mapping)
+
+    def reload(self, sessions: list[str], mapping: list[list[tuple[str, str, str]]]) -> None:
+        """ Reconfigure the existing widgets, adding or removing them where the number of sessions differs """
+
+        layout_changed = len(self.headers) != len(sessions)
+
+        for n, name in enumerate(sessions):
+            if n < len(self.headers):
+                self.headers[n].configure(text=name)
+            else:
+                header = tk.Label(self.frame, text=name, highlightthickness=1, highlightbackground='#4F565E', font=('Calibri', 13), background='#424D59', foreground='#D4D6D7')
+                header.grid(row=n + 1, column=0, sticky='nswe', padx=(1, 0), pady=(int(n == 0), 1))
+                self.headers.append(header)
+        for header in self.headers[len(sessions):]:
+            header.destroy()
+        del self.headers[len(sessions):]
+
+        for day, (cells, classes) in enumerate(zip(self.cells, mapping)):
+            for session, values in enumerate(classes):
+                if session == len(cells):
+                    cells.append(Cell(self.frame, day, session))
+                    cells[-1].grid()
+                cells[session].set_class(values)
+            for cell in cells[len(classes):]:
+                cell.frame.destroy()
+            del cells[len(classes):]
+
+        if layout_changed:
+            self.frame.rowconfigure(list(range(1, len(sessions) + 1)), weight=1)
+
+
+def switch(root, method: str, files: list, number: int) -> float:
+    """
+    Time switching between timetables.
+
+    :param root: The root window
+    :param method: The name of the method used to display each timetable ('rebuild' or 'reload')
+    :param files: The timetables to switch between
+    :param number: The number of switches
+    :return: The median time of a switch in seconds
+    """
+
+    table = Table(root)
+    table.reload(*files[-1])
+    root.update()
+
+    times = []
+    for i in range(number):
+        start = perf_counter()
+        getattr(table, method)(*files[i % len(files)])
+        root.update()  # Include the time taken to lay out and draw the table
+        times.append(perf_counter() - start)
+
+    table.frame.destroy()
+    return median(times)
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    root = tk.Tk()
+    root.geometry('1200x800')
+    root.rowconfigure(0, weight=1)
+    root.columnconfigure(0, weight=1)
+
+    cases = {
+        'Same number of sessions': [timetable(11, 0), timetable(11, 1)],
+        'Different number of sessions': [timetable(11, 0), timetable(8, 1)],
+    }
+
+    print(f'Median of {number} switches (ms)\n')
+    print(f'{"":32}{"Rebuild":>12}{"Reload":>12}')
+    for name, files in cases.items():
+        rebuild = switch(root, 'rebuild', files, number)
+        reload = switch(root, 'reload', files, number)
+        print(f'{name:32}{rebuild * 1000:12.1f}{reload * 1000:12.1f}')
+
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
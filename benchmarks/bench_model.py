@@ -0,0 +1,81 @@
+"""
+Benchmark for the timetable model without a display.
+
+Times loading, querying, and serialising a large synthetic timetable with `TimetableModel`, which does not import Tkinter.
+
+Usage: python benchmarks/bench_model.py [number of events]
+"""
+
+from statistics import median
+from time import perf_counter
+import datetime
+import random
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Import modules from the repository root
+
+from timetable_model import TimetableModel
+
+NUM_WEEKS = 52
+SESSIONS = [['Session 1', True, '09:50'], ['Session 2', True, '10:50'], ['Recess', False, '11:10'], ['Session 3', True, '12:10'], ['Session 4', True, '13:10'], ['Lunch', False, '13:50'], ['Session 5', True, '14:50'], ['Session 6', True, '-1']]
+
+
+def timetable_data(count: int) -> dict:
+    """ Generate the data of a timetable with events in random timeslots """
+
+    rng = random.Random(0)
+    num_sessions = sum(is_normal for _, is_normal, _ in SESSIONS)
+    timeslots = rng.sample([(week, day, session) for week in range(NUM_WEEKS) for day in range(7) for session in range(num_sessions if day < 5 else 1)], count)
+
+    return {
+        'classes': [f'Class {i}' for i in range(12)],
+        'teachers': [f'Teacher {i}' for i in range(12)],
+        'rooms': [f'Room {i}' for i in range(12)],
+        'timetable': [[rng.randrange(12) for _ in range(num_sessions)] for _ in range(5)],
+        'events': [dict(title=f'Event {i}', week=week, day=day, session=session, text=f'Text for event {i}', tags=None, etype=rng.choice(['Event', 'Info', 'Test'])) for i, (week, day, session) in enumerate(timeslots)],
+        'sessions': SESSIONS,
+        'day_start': '08:50',
+        'start_date_timestamp': 1700000000,
+        'num_weeks': NUM_WEEKS,
+    }
+
+
+def time(function, number: int = 20) -> float:
+    """ Get the median time of a function call in milliseconds """
+
+    times = []
+    for _ in range(number):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+
+    return median(times) * 1000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    data = timetable_data(min(count, NUM_WEEKS * 32))
+    text = json.dumps(data)
+    model = TimetableModel.from_data(json.loads(text))
+    minutes = [datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=i) for i in range(1440)]
+
+    results = {
+        'Load from JSON': time(lambda: TimetableModel.from_data(json.loads(text))),
+        'Serialise to JSON': time(model.get_json),
+        'Events in every week': time(lambda: [model.events.week(week) for week in range(NUM_WEEKS)]),
+        'Session at every minute': time(lambda: [model.get_session(now) for now in minutes]),
+        'Timeslot of every session': time(lambda: [model.get_timeslot_index(session) for session in range(6) for _ in range(1000)]),
+    }
+
+    print(f'{len(data["events"])} events, median of 20 runs\n')
+    for name, elapsed in results.items():
+        print(f'{name:28}{elapsed:10.2f} ms')
+
+    print(f'\nTkinter imported: {"tkinter" in sys.modules}')
+
+
+if __name__ == '__main__':
+    main()
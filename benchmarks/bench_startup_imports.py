@@ -0,0 +1,90 @@
+"""
+Benchmark for the import time of the main script at startup.
+
+Runs the top-level imports of `TimetableV2_21.py` in a fresh interpreter with `-X importtime`, with and without the imports that are now deferred until they are first used (reportlab and webbrowser for PDF export, and idlelib for the event text highlighting).
+The imports are read from the main script, so the benchmark does not start the program. Modules that are not installed are skipped and reported.
+
+Usage: python benchmarks/bench_startup_imports.py [number of runs]
+"""
+
+from statistics import median
+from time import perf_counter
+import subprocess
+import sys
+import ast
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # The repository root
+
+## The imports that were made at startup before they were deferred
+DEFERRED_IMPORTS = [
+    'import idlelib.colorizer as ic',
+    'import idlelib.percolator as ip',
+    'import webbrowser',
+    'from reportlab.lib.colors import HexColor, Color',
+    'from reportlab.lib import units',
+    'from reportlab.platypus import Table',
+    'from reportlab.platypus.flowables import Flowable',
+    'from reportlab.pdfbase import pdfmetrics',
+    'from reportlab.pdfgen.canvas import Canvas',
+    'from reportlab.pdfbase.ttfonts import TTFont',
+]
+
+
+def startup_imports() -> list[str]:
+    """ Get the top-level import statements of the main script """
+
+    with open(os.path.join(ROOT, 'TimetableV2_21.py'), encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def run(statements: list[str]) -> tuple[float, float, list[str]]:
+    """
+    Run import statements in a fresh interpreter.
+
+    :param statements: The import statements to run
+    :return: The wall time of the interpreter in milliseconds, the total import time in milliseconds, and the statements that failed
+    """
+
+    ## Run each statement separately, so a missing module does not stop the other imports
+    code = '\n'.join(f'try:\n    {v}\nexcept ImportError:\n    print({v!r})' for v in statements)
+
+    start = perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, capture_output=True, text=True)
+    elapsed = perf_counter() - start
+
+    ## Add the cumulative time of the modules imported directly by the statements (lines in the format 'import time: <self> | <cumulative> | <name>')
+    total = 0
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:'):
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit() and not name[1:].startswith(' '):
+                total += int(cumulative)
+
+    return elapsed * 1000, total / 1000, result.stdout.splitlines()
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    after = startup_imports()
+    before = after + [v for v in DEFERRED_IMPORTS if v not in after]
+
+    results = {}
+    for name, statements in (('Before', before), ('After', after)):
+        runs = [run(statements) for _ in range(number)]
+        results[name] = (median(v[0] for v in runs), median(v[1] for v in runs))
+
+        if runs[0][2]:
+            print(f'{name}: skipped imports that are not installed:\n' + ''.join(f'    {v}\n' for v in runs[0][2]))
+
+    print(f'Median of {number} runs (ms)\n')
+    print(f'{"":10}{"Interpreter":>16}{"Imports":>16}')
+    for name, (elapsed, total) in results.items():
+        print(f'{name:10}{elapsed:16.1f}{total:16.1f}')
+
+
+if __name__ == '__main__':
+    main()
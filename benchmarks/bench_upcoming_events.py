@@ -0,0 +1,132 @@
+"""
+Benchmark for opening the upcoming events list of a large timetable.
+
+Compares creating a widget for every upcoming event in a `ScrollableFrame` against displaying the events in a `VirtualScrollableFrame`, which only creates widgets for the visible events.
+The rows use the same layout as `UpcomingEvent`. Requires a display.
+
+Usage: python benchmarks/bench_upcoming_events.py [number of events ...]
+"""
+
+from time import perf_counter
+import tkinter as tk
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Import modules from the repository root
+
+from CustomWidgets import AutoScrollbar, ScrollableFrame, VirtualScrollableFrame, MouseoverButton
+
+
+class Row(tk.Frame):
+    """ A row with the same widgets as an `UpcomingEvent` widget """
+
+    def __init__(self, master, item: int = None) -> None:
+        super().__init__(master, background='#000', padx=2)
+        self.columnconfigure(0, weight=1)
+
+        labelconfig = dict(background='#303841', foreground='#D8DEE9', font=('Calibri', 11), highlightthickness=1, highlightbackground='#3B434C')
+
+        frame = tk.Frame(self, background='#222')
+        frame.grid(row=0, column=0, sticky='nswe', pady=(20, 3))
+        frame.columnconfigure(1, weight=1)
+        tk.Label(frame, width=3, **labelconfig).grid(row=0, column=0, sticky='nswe')
+        self.title = tk.Label(frame, anchor='w', **labelconfig)
+        self.title.grid(row=0, column=1, sticky='nswe', padx=(1, 0))
+
+        self.time_remaining = tk.Label(self, **labelconfig)
+        self.time_remaining.grid(row=1, column=0, sticky='nswe', pady=(0, 3))
+
+        frame = tk.Frame(self, background='#222')
+        frame.grid(row=2, column=0, sticky='nswe', pady=(0, 3))
+        frame.columnconfigure((0, 1, 2), weight=1)
+        self.values = []
+        for i, name in enumerate(('Date', 'Day', 'Session')):
+            tk.Label(frame, text=name, **labelconfig).grid(row=0, column=i, sticky='nswe', pady=(0, 1))
+            label = tk.Label(frame, height=2, **labelconfig)
+            label.grid(row=1, column=i, sticky='nswe')
+            self.values.append(label)
+
+        self.text = tk.Label(self, anchor='nw', **labelconfig)
+        self.text.grid(row=3, column=0, sticky='nswe', pady=(0, 3))
+
+        MouseoverButton(self, text='View Event', background='#3B434C', foreground='#D8DEE9', mouseoverbackground='#3B434C').grid(row=4, column=0, sticky='nswe')
+
+        if item is not None:
+            self.set_item(item)
+
+    def set_item(self, item: int) -> None:
+        """ Display an item """
+
+        self.title.configure(text=f'Event {item}')
+        self.time_remaining.configure(text=f'Due in {item} minutes')
+        for label, value in zip(self.values, (f'{item % 28 + 1} Jan', f'Week {item // 77}', f'Session {item % 11}')):
+            label.configure(text=value)
+        self.text.configure(text=f'Text for event {item}')
+
+
+def open_full(master, count: int) -> float:
+    """ Time opening a `ScrollableFrame` with a row widget for every event """
+
+    start = perf_counter()
+
+    scrollbar = AutoScrollbar(master, orient='vertical')
+    frame = ScrollableFrame(master, vscrollbar=scrollbar, c_background='#000', f_background='#000')
+    frame.grid(row=0, column=0, sticky='nswe')
+    for i in range(count):
+        Row(frame.frame, i).pack(fill='x')
+    master.update()
+
+    elapsed = perf_counter() - start
+
+    frame.canvas.destroy()
+    scrollbar.destroy()
+    return elapsed
+
+
+def open_virtual(master, count: int) -> float:
+    """ Time opening a `VirtualScrollableFrame` with the same events """
+
+    start = perf_counter()
+
+    scrollbar = AutoScrollbar(master, orient='vertical')
+    frame = VirtualScrollableFrame(master, create_row=lambda parent, kind: Row(parent), bind_row=lambda row, item: row.set_item(item), row_height=lambda item: 180, vscrollbar=scrollbar, c_background='#000')
+    frame.grid(row=0, column=0, sticky='nswe')
+    frame.set_items(range(count))
+    master.update()
+
+    elapsed = perf_counter() - start
+
+    ## Time scrolling through the list
+    start = perf_counter()
+    for i in range(50):
+        frame.canvas.yview_moveto(i / 50)
+        master.update()
+    scroll = (perf_counter() - start) / 50
+
+    print(f'{"":10}{"":20}{len(frame.visible_rows()):>12} rows displayed, {scroll * 1000:.2f} ms per scroll step')
+
+    frame.canvas.destroy()
+    scrollbar.destroy()
+    return elapsed
+
+
+def main() -> None:
+    counts = [int(v) for v in sys.argv[1:]] or [100, 1000, 10000]
+
+    root = tk.Tk()
+    root.geometry('400x800')
+    root.rowconfigure(0, weight=1)
+    root.columnconfigure(0, weight=1)
+
+    for count in counts:
+        print(f'{count} events')
+        virtual = open_virtual(root, count)
+        full = open_full(root, count)
+        print(f'{"":10}{"ScrollableFrame":20}{full * 1000:12.1f} ms')
+        print(f'{"":10}{"Virtual":20}{virtual * 1000:12.1f} ms\n')
+
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
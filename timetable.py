@@ -0,0 +1,130 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+from time import perf_counter
+import argparse
+import glob
+import sys
+import os
+
+
+def expand_paths(patterns: list[str]) -> list[str]:
+    """
+    Expand wildcard patterns in the input paths. The Windows command prompt does not expand wildcards, so they are expanded here.
+
+    :param patterns: The input paths and wildcard patterns
+    :return: The matching paths in order, without duplicates
+    """
+
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(v for v in matches if v not in paths)
+
+    return paths
+
+
+def output_path(path: str, output_dir: Optional[str]) -> str:
+    """
+    Get the path of the PDF file for a timetable file.
+
+    :param path: The path of the timetable file
+    :param output_dir: The directory to write the PDF file to. Leave blank to write it next to the timetable file.
+    :return: The path of the PDF file
+    """
+
+    filename = path.removesuffix('.json').removesuffix('.txt') + '.pdf'
+    return filename if output_dir is None else os.path.join(output_dir, os.path.basename(filename))
+
+
+def export(args: argparse.Namespace) -> int:
+    """
+    Export timetable files to PDF, spreading the files over a pool of worker processes.
+
+    :param args: The parsed command line arguments
+    :return: The exit code of the program
+    """
+
+    import timetable_export  # Import the export module when it is used, so reportlab is not loaded to show the help text
+
+    if args.preset not in timetable_export.PAGE_PRESETS:
+        print(f'Unknown preset {args.preset!r}. Choose from: ' + ', '.join(repr(v) for v in timetable_export.PAGE_PRESETS), file=sys.stderr)
+        return 1
+    if args.jobs is not None and args.jobs < 1:
+        print('The number of worker processes must be at least 1.', file=sys.stderr)
+        return 1
+
+    paths = expand_paths(args.files)
+    if not paths:
+        print('No timetable files found.', file=sys.stderr)
+        return 1
+
+    ## Get the output path for each file, and check that no two files would be written to the same PDF
+    outputs = {path: output_path(path, args.output_dir) for path in paths}
+    if len(set(outputs.values())) < len(outputs):
+        print('Some of the timetable files have the same name, so their PDF files would overwrite each other. Export them to separate directories.', file=sys.stderr)
+        return 1
+
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    ## Register the fonts before starting the workers, so a missing font is reported once instead of for every file
+    try:
+        timetable_export.register_fonts()
+    except Exception as exc:
+        print(f'Could not load the fonts used by the PDF: {exc}', file=sys.stderr)
+        return 1
+
+    workers = min(args.jobs or os.cpu_count() or 1, len(paths))
+    failed = 0
+    start = perf_counter()
+
+    if workers == 1:  # Export in this process, rather than paying for starting a worker process
+        for path in paths:
+            try:
+                timetable_export.export_file(path, outputs[path], args.preset)
+            except Exception as exc:
+                print(f'Failed to export {path}: {exc}', file=sys.stderr)
+                failed += 1
+    else:
+        ## Each worker registers the fonts once when it starts, rather than once per file
+        with ProcessPoolExecutor(max_workers=workers, initializer=timetable_export.register_fonts) as executor:
+            futures = {executor.submit(timetable_export.export_file, path, outputs[path], args.preset): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exc:
+                    print(f'Failed to export {futures[future]}: {exc}', file=sys.stderr)
+                    failed += 1
+
+    elapsed = perf_counter() - start
+    exported = len(paths) - failed
+    print(f'Exported {exported} of {len(paths)} files in {elapsed:.2f} s ({exported / elapsed:.1f} files/s, {workers} worker{"s" if workers != 1 else ""})')
+
+    return 1 if failed else 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    :param argv: The command line arguments. Leave blank to use the arguments the program was started with.
+    :return: The exit code of the program
+    """
+
+    parser = argparse.ArgumentParser(prog='timetable', description='Command line tools for timetable files.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='Export timetable files to another format.', description='Export timetable files to another format. Files are exported in parallel over a pool of worker processes.')
+    export_parser.add_argument('files', nargs='+', help='The timetable files to export. Wildcards (e.g.: dir/*.json) are expanded.')
+    export_parser.add_argument('--format', choices=['pdf'], default='pdf', help='The format to export to (default: pdf).')
+    export_parser.add_argument('--preset', default='A4 (Portrait)', help='The name of the page preset of the PDF, e.g.: "2x1 Timetable" (default: A4 (Portrait)).')
+    export_parser.add_argument('--output-dir', help='The directory to write the exported files to. Leave blank to write each file next to its timetable file.')
+    export_parser.add_argument('--jobs', type=int, help='The number of worker processes (default: the number of CPUs).')
+    export_parser.set_defaults(func=export)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
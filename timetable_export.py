@@ -0,0 +1,366 @@
+from typing import Iterable, Optional
+import json
+
+from reportlab.lib.colors import HexColor, Color  # noqa
+from reportlab.lib import units
+from reportlab.platypus import Table
+from reportlab.platypus.flowables import Flowable
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.pdfbase.ttfonts import TTFont
+
+## The multipliers for the units of the page, table, margin, and corner sizes
+UNITS = {'cm': units.cm, 'mm': units.mm, 'pt': units.pica, 'px': 1, 'in': units.inch}
+
+## The fonts used by the output PDF, and the font files they are loaded from
+FONTS = {
+    'Calibri-Bold': 'calibrib.ttf',
+    'Calibri': 'calibri.ttf',
+}
+
+## Layout formatting presets for the output PDF. Other presets can be added here and be used by the program
+PAGE_PRESETS = {
+    # Preset Name   |  Width | Height | Table width | Table height | Horizontal margin | Vertical margin | Size units | Table size units | Margin Units  # noqa
+    '2x1 Timetable' : (22,     12,      'Auto',       'Auto',        1.0,                1.0,              'cm',        'cm',              'cm'),        # noqa
+    'A4 (Portrait)' : (29.7,   40,      'Auto',       'Auto',        1.5,                1.5,              'cm',        'cm',              'cm'),        # noqa
+    'A5 (Portrait)' : (21,     29.7,    'Auto',       'Auto',        1.5,                1.5,              'cm',        'cm',              'cm'),        # noqa
+    'A4 (Landscape)': (29.7,   40,      'Auto',       'Auto',        1.0,                1.0,              'cm',        'cm',              'cm'),        # noqa
+    'A5 (Landscape)': (21,     29.7,    'Auto',       'Auto',        1.0,                1.0,              'cm',        'cm',              'cm'),        # noqa
+}
+
+## Default formatting for each part of the output timetable
+DEFAULT_FORMATTING = {
+    'first_row': {
+        'BACKGROUND': '#D3D3D3',
+        'FOREGROUND': '#000000',
+        'GRID': (1, '#000000'),
+        'FONT': ('Calibri-Bold',),
+        'FONTSIZE': 'Auto',
+        'ORIENT': 'horizontal',
+        'ALIGN': ('CENTER',),
+        'VALIGN': ('MIDDLE',),
+        'BOTTOMPADDING': (0,),
+    },
+
+    'first_column': {
+        'BACKGROUND': '#D3D3D3',
+        'FOREGROUND': '#000000',
+        'GRID': (1, '#000000'),
+        'FONT': ('Calibri-Bold',),
+        'FONTSIZE': 'Auto',
+        'ORIENT': 'vertical',
+        'ALIGN': ('CENTER',),
+        'VALIGN': ('MIDDLE',),
+        'BOTTOMPADDING': (0,),
+    },
+
+    'break': {
+        'BACKGROUND': '#D3D3D3',
+        'FOREGROUND': '#000000',
+        'GRID': (0.5, '#000000'),
+        'FONT': ('Calibri-Bold',),
+        'FONTSIZE': 'Auto',
+        'ORIENT': 'horizontal',
+        'ALIGN': ('CENTER',),
+        'VALIGN': ('MIDDLE',),
+        'BOTTOMPADDING': (0,),
+    },
+
+    'sessionname': {
+        'BACKGROUND': '#FFFFFF',
+        'FOREGROUND': '#000000',
+        'GRID': (0.5, '#000000'),
+        'FONT': ('Calibri-Bold',),
+        'FONTSIZE': 'Auto',
+        'ORIENT': 'horizontal',
+        'ALIGN': ('CENTER',),
+        'VALIGN': ('MIDDLE',),
+        'BOTTOMPADDING': (0,),
+    },
+
+    'body': {
+        'BACKGROUND': '#FFFFFF',
+        'FOREGROUND': '#000000',
+        'GRID': (0.5, '#000000'),
+        'FONT': ('Calibri',),
+        'FONTSIZE': 'Auto',
+        'ORIENT': 'horizontal',
+        'ALIGN': ('CENTER',),
+        'VALIGN': ('MIDDLE',),
+        'BOTTOMPADDING': (0,),
+    }
+}
+
+## Default table style options added after the formatting (the weekend 'Homework' cells span every session)
+DEFAULT_TABLESTYLE = [
+    ('SPAN', (-2, 2), (-2, -1)),
+    ('SPAN', (-1, 2), (-1, -1)),
+]
+
+## Default corner radii of the table in the format (NW, NE, SW, SE)
+DEFAULT_CORNER_RADII = (2.5, 2.5, 2.5, 2.5)
+
+
+class VerticalText(Flowable):
+    """
+    Rotates a text in a table cell.
+    From: https://stackoverflow.com/a/40349017
+
+    :param text: The text to display
+    :bottompadding: The spacing on the bottom of the text that becomes the padding on the right-hand side.
+    """
+
+    def __init__(self, text: str, bottompadding: float | int = 0) -> None:
+        Flowable.__init__(self)
+        self.text = text
+        self.bottompadding = bottompadding
+
+    def draw(self) -> None:
+        """
+        Add the text to the canvas
+        """
+
+        canvas = self.canv
+        canvas.rotate(90)
+        fs = canvas._fontsize
+        canvas.translate(1, -fs / 1.2)  # canvas._leading?
+        canvas.drawString(0, self.bottompadding, self.text)
+
+    def wrap(self, a_w: float, a_h: float) -> tuple[float, float]:
+        """
+        Wrap the text on the canvas
+        """
+
+        canv = self.canv
+        fn, fs = canv._fontname, canv._fontsize
+        return canv._leading, 1 + canv.stringWidth(self.text, fn, fs)
+
+
+def register_fonts() -> None:
+    """
+    Register the fonts used by the output PDF with reportlab.
+    Loading a font file is slow, so fonts that are already registered in the current process are skipped.
+    """
+
+    registered = pdfmetrics.getRegisteredFontNames()
+    for name, filename in FONTS.items():
+        if name not in registered:
+            pdfmetrics.registerFont(TTFont(name, filename))
+
+
+def table_data(timetable_data: dict) -> tuple[list, list[tuple], list, list, list]:
+    """
+    Get the text of the table cells and the spans of the session headers and breaks from timetable data.
+
+    :param timetable_data: The timetable data, with the same keys as a timetable JSON file
+    :return: The table text data, the table style options, and the indexes of the session headers, session name cells, and session break cells
+    """
+
+    tablestyle = []  # Define an array for the table style options
+
+    data = [['', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']]  # Define an array for the table text data
+
+    sessionname_idxs = [((-2, 1), (-1, -1))]  # Define a list for the indexes of 'session name' cells
+    break_idxs = []  # Define a list for the indexes of the 'session break' cells
+    break_count = 0  # Define a counter for the number of 'break' cells
+    v_header_indexes = []  # Define a list for the indexes of the session name headers
+
+    ## Iterate through each session in the timetable data
+    for n, i in enumerate(timetable_data['sessions']):
+        if i[1]:  # If the session is not a session break
+            ## Add the indexes of the session name and session header to their respective lists
+            sessionname_idxs.append([(1, len(data)), (-3, len(data))])
+            v_header_indexes.append([(0, len(data)), (0, len(data) + 2)])
+
+            tablestyle.append(('SPAN', (0, len(data)), (0, len(data) + 2)))  # Configure the session header to span three rows
+
+            line_data = [[i[0]], [''], ['']]  # Initiate a list for the row’s text with the values of the first column
+
+            ## Add the text for each class in the session’s time slot to the text list
+            for day_num, day in enumerate(timetable_data['timetable']):
+                class_index = day[n - break_count]
+                if class_index is None:  # Leave the cells of empty time slots blank
+                    for line in line_data:
+                        line.append('')
+                    continue
+
+                line_data[0].append(timetable_data['classes'][class_index])
+                line_data[1].append(timetable_data['teachers'][class_index])
+                line_data[2].append(timetable_data['rooms'][class_index])
+
+            data.extend(line_data)  # Add the session text to the table data
+        else:  # Otherwise (the session is a break)
+            break_count += 1  # Increment the number of breaks
+            break_idxs.append([(0, len(data)), (-3, len(data))])  # Add the indexes of the break to the respective list
+
+            tablestyle.append(('SPAN', (0, len(data)), (-3, len(data))))  # Configure the table to span to the 1st to 3rd last columns
+            data.append(i[0])  # Add the break text to the table data
+
+    data[1].extend(['Homework'] * 2)  # Add the text for saturday and sunday
+
+    return data, tablestyle, v_header_indexes, sessionname_idxs, break_idxs
+
+
+def export_pdf(timetable_data: dict, output_filename: str, width: float | str, height: float | str, table_width: float | str, table_height: float | str, h_margin: float | str, v_margin: float | str,
+               page_units: str = 'cm', table_units: str = 'cm', margin_units: str = 'cm', formatting: Optional[dict] = None, corners: Iterable[float | str] = DEFAULT_CORNER_RADII, corner_units: str = 'cm',
+               custom_styles: Iterable[tuple] = DEFAULT_TABLESTYLE) -> None:
+    """
+    Convert timetable data to a table in a PDF.
+    The page layout arguments are in the same order as the values of a page preset, so a preset can be passed directly (e.g.: `export_pdf(data, filename, *PAGE_PRESETS['A4 (Portrait)'])`).
+
+    :param timetable_data: The timetable data, with the same keys as a timetable JSON file
+    :param output_filename: The path of the PDF file to write
+    :param width: The width of the page
+    :param height: The height of the page
+    :param table_width: The width of the table, or 'Auto' to fill the page between the margins
+    :param table_height: The height of the table, or 'Auto' to fill the page between the margins
+    :param h_margin: The horizontal margin
+    :param v_margin: The vertical margin
+    :param page_units: The units of the page size
+    :param table_units: The units of the table size ('%' for a percentage of the page between the margins)
+    :param margin_units: The units of the margins ('%' for a percentage of the page size)
+    :param formatting: The formatting for each part of the table, in the same format as `DEFAULT_FORMATTING`. Leave blank to use the default formatting.
+    :param corners: The radius of each corner of the table in the format (NW, NE, SW, SE)
+    :param corner_units: The units of the corner radii ('%' for a percentage of half of the shortest side of the table)
+    :param custom_styles: Table style options added after the formatting
+    """
+
+    formatting = DEFAULT_FORMATTING if formatting is None else formatting
+
+    data, tablestyle, v_header_indexes, sessionname_idxs, break_idxs = table_data(timetable_data)
+
+    page_unit = UNITS[page_units]  # Get the multiplier corresponding to the units selected for the page size
+
+    ## Calculate the document dimensions
+    doc_w = float(width) * page_unit
+    doc_h = float(height) * page_unit
+
+    ## Calculate the size of the margins for the document
+    if margin_units == '%':  # If the input value is a percentage, calculate the margins as a percentage of the document dimensions
+        margin = [doc_w * (float(h_margin) / 100), doc_h * (float(v_margin) / 100)]
+    else:
+        margin_unit = UNITS[margin_units]  # Get the multiplier for the units selected for the margins
+        margin = [float(h_margin) * margin_unit, float(v_margin) * margin_unit]  # Calculate the margins
+
+    table_unit = {**UNITS, '%': 1}[table_units]  # Get the multiplier for the units selected for the table size. '%' is given a multiplier of 1 as a placeholder
+
+    if str(table_width).lower() == 'auto':  # If the table width is 'Auto', set the table width to the document width minus the margins
+        tablewidth = doc_w - margin[0] * 2
+    else:
+        if table_units == '%':  # Otherwise, if the selected unit is '%', calculate the table width as a percentage of the document width, minus the margins.
+            tablewidth = (doc_w - margin[0] * 2) * (float(table_width) / 100)
+        else:
+            tablewidth = float(table_width) * table_unit  # Calculate the table width
+
+    if str(table_height).lower() == 'auto':  # If the table height is 'Auto', set the table height to the document height minus the margins
+        tableheight = doc_h - margin[1] * 2
+    else:
+        if table_units == '%':  # Otherwise, if the selected unit is '%', calculate the table height as a percentage of the document height, minus the margins.
+            tableheight = (doc_h - margin[1] * 2) * (float(table_height) / 100)
+        else:
+            tableheight = float(table_height) * table_unit  # Calculate the table height
+
+    ## todo: add column and row size distribution to export config
+
+    cw = [0.055] + [0.135] * 7  # Get relative column widths
+    cw = [v * tablewidth for v in cw]  # Multiply the relative column widths by the table width
+
+    rows = len(data) - 1  # Calculate the number of rows in the table
+    header_column_width = cw[0] / tableheight  # Get the pixel size of the first column’s width as a percentage of the table height so the first row and first column can be the same size
+    rh = [header_column_width] + [(1 - header_column_width) / rows] * rows  # Get the relative row heights
+    rh = [v * tableheight for v in rh]  # Multiply the relative row heights by the table height
+
+    font_sizes = dict()  # Define a dictionary to store the maximum font size corresponding to a certain height
+
+    register_fonts()  # Register the fonts to use
+
+    ## Loop through the formatting options and the indexes of the row with the height to fit to.
+    for key, row in [('first_row', 0), ('first_column', 1), ('body', 1), ('sessionname', 1), ('break', 1)]:
+        if formatting[key]['FONTSIZE'] == 'Auto':
+            height = rh[row]  # Get the height at the formating option’s row index
+            font = formatting[key]['FONT'][0]  # Get the font of the formatting option
+
+            if f'{height}.{font}' not in font_sizes:  # Check if the font size has already been calculated for the font name and row height
+                font_size = 1  # Declare a variable for the font size
+
+                face = pdfmetrics.getFont(font).face  # Get the size of the font size
+                face = (face.ascent - face.descent) / 1000  # Get the difference between the font’s ascent and descent
+
+                while face * (font_size + 0.5) < height / 2:  # While if the height of the font at the current size, plus 0.5, is less than half the available height.
+                    font_size += 0.5  # Add 0.5 to the current font size
+                font_sizes.update({f'{height}.{font}': font_size})  # Add the calculated font size to the dictionary, indexed by the available height and face name
+
+    ## Add the formatting options for each cell type
+    for key, ranges in [('body', [((1, 1), (-3, -1))]), ('first_row', [((0, 0), (-1, 0))]), ('first_column', v_header_indexes), ('sessionname', sessionname_idxs), ('break', break_idxs)]:  # For each of the style options and their calculated ranges
+        for pos in ranges:  # Iterate through each index of the current cell type
+            for k, v in formatting[key].items():  # Iterate through each style option and the corresponding value for the cell type
+                ## Match the style option
+                match k:
+                    case 'FONTSIZE':
+                        if v == 'Auto':  # If the font size is 'Auto', use the pre-calculated font size for the height
+                            if key == 'first_row':
+                                font_size = font_sizes[str(rh[0]) + '.' + formatting[key]['FONT'][0]]
+                            else:
+                                font_size = font_sizes[str(rh[1]) + '.' + formatting[key]['FONT'][0]]
+                        else:  # Otherwise, use the font size as is.
+                            font_size = float(v)
+                        tablestyle.append((k, *pos, font_size))  # Add the font size formatting to the table style array
+                    case 'ORIENT':
+                        if v.lower() == 'vertical':  # If the orientation is vertical
+                            updated_lines = []  # Declare an empty array to hold the updated text
+                            for y in data[pos[0][1]:pos[1][1] + (1 if pos[1][1] >= 0 else -1)]:  # Iterate through the rows in the current index range
+                                line = y  # Copy the current row
+                                vertical_slice = slice(pos[0][0], pos[1][0] + (1 if pos[1][0] >= 0 else -1))  # Pre-calculate a slice for the columns in the current index range
+                                line[vertical_slice] = [x if x.strip('\n\t ') == '' else VerticalText(x, formatting[key]['BOTTOMPADDING'][0]) for x in line[vertical_slice]]  # Iterate through the columns in the current index range and convert the string to a VerticalText widget if it is not empty. Insert the result into the current line
+                                updated_lines.append(line)  # Add the current line into the `updated_lines` array
+                            data[pos[0][1]:pos[1][1] + (1 if pos[1][1] >= 0 else -1)] = updated_lines  # Replace the lines in the current index range in the data array with the corresponding lines in the `updated_lines` array
+                    case 'BOTTOMPADDING':
+                        if formatting[key]['ORIENT'].lower() != 'vertical':  # If the orientation is not vertical, add the bottom padding to the style config (If the orientation is vertical, the bottom padding is added to the VerticalText class)
+                            tablestyle.append((k, *pos, *v))
+                    ## Calculate the colour object using the input hex data and add the result to the table style array
+                    case 'GRID':
+                        tablestyle.append((k, *pos, v[0], HexColor(v[1])))
+                    case 'BACKGROUND':
+                        tablestyle.append((k, *pos, HexColor(v)))
+                    case 'FOREGROUND':
+                        tablestyle.append((k, *pos, HexColor(v)))
+                    case _:
+                        tablestyle.append((k, *pos, *v))
+
+    corner_unit = {**UNITS, '%': min(tablewidth, tableheight) / 200}[corner_units]  # Get the multiplier for the units selected for the table size. '%' is calculated as a percentage of half of the shortest side length of the page (the maximum possible radius)
+    corners = [float(i) * corner_unit for i in corners]  # Calculate the radius for each corner
+
+    tablestyle.extend(custom_styles)  # Add the custom style options to the end of the table formatting
+
+    canvas = Canvas(output_filename, (doc_w, doc_h))  # Create a new PDF
+
+    table = Table(
+        data, style=tablestyle,
+        colWidths=cw, rowHeights=rh,
+        cornerRadii=corners
+    )  # Create a new table object with the data calculated above
+
+    table.wrapOn(canvas, 0, 0)  # Set the wrap for the canvas
+    table.drawOn(canvas, margin[0], doc_h - margin[1] - tableheight)  # Add the table to the canvas at the top left cornet, plus the margins
+    canvas.save()  # Save the output PDF
+
+    ## todo: add omit weekends, omit rooms, omit teachers to export PDF config.
+    ## todo: Add events to PDF conversion
+
+
+def export_file(path: str, output_filename: str, preset: str, encoding: str = 'utf-8') -> str:
+    """
+    Convert a timetable file to a table in a PDF using a page preset and the default formatting.
+
+    :param path: The path of the timetable file
+    :param output_filename: The path of the PDF file to write
+    :param preset: The name of the page preset (see `PAGE_PRESETS`)
+    :param encoding: The encoding of the timetable file
+    :return: The path of the timetable file
+    """
+
+    with open(path, encoding=encoding) as file:
+        timetable_data = json.load(file)
+
+    export_pdf(timetable_data, output_filename, *PAGE_PRESETS[preset])
+    return path
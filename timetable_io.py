@@ -0,0 +1,344 @@
+from typing import Generator, Iterable, Optional, TextIO, Any
+from functools import partial
+import threading
+import tempfile
+import shutil
+import queue
+import json
+import os
+
+## The number of weeks in a term for timetable files that do not specify one
+DEFAULT_NUM_WEEKS = 12
+
+## Encode JSON values without escaping non-ASCII characters, so the output matches the text typed by the user
+dumps = partial(json.dumps, ensure_ascii=False)
+
+
+def iter_timetable_json(data: dict) -> Generator[str, None, None]:
+    """
+    Yield the JSON formatted text representing a timetable as a series of chunks.
+    Each event is yielded as a separate chunk, so the document can be written to a file without being held in memory as a single string.
+
+    :param data: The timetable data, with the same keys as a timetable JSON file (see `TimeTable.get_data`)
+    :return: A generator yielding the chunks of the JSON document
+    """
+
+    ## Classes, teachers, and rooms
+    yield '{\n'
+    yield f'    "classes": {dumps(data["classes"])},\n'
+    yield f'    "teachers": {dumps(data["teachers"])},\n'
+    yield f'    "rooms": {dumps(data["rooms"])},\n'
+
+    ## Class mapping (one line per day)
+    yield '    "timetable": [\n'
+    yield ',\n'.join(f'        {dumps(day)}' for day in data['timetable'])
+    yield '\n    ],\n    "events": ['
+
+    ## Events (one chunk per event). The separator is added to the start of the chunk so the last event is not followed by a comma.
+    separator = ''
+    for event in data['events']:
+        yield separator + '\n        {\n            ' + ',\n            '.join(f'{dumps(k)}: {dumps(v)}' for k, v in event.items()) + '\n        }'
+        separator = ','
+
+    ## Sessions (one line per session)
+    yield '\n    ],\n    "sessions": [\n'
+    yield ',\n'.join(f'        {dumps(list(session))}' for session in data['sessions'])
+
+    ## Day and term start times
+    yield f'\n    ],\n    "day_start": {dumps(data["day_start"])},\n    "start_date_timestamp": {dumps(data["start_date_timestamp"])}'
+
+    ## Term length
+    if 'num_weeks' in data:
+        yield f',\n    "num_weeks": {dumps(data["num_weeks"])}'
+
+    ## Custom event types (one line per type)
+    if data.get('event_types'):
+        yield ',\n    "event_types": [\n'
+        yield ',\n'.join(f'        {dumps(event_type)}' for event_type in data['event_types'])
+        yield '\n    ]'
+    yield '\n}'
+
+
+def write_timetable_json(file: TextIO, data: dict) -> None:
+    """
+    Stream the JSON formatted text representing a timetable to a file object.
+
+    :param file: The file object to write to
+    :param data: The timetable data, with the same keys as a timetable JSON file
+    """
+
+    file.writelines(iter_timetable_json(data))
+
+
+def timetable_args(data: dict) -> tuple[list[str], list[str], list[str], list[list[int]], list[dict], str, list[list[str | bool]], int, int, list[dict]]:
+    """
+    Get the arguments for a timetable object from timetable data.
+
+    :param data: The timetable data, with the same keys as a timetable JSON file
+    :return: The data to be passed directly to a timetable object
+    """
+
+    return data['classes'], data['teachers'], data['rooms'], data['timetable'], data['events'], data['day_start'], data['sessions'], data['start_date_timestamp'], data.get('num_weeks', DEFAULT_NUM_WEEKS), data.get('event_types', [])
+
+
+def atomic_write(path: str, chunks: Iterable[str], encoding: str = 'utf-8') -> None:
+    """
+    Write text to a file atomically.
+    The text is written to a temporary file in the same directory, flushed to disk, and then moved over the target file, so the target is never left partially written.
+
+    :param path: The path of the file to write
+    :param chunks: The text to write as an iterable of strings
+    :param encoding: The encoding of the output file
+    """
+
+    path = os.path.abspath(path)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f'.{os.path.basename(path)}.', suffix='.tmp')  # Create a temporary file next to the target file
+
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as file:  # Write the text to the temporary file and flush it to disk
+            file.writelines(chunks)
+            file.flush()
+            os.fsync(file.fileno())
+
+        if os.path.exists(path):  # Keep the permissions of the existing file
+            shutil.copymode(path, temp_path)
+
+        os.replace(temp_path, path)  # Replace the target file with the temporary file
+    except BaseException:  # If writing fails for any reason, remove the temporary file and re-raise the exception
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SaveEngine:
+    """
+    Writes timetable files on a worker thread so that slow disks do not block the UI.
+
+    Save requests take a snapshot of the text to write on the calling thread. If several requests for the same path are submitted while the worker is busy, only the most recent snapshot is written.
+    Snapshots are written in the order they were submitted, so a snapshot is never overwritten by an older one written to another path after it (e.g.: an autosave queued before a save).
+    The result of each write is put in the `results` queue as a tuple in the format (path, token, exception), where the exception is None if the write succeeded. Tkinter is not thread safe, so the queue should be polled from the main thread.
+    """
+
+    def __init__(self) -> None:
+        self.results: queue.Queue[tuple[str, Any, Optional[Exception]]] = queue.Queue()  # The results of completed writes
+        self._pending: dict[str, tuple[list[str], str, Any]] = dict()  # The most recent snapshot waiting to be written for each path, in the order they were submitted
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, path: str, chunks: list[str], encoding: str = 'utf-8', token: Any = None) -> None:
+        """
+        Queue a snapshot to be written to a file.
+
+        :param path: The path of the file to write
+        :param chunks: The text to write as a list of strings
+        :param encoding: The encoding of the output file
+        :param token: A value returned with the result of the write, used to identify the snapshot that was written
+        """
+
+        with self._lock:
+            self._pending.pop(path, None)  # Replace any older snapshot for the same path that has not been written yet, moving the path to the end of the queue
+            self._pending[path] = (chunks, encoding, token)
+
+            ## Start the worker thread if it is not already running
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='SaveEngine')
+                self._thread.start()
+
+    def _run(self) -> None:
+        """ Write pending snapshots until none remain. Runs on the worker thread. """
+
+        while True:
+            with self._lock:
+                if not self._pending:  # If there are no pending snapshots, stop the worker thread
+                    self._thread = None
+                    return
+                path = next(iter(self._pending))  # Write the oldest pending snapshot first
+                chunks, encoding, token = self._pending.pop(path)
+
+            try:
+                atomic_write(path, chunks, encoding)
+                self.results.put((path, token, None))
+            except Exception as exc:  # Report the error to the main thread rather than losing it on the worker thread
+                self.results.put((path, token, exc))
+
+    def busy(self) -> bool:
+        """ Check if there are snapshots that have not been written yet """
+
+        with self._lock:
+            return self._thread is not None
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for all pending snapshots to be written.
+
+        :param timeout: The maximum time to wait in seconds. Leave blank to wait indefinitely.
+        """
+
+        with self._lock:
+            thread = self._thread
+
+        if thread is not None:
+            thread.join(timeout)
+
+    def poll(self) -> list[tuple[str, Any, Optional[Exception]]]:
+        """ Get the results of all writes completed since the last poll """
+
+        results = []
+        while True:
+            try:
+                results.append(self.results.get_nowait())
+            except queue.Empty:
+                return results
+
+
+## Suffixes for the crash-recovery files stored next to a timetable file
+JOURNAL_SUFFIX = '.journal'
+AUTOSAVE_SUFFIX = '.autosave'
+
+
+class Journal:
+    """
+    An append-only log of the changes made to a timetable since it was last saved.
+    Each line of the journal file is a JSON record of a single change. Records replace the whole state of what they describe, so replaying a record more than once has no effect.
+
+    Supported records:
+        - {"op": "event", "data": <event data>}: An event was created or edited
+        - {"op": "delete_event", "week": <week>, "day": <day>, "session": <session>}: An event was deleted
+        - {"op": "classes", "classes": [...], "teachers": [...], "rooms": [...], "timetable": [...]}: The classes or class mapping changed
+        - {"op": "term", "num_weeks": <number of weeks>}: The term length changed
+
+    :param path: The path of the timetable file that the journal belongs to
+    """
+
+    def __init__(self, path: str) -> None:
+        self.timetable_path = path
+        self.path = path + JOURNAL_SUFFIX
+        self.autosave_path = path + AUTOSAVE_SUFFIX
+        self.records: list[tuple[int, str]] = []  # The records appended since the journal was last compacted, with the revision at which they were appended
+
+    def append(self, records: list[dict], revision: int) -> None:
+        """
+        Append change records to the journal file.
+
+        :param records: The records to append
+        :param revision: The revision of the timetable data after the changes
+        """
+
+        lines = [dumps({'revision': revision, **record}) + '\n' for record in records]
+
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.writelines(lines)
+
+        self.records.extend((revision, line) for line in lines)
+
+    def compact(self, revision: int) -> None:
+        """
+        Remove the records that are included in a snapshot of the timetable data.
+
+        :param revision: The revision of the timetable data in the snapshot
+        """
+
+        self.records = [v for v in self.records if v[0] > revision]  # Keep the records made after the snapshot was taken
+
+        if self.records:
+            atomic_write(self.path, [line for _, line in self.records])
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+    def discard(self) -> None:
+        """ Remove the journal and autosave files """
+
+        self.records.clear()
+        discard_recovery_data(self.timetable_path)
+
+
+def has_recovery_data(path: str) -> bool:
+    """
+    Check if a timetable file has unsaved changes stored in its journal or autosave files.
+
+    :param path: The path of the timetable file
+    """
+
+    return os.path.exists(path + AUTOSAVE_SUFFIX) or (os.path.exists(path + JOURNAL_SUFFIX) and os.path.getsize(path + JOURNAL_SUFFIX) > 0)
+
+
+def discard_recovery_data(path: str) -> None:
+    """
+    Remove the journal and autosave files of a timetable file.
+
+    :param path: The path of the timetable file
+    """
+
+    for suffix in (JOURNAL_SUFFIX, AUTOSAVE_SUFFIX):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def read_journal(path: str) -> list[dict]:
+    """
+    Read the records from a journal file.
+    Lines that cannot be decoded (e.g.: a record that was being written when the program crashed) are skipped.
+
+    :param path: The path of the journal file
+    """
+
+    records = []
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            try:
+                records.append(json.loads(line))
+            except json.decoder.JSONDecodeError:
+                continue
+
+    return records
+
+
+def apply_journal(data: dict, records: list[dict]) -> dict:
+    """
+    Apply journal records to timetable data.
+
+    :param data: The timetable data, with the same keys as a timetable JSON file
+    :param records: The journal records to apply, in the order they were written
+    :return: The updated timetable data
+    """
+
+    events = {(v['week'], v['day'], v['session']): v for v in data['events']}  # Index the events by their timeslot
+
+    for record in records:
+        match record['op']:
+            case 'event':
+                event = record['data']
+                events[(event['week'], event['day'], event['session'])] = event
+            case 'delete_event':
+                events.pop((record['week'], record['day'], record['session']), None)
+            case 'classes':
+                for key in ('classes', 'teachers', 'rooms', 'timetable'):
+                    data[key] = record[key]
+            case 'term':
+                data['num_weeks'] = record['num_weeks']
+
+    data['events'] = [events[k] for k in sorted(events)]  # Sort the events by their timeslot
+    return data
+
+
+def recover_timetable(path: str, encoding: str = 'utf-8') -> dict:
+    """
+    Read a timetable file along with the unsaved changes stored in its autosave and journal files.
+
+    :param path: The path of the timetable file
+    :param encoding: The encoding of the timetable file
+    :return: The recovered timetable data
+    """
+
+    ## Start from the latest autosave if one exists, otherwise start from the timetable file
+    base_path = path + AUTOSAVE_SUFFIX if os.path.exists(path + AUTOSAVE_SUFFIX) else path
+    with open(base_path, encoding=encoding) as file:
+        data = json.load(file)
+
+    ## Replay the changes made since the autosave
+    if os.path.exists(path + JOURNAL_SUFFIX):
+        data = apply_journal(data, read_journal(path + JOURNAL_SUFFIX))
+
+    return data
@@ -0,0 +1,1003 @@
+from typing import Callable, Generator, Iterable, Optional, Any
+from operator import attrgetter
+from timetable_io import DEFAULT_NUM_WEEKS, iter_timetable_json, timetable_args, has_recovery_data, recover_timetable
+import datetime
+import itertools
+import bisect
+import json
+import math
+import time
+
+
+## The icon shapes available for event types, in the format (SVG view box, SVG path, icon width, mask width)
+EVENT_TYPE_SHAPES = {
+    'Event': ('0 0 512 512', 'M504 256c0 136.997-111.043 248-248 248S8 392.997 8 256C8 119.083 119.043 8 256 8s248 111.083 248 248zm-248 50c-25.405 0-46 20.595-46 46s20.595 46 46 46 46-20.595 46-46-20.595-46-46-46zm-43.673-165.346l7.418 136c.347 6.364 5.609 11.346 11.982 11.346h48.546c6.373 0 11.635-4.982 11.982-11.346l7.418-136c.375-6.874-5.098-12.654-11.982-12.654h-63.383c-6.884 0-12.356 5.78-11.981 12.654z', 10, 20),
+    'Info': ('0 0 512 512', 'M256 8C119.043 8 8 119.083 8 256c0 136.997 111.043 248 248 248s248-111.003 248-248C504 119.083 392.957 8 256 8zm0 110c23.196 0 42 18.804 42 42s-18.804 42-42 42-42-18.804-42-42 18.804-42 42-42zm56 254c0 6.627-5.373 12-12 12h-88c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h12v-64h-12c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h64c6.627 0 12 5.373 12 12v100h12c6.627 0 12 5.373 12 12v24z', 12, 20),
+    'Reminder': ('0 0 448 512', 'M224 512c35.32 0 63.97-28.65 63.97-64H160.03c0 35.35 28.65 64 63.97 64zm215.39-149.71c-19.32-20.76-55.47-51.99-55.47-154.29 0-77.7-54.48-139.9-127.94-155.16V32c0-17.67-14.32-32-31.98-32s-31.98 14.33-31.98 32v20.84C118.56 68.1 64.08 130.3 64.08 208c0 102.3-36.15 133.53-55.47 154.29-6 6.45-8.66 14.16-8.61 21.71.11 16.4 12.98 32 32.1 32h383.8c19.12 0 32-15.6 32.1-32 .05-7.55-2.61-15.27-8.61-21.71z', 12, 20),
+    'Bookmark': ('0 0 384 512', 'M0 512V48C0 21.49 21.49 0 48 0h288c26.51 0 48 21.49 48 48v464L192 400 0 512z', 12, 18),
+    'Assignment': ('0 0 576 512', 'M542.22 32.05c-54.8 3.11-163.72 14.43-230.96 55.59-4.64 2.84-7.27 7.89-7.27 13.17v363.87c0 11.55 12.63 18.85 23.28 13.49 69.18-34.82 169.23-44.32 218.7-46.92 16.89-.89 30.02-14.43 30.02-30.66V62.75c.01-17.71-15.35-31.74-33.77-30.7zM264.73 87.64C197.5 46.48 88.58 35.17 33.78 32.05 15.36 31.01 0 45.04 0 62.75V400.6c0 16.24 13.13 29.78 30.02 30.66 49.49 2.6 149.59 12.11 218.77 46.95 10.62 5.35 23.21-1.94 23.21-13.46V100.63c0-5.29-2.62-10.14-7.27-12.99z', 12, 21),
+    'Test': ('0 0 512 512', 'M79.18 282.94a32.005 32.005 0 0 0-20.24 20.24L0 480l4.69 4.69 92.89-92.89c-.66-2.56-1.57-5.03-1.57-7.8 0-17.67 14.33-32 32-32s32 14.33 32 32-14.33 32-32 32c-2.77 0-5.24-.91-7.8-1.57l-92.89 92.89L32 512l176.82-58.94a31.983 31.983 0 0 0 20.24-20.24l33.07-84.07-98.88-98.88-84.07 33.07zM369.25 28.32L186.14 227.81l97.85 97.85 199.49-183.11C568.4 67.48 443.73-55.94 369.25 28.32z', 12, 20),
+}
+
+## The built-in event types, in the format (name, colour, background colour, icon shape)
+BUILTIN_EVENT_TYPES = [
+    ('Event', '#e06c75', '#443E47', 'Event'),
+    ('Info', '#528bff', '#465E86', 'Info'),
+    ('Reminder', '#56b6c2', '#476975', 'Reminder'),
+    ('Bookmark', '#98c379', '#596D61', 'Bookmark'),
+    ('Assignment', '#c678dd', '#66587D', 'Assignment'),
+    ('Test', '#abb2bf', '#5E6875', 'Test'),
+]
+
+
+class Timeslot:
+    """
+    Base class for objects placed on a timeslot of a timetable.
+    The timeslot is cached as a (week, day, session) tuple, so comparisons between timeslots are a single tuple comparison.
+
+    Objects can be compared to other timeslots, or to tuples in either (week, day, session) or (day, session) format.
+
+    :param week: The week number of the timeslot
+    :param day: The day number of the timeslot (Monday = 0, Sunday = 6)
+    :param session: The session number of the timeslot
+    """
+
+    __slots__ = ('timeslot',)
+
+    def __init__(self, week: int, day: int, session: int) -> None:
+        self.timeslot: tuple[int, int, int] = (week, day, session)
+
+    @property
+    def week(self) -> int:
+        return self.timeslot[0]
+
+    @week.setter
+    def week(self, value: int) -> None:
+        self.timeslot = (value, self.timeslot[1], self.timeslot[2])
+
+    @property
+    def day(self) -> int:
+        return self.timeslot[1]
+
+    @day.setter
+    def day(self, value: int) -> None:
+        self.timeslot = (self.timeslot[0], value, self.timeslot[2])
+
+    @property
+    def session(self) -> int:
+        return self.timeslot[2]
+
+    @session.setter
+    def session(self, value: int) -> None:
+        self.timeslot = (self.timeslot[0], self.timeslot[1], value)
+
+    def _keys(self, other) -> tuple[tuple, tuple]:
+        """
+        Get the keys to use when comparing the timeslot to another value.
+
+        :param other: The timeslot or tuple to compare to
+        :return: The key of this timeslot and the key of the other value
+        """
+
+        if isinstance(other, Timeslot):
+            return self.timeslot, other.timeslot
+
+        other = tuple(other)
+        if len(other) == 2:  # If the other value is in (day, session) format, ignore the week number
+            return self.timeslot[1:], other
+
+        return self.timeslot, other
+
+    def __eq__(self, other) -> bool:
+        """ Check if the timeslot matches the input timeslot """
+        a, b = self._keys(other)
+        return a == b
+
+    def __lt__(self, other) -> bool:
+        """ Check if the timeslot occurs before the input timeslot """
+        a, b = self._keys(other)
+        return a < b
+
+    def __le__(self, other) -> bool:
+        """ Check if the timeslot occurs at the same time or earlier than the input timeslot """
+        a, b = self._keys(other)
+        return a <= b
+
+    def __gt__(self, other) -> bool:
+        """ Check if the timeslot occurs after the input timeslot """
+        a, b = self._keys(other)
+        return a > b
+
+    def __ge__(self, other) -> bool:
+        """ Check if the timeslot occurs at the same time or later than the input timeslot """
+        a, b = self._keys(other)
+        return a >= b
+
+    __hash__ = None  # Timeslots compare equal by value but are mutable, so they cannot be hashed
+
+    def __iter__(self) -> Generator[int, None, None]:
+        """ Yield the timeslot as an iterable """
+        yield from self.timeslot
+
+
+class EventData(Timeslot):
+    """
+    Stores the data of a single timetable event as plain Python values, without any UI state.
+
+    :param week: The week number of the event.
+    :param day: The day number of the event (Monday = 0, Sunday = 6).
+    :param session: The session number of the event.
+    :param text: The event text to store.
+    :param tags: The tags for the event (currently does nothing).
+    :param etype: The type string of the event.
+    :param title: The title of the event.
+    """
+
+    __slots__ = ('text', 'tags', 'etype', 'title', 'type_id')
+
+    def __init__(self, week: int, day: int, session: int, text: str, tags: Optional[list], etype: str, title: str) -> None:
+        super().__init__(week, day, session)
+
+        self.text = text
+        self.tags = tags
+        self.etype = etype
+        self.title = title
+        self.type_id: Optional[int] = None  # The id of the event’s type in the timetable’s event type registry, set when the event is added to a timetable (see `TimetableModel.create_event`)
+
+    def type(self) -> str:
+        """ Get the type string of the event """
+        return self.etype
+
+    def get_data(self) -> dict:
+        """
+        Get the event’s data in dictionary form to be written to a timetable JSON file
+        """
+
+        return dict(
+            title=self.title,
+            week=self.week,
+            day=self.day,
+            session=self.session,
+            text=self.text,
+            tags=self.tags,
+            etype=self.etype
+        )
+
+
+class EventStore:
+    """
+    Stores the events in a timetable, indexed by their timeslot.
+    Events are kept sorted by an integer timeslot key, so they can be inserted, removed, and searched with a binary search, and can be looked up by timeslot or by week without scanning every event.
+
+    Events are expected to have `week`, `day`, and `session` attributes. There can only be one event per timeslot.
+    If a type key is given, the number of events of each type in each week is also counted as events are added and removed.
+    The counts are stored as a matrix indexed by the week number and then the index of the type, and observers are notified of the weeks whose counts change (see `observe_counts` and `batch`).
+
+    :param events: The events to add to the store
+    :param sessions_per_day: The number of sessions in a day, used to calculate the timeslot key. This is increased automatically if an event has a higher session number.
+    :param type_key: A function taking an event that returns its type. Leave blank to not count event types.
+    :param types: The known event types, in the order of their indexes in the count matrix. Types that are not in the list are added when an event of that type is counted.
+    """
+
+    def __init__(self, events=(), sessions_per_day: int = 1, type_key: Optional[Callable[[Any], Any]] = None, types: Iterable = ()) -> None:
+        self.sessions_per_day = max(sessions_per_day, 1)
+        self.type_key = type_key
+
+        self.types: list = list(types)  # The event types, in the order of their indexes in the count matrix
+        self._type_ids: dict[Any, int] = {v: n for n, v in enumerate(self.types)}  # The index of each event type
+        self._observers: list[Callable[[set[int]], None]] = []  # The functions to call when the type counts change
+        self._changed_weeks: Optional[set[int]] = None  # The weeks whose type counts changed during the current batch, or None if no batch is in progress
+        self._batch_depth = 0
+
+        self._events: list = []  # All events, sorted by their timeslot key
+        self._keys: list[int] = []  # The timeslot key of each event in `_events`, used for binary searches
+        self._slots: dict[tuple[int, int, int], Any] = dict()  # The event at each timeslot, keyed by the week, day, and session number
+        self._weeks: dict[int, dict[tuple[int, int], Any]] = dict()  # The events in each week, keyed by the week number and then the day and session number
+        self._types: dict[tuple[int, int, int], int] = dict()  # The index of the type that each event was counted as, keyed by its timeslot
+        self._type_counts: dict[int, list[int]] = dict()  # The count matrix. The number of events of each type in each week, indexed by the week number and then the index of the type
+
+        for event in events:
+            key = (event.week, event.day, event.session)
+            if key in self._slots:  # Only one event is stored per timeslot
+                self._unindex(self._slots[key])
+            self._index(event)
+
+        ## Sort all the events at once rather than inserting them one at a time
+        if self._slots:
+            self.sessions_per_day = max(self.sessions_per_day, max(session for _, _, session in self._slots) + 1)
+        self._events = sorted(self._slots.values(), key=self.event_key)
+        self._keys = [self.event_key(v) for v in self._events]
+
+    def key(self, week: int, day: int, session: int) -> int:
+        """
+        Get the integer key of a timeslot. Keys are ordered in the same way as (week, day, session) tuples.
+
+        :param week: The week number of the timeslot
+        :param day: The day number of the timeslot
+        :param session: The session number of the timeslot
+        """
+
+        return (week * 7 + day) * self.sessions_per_day + session
+
+    def event_key(self, event) -> int:
+        """
+        Get the integer key of an event’s timeslot.
+
+        :param event: The event to get the key of
+        """
+
+        return (event.week * 7 + event.day) * self.sessions_per_day + event.session
+
+    def _index(self, event) -> None:
+        """ Add an event to the timeslot, week, and type count dictionaries """
+        self._slots[(event.week, event.day, event.session)] = event
+        self._weeks.setdefault(event.week, dict())[(event.day, event.session)] = event
+
+        if self.type_key is not None:
+            type_id = self.type_id(self.type_key(event))
+            self._types[(event.week, event.day, event.session)] = type_id
+            self._count(event.week, type_id, 1)
+
+    def _unindex(self, event) -> None:
+        """ Remove an event from the timeslot, week, and type count dictionaries """
+        del self._slots[(event.week, event.day, event.session)]
+
+        week = self._weeks[event.week]
+        del week[(event.day, event.session)]
+        if not week:  # Remove empty weeks so they do not accumulate
+            del self._weeks[event.week]
+
+        if self.type_key is not None:
+            self._count(event.week, self._types.pop((event.week, event.day, event.session)), -1)  # Use the type the event was counted as, in case its type has changed since
+
+    def _count(self, week: int, type_id: int, change: int) -> None:
+        """ Change the number of events of a type in a week and notify the observers """
+
+        counts = self._type_counts.get(week)
+        if counts is None:
+            counts = self._type_counts[week] = [0] * len(self.types)
+
+        counts[type_id] += change
+
+        if self._changed_weeks is not None:  # If a batch is in progress, notify the observers when it ends
+            self._changed_weeks.add(week)
+        else:
+            self._notify({week})
+
+    def _notify(self, weeks: set[int]) -> None:
+        """ Notify the observers that the type counts of the input weeks have changed """
+
+        for callback in list(self._observers):
+            callback(weeks)
+
+    def type_id(self, event_type: Any) -> int:
+        """
+        Get the index of an event type in the count matrix, adding the type if it is not already known.
+
+        :param event_type: The event type
+        """
+
+        type_id = self._type_ids.get(event_type)
+        if type_id is None:  # Add a column to the count matrix for the new type
+            type_id = self._type_ids[event_type] = len(self.types)
+            self.types.append(event_type)
+            for counts in self._type_counts.values():
+                counts.append(0)
+
+        return type_id
+
+    def observe_counts(self, callback: Callable[[set[int]], None]) -> None:
+        """
+        Call a function whenever the type counts change.
+
+        :param callback: A function taking the set of week numbers whose type counts changed
+        """
+
+        self._observers.append(callback)
+
+    def batch(self) -> 'EventStore':
+        """
+        Get a context manager that collects the type count changes made inside it and notifies the observers once when it exits.
+        Use when adding or removing many events at once (e.g.: `with store.batch(): ...`).
+        """
+
+        return self
+
+    def __enter__(self) -> 'EventStore':
+        self._batch_depth += 1
+        if self._changed_weeks is None:
+            self._changed_weeks = set()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:  # Only notify the observers when the outermost batch ends
+            weeks, self._changed_weeks = self._changed_weeks, None
+            if weeks:
+                self._notify(weeks)
+
+    def _rekey(self, sessions_per_day: int) -> None:
+        """ Recalculate the timeslot keys with a larger number of sessions per day """
+        self.sessions_per_day = sessions_per_day
+        self._keys = [self.event_key(v) for v in self._events]
+
+    def add(self, event) -> int:
+        """
+        Add an event to the store, replacing any existing event on the same timeslot.
+
+        :param event: The event to add
+        :return: The index of the event in timeslot order
+        """
+
+        if event.session >= self.sessions_per_day:  # If the session number does not fit in the current keys, recalculate them
+            self._rekey(event.session + 1)
+
+        existing = self._slots.get((event.week, event.day, event.session))
+        if existing is not None:  # Only one event is stored per timeslot
+            self.remove(existing)
+
+        key = self.event_key(event)
+        idx = bisect.bisect_left(self._keys, key)  # Find the position to insert the event
+        self._keys.insert(idx, key)
+        self._events.insert(idx, event)
+        self._index(event)
+
+        return idx
+
+    def remove(self, event) -> None:
+        """
+        Remove an event from the store.
+
+        :param event: The event to remove
+        """
+
+        idx = self.index(event)
+
+        del self._keys[idx]
+        del self._events[idx]
+        self._unindex(event)
+
+    def retype(self, event) -> None:
+        """
+        Update the type counts after an event’s type has changed.
+
+        :param event: The event that was changed
+        """
+
+        if self.type_key is None:
+            return
+
+        key = (event.week, event.day, event.session)
+        old_type, new_type = self._types[key], self.type_id(self.type_key(event))
+        if old_type != new_type:
+            self._types[key] = new_type
+            with self.batch():  # Notify the observers once for both changes
+                self._count(event.week, old_type, -1)
+                self._count(event.week, new_type, 1)
+
+    def index(self, event) -> int:
+        """
+        Get the index of an event in timeslot order.
+
+        :param event: The event to find
+        """
+
+        idx = bisect.bisect_left(self._keys, self.event_key(event))
+        if idx == len(self._events) or self._events[idx] is not event:
+            raise ValueError(f'Event at {(event.week, event.day, event.session)} is not in the store')
+
+        return idx
+
+    def bisect(self, week: int, day: int, session: int) -> int:
+        """
+        Get the index of the first event at or after a timeslot.
+
+        :param week: The week number of the timeslot
+        :param day: The day number of the timeslot
+        :param session: The session number of the timeslot
+        :return: The index of the first event at or after the timeslot. Equal to the number of events if there are no events at or after the timeslot.
+        """
+
+        return bisect.bisect_left(self._keys, self.key(week, day, min(session, self.sessions_per_day)))
+
+    def iter_from(self, week: int, day: int, session: int) -> Generator[Any, None, None]:
+        """
+        Yield the events at or after a timeslot in timeslot order.
+
+        :param week: The week number of the timeslot
+        :param day: The day number of the timeslot
+        :param session: The session number of the timeslot
+        """
+
+        for idx in range(self.bisect(week, day, session), len(self._events)):
+            yield self._events[idx]
+
+    def get(self, week: int, day: int, session: int) -> Optional[Any]:
+        """
+        Get the event on a timeslot.
+
+        :param week: The week number of the timeslot
+        :param day: The day number of the timeslot
+        :param session: The session number of the timeslot
+        :return: The event on the timeslot, or None if there is no event
+        """
+
+        return self._slots.get((week, day, session))
+
+    def week(self, week: int) -> dict[tuple[int, int], Any]:
+        """
+        Get the events in a week. The returned dictionary should not be modified.
+
+        :param week: The week number
+        :return: A dictionary of the events in the week, keyed by their day and session number
+        """
+
+        return self._weeks.get(week, dict())
+
+    def type_counts(self, week: int) -> list[int]:
+        """
+        Get the number of events of each type in a week. The returned list should not be modified.
+
+        :param week: The week number
+        :return: The row of the count matrix for the week, containing the number of events of each type in the order of `types`
+        """
+
+        counts = self._type_counts.get(week)
+        return [0] * len(self.types) if counts is None else counts
+
+    def __getitem__(self, idx: int) -> Any:
+        """ Get the event at an index in timeslot order """
+        return self._events[idx]
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        """ Yield the events in timeslot order """
+        yield from self._events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+class TimeslotClock:
+    """
+    Notifies subscribers whenever the current timeslot changes.
+
+    Rather than counting elapsed intervals, each tick reads the wall clock and schedules the next tick for the absolute time of the next timeslot change, so errors do not accumulate.
+    Ticks are never more than `max_interval` apart, so the clock re-synchronises shortly after the computer wakes from sleep even if the scheduler was paused while it was suspended.
+    A suspension is detected when the wall clock advances further than the monotonic clock between ticks, or when a tick runs much later than it was scheduled. Subscribers are always notified after a suspension.
+
+    :param after: A function taking a delay in milliseconds and a callback that schedules the callback (e.g.: `tk.Misc.after`)
+    :param after_cancel: A function taking the value returned by `after` that cancels the scheduled callback
+    :param get_timeslot: A function taking a datetime that returns the timeslot at that time. Subscribers are notified when the returned value changes.
+    :param get_next_change: A function taking a datetime that returns the datetime at which the timeslot next changes
+    :param max_interval: The maximum time between ticks in milliseconds
+    :param suspend_threshold: The discrepancy in seconds between the clocks above which the computer is considered to have been suspended
+    """
+
+    def __init__(self, after: Callable[[int, Callable[[], None]], Any], after_cancel: Callable[[Any], None], get_timeslot: Callable[[datetime.datetime], Any], get_next_change: Callable[[datetime.datetime], datetime.datetime], max_interval: int = 60000, suspend_threshold: float = 5.0) -> None:
+        self.after = after
+        self.after_cancel = after_cancel
+        self.get_timeslot = get_timeslot
+        self.get_next_change = get_next_change
+        self.max_interval = max_interval
+        self.suspend_threshold = suspend_threshold
+
+        self.timeslot: Any = None  # The timeslot at the last tick
+        self.suspended = False  # Whether the computer was suspended before the last tick
+        self._subscribers: list[Callable[[Any], None]] = []
+        self._after: Any = None  # The scheduled tick
+        self._last: Optional[tuple[float, float]] = None  # The wall clock and monotonic clock times of the last tick
+        self._deadline: Optional[float] = None  # The wall clock time that the next tick is scheduled for
+
+    def subscribe(self, callback: Callable[[Any], None]) -> None:
+        """
+        Call a function whenever the timeslot changes.
+
+        :param callback: A function taking the new timeslot
+        """
+
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Any], None]) -> None:
+        """
+        Stop calling a function when the timeslot changes.
+
+        :param callback: The function to remove
+        """
+
+        self._subscribers.remove(callback)
+
+    def start(self) -> None:
+        """ Notify the subscribers of the current timeslot and start the clock """
+        self.timeslot = None
+        self.tick()
+
+    def stop(self) -> None:
+        """ Stop the clock """
+
+        if self._after is not None:
+            self.after_cancel(self._after)
+            self._after = None
+
+        self._last = None
+        self._deadline = None
+
+    def resync(self) -> None:
+        """ Check the timeslot immediately, e.g.: after the system clock has been changed """
+
+        if self._after is not None:
+            self.after_cancel(self._after)
+        self.tick()
+
+    def tick(self) -> None:
+        """ Check the current timeslot, notify the subscribers if it changed, and schedule the next tick """
+
+        self._after = None
+        wall, mono = time.time(), time.monotonic()
+
+        ## Check if the computer was suspended since the last tick
+        self.suspended = False
+        if self._last is not None:
+            drift = (wall - self._last[0]) - (mono - self._last[1])  # The monotonic clock does not advance while the computer is suspended on every platform
+            late = wall - self._deadline if self._deadline is not None else 0  # On other platforms, the tick is delayed until the computer wakes
+            self.suspended = drift > self.suspend_threshold or late > self.suspend_threshold
+        self._last = (wall, mono)
+
+        now = datetime.datetime.fromtimestamp(wall)
+
+        ## Notify the subscribers if the timeslot changed
+        timeslot = self.get_timeslot(now)
+        if timeslot != self.timeslot or self.suspended:
+            self.timeslot = timeslot
+            for callback in list(self._subscribers):
+                callback(timeslot)
+
+        ## Schedule the next tick for the next timeslot change. The delay is rounded up so the tick does not run before the change.
+        delay = math.ceil((self.get_next_change(now).timestamp() - wall) * 1000) + 1
+        delay = min(max(delay, 1), self.max_interval)
+
+        self._deadline = wall + delay / 1000
+        self._after = self.after(delay, self.tick)
+
+
+class EventTypeRegistry:
+    """
+    Assigns a small integer id to each event type of a timetable.
+    The colours, icon shape, and icon images of each type are stored in parallel lists indexed by the type id, so looking up the formatting of an event’s type is a single list index.
+
+    The built-in types always have the same ids. Custom types are stored in the timetable JSON file in the format {"name": <name>, "colour": <colour>, "background": <colour>, "icon": <icon shape>}.
+
+    The icon images are created by the UI (see `Window.load_event_type_icons` and `Window.get_event_type_mask`), as they depend on Tkinter. Until then, `icons` and `masks` contain None.
+
+    :param custom_types: The custom event types of the timetable
+    """
+
+    def __init__(self, custom_types: Iterable[dict] = ()) -> None:
+        self.names: list[str] = []  # The name of each type
+        self.colours: list[str] = []  # The colour of each type’s icon
+        self.backgrounds: list[str] = []  # The background colour of each type’s title in the upcoming events list
+        self.shapes: list[str] = []  # The key in `EVENT_TYPE_SHAPES` of each type’s icon
+        self.icons: list[Any] = []  # The icon image of each type
+        self.masks: list[Any] = []  # The inverse 'mask' image of each type’s icon, for masking out the background of the type display in the upcoming events list
+        self._ids: dict[str, int] = dict()  # The id of each type, keyed by its name
+
+        for name, colour, background, shape in BUILTIN_EVENT_TYPES:
+            self.register(name, colour, background, shape)
+        self.builtin_count = len(self.names)
+
+        for data in custom_types:
+            self.register(data['name'], data['colour'], data['background'], data.get('icon', 'Event'))
+
+    def register(self, name: str, colour: str, background: str, icon: str = 'Event') -> int:
+        """
+        Add an event type to the registry. If a type with the same name already exists, its id is returned and the existing type is kept.
+
+        :param name: The name of the type
+        :param colour: The colour of the type’s icon
+        :param background: The background colour of the type’s title in the upcoming events list
+        :param icon: The key in `EVENT_TYPE_SHAPES` of the type’s icon
+        :return: The id of the type
+        """
+
+        if name in self._ids:
+            return self._ids[name]
+
+        if icon not in EVENT_TYPE_SHAPES:  # Fall back to the default icon for unknown shapes
+            icon = 'Event'
+
+        type_id = self._ids[name] = len(self.names)
+        self.names.append(name)
+        self.colours.append(colour)
+        self.backgrounds.append(background)
+        self.shapes.append(icon)
+        self.icons.append(None)
+        self.masks.append(None)
+
+        return type_id
+
+    def id(self, name: str) -> int:
+        """
+        Get the id of an event type. Types that are not registered (e.g.: from a file written by a newer version of the program) are registered with the formatting of the default type.
+
+        :param name: The name of the type
+        """
+
+        type_id = self._ids.get(name)
+        if type_id is None:
+            type_id = self.register(name, self.colours[0], self.backgrounds[0], self.shapes[0])
+        return type_id
+
+    def svg(self, type_id: int, mask: bool = False) -> tuple[bytes, int]:
+        """
+        Get the SVG data for the icon of an event type.
+
+        :param type_id: The id of the type
+        :param mask: Whether to get the data of the mask image rather than the icon
+        :return: The SVG data and the width to scale the image to
+        """
+
+        view_box, path, icon_width, mask_width = EVENT_TYPE_SHAPES[self.shapes[type_id]]
+        fill = '#303841' if mask else self.colours[type_id]
+
+        return f'<svg viewBox="{view_box}" fill="{fill}"><path d="{path}"/></svg>'.encode(), mask_width if mask else icon_width
+
+    def get_data(self) -> list[dict]:
+        """
+        Get the custom event types in the format stored in a timetable JSON file
+        """
+
+        return [dict(name=self.names[n], colour=self.colours[n], background=self.backgrounds[n], icon=self.shapes[n]) for n in range(self.builtin_count, len(self.names))]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class ClassData:
+    """
+    Stores the data of a class that can be mapped to the timeslots of a timetable, as plain Python values.
+    Classes should be created with `TimetableModel.add_class`, which adds them to the timetable’s list of classes.
+
+    :param class_id: A stable identifier for the class that does not change when other classes are added or removed
+    :param idx: The index of the class in the timetable’s list of classes
+    :param name: The name of the class
+    :param room: The name/number of the class’s room
+    :param teacher: The name of the class’s teacher
+    """
+
+    __slots__ = ('id', 'idx', 'name', 'room', 'teacher')
+
+    def __init__(self, class_id: int, idx: int, name: str, room: str, teacher: str) -> None:
+        self.id = class_id
+        self.idx = idx  # Updated when a class before it is removed
+        self.name = name
+        self.room = room
+        self.teacher = teacher
+
+    def __iter__(self) -> Generator[str, None, None]:
+        """ Yield the name, room, and teacher of the class """
+        yield self.name
+        yield self.room
+        yield self.teacher
+
+
+class TimetableModel:
+    """
+    Stores the data of a timetable as plain Python values, so that timetables can be loaded, queried, edited, and saved without a display.
+    The UI displays a model and keeps any Tkinter state (e.g.: string variables and widgets) in its own objects (see `TimeTable`).
+
+    Rows of the table are referred to by their 'timeslot' index, which includes the breaks between sessions, or by their 'session' index, which does not.
+    Classes are mapped to sessions, and events are stored by session.
+
+    :param classes: The names of each class in the timetable
+    :param teachers: The corresponding teacher name for each class in the timetable
+    :param rooms: The corresponding room name for each class in the timetable
+    :param class_mapping: The index of the class mapped to each session on each weekday
+    :param event_data: The data of each event in the timetable
+    :param day_start_time: The time at which the first timeslot of the day starts, in the format 'HH:MM'
+    :param sessions: The name, type (is not a break), and end time of each timeslot in the timetable
+    :param start_date: The timestamp of the start of the first week of the term
+    :param num_weeks: The number of weeks in the term
+    :param event_types: The custom event types of the timetable (see `EventTypeRegistry`)
+    :param event_factory: Creates an event object from the data of an event. Leave blank to store the events as `EventData` objects.
+    """
+
+    def __init__(self, classes: list[str], teachers: list[str], rooms: list[str], class_mapping: list[list[Optional[int]]], event_data: Iterable[dict], day_start_time: str, sessions: list[tuple[str, bool, str]], start_date: int, num_weeks: int = DEFAULT_NUM_WEEKS, event_types: Optional[list[dict]] = None, event_factory: Callable[..., EventData] = EventData) -> None:
+        self.start_timestamp = start_date
+        self.num_weeks = num_weeks
+        self.event_factory = event_factory
+
+        ## Sessions
+        self.day_start_time = day_start_time
+        self.sessions: list[tuple[str, bool]] = []  # The name and type (is not a break) of each timeslot
+        self.sessiontimes: list[list[int]] = []  # The hour and minute of each 'period change', starting with the day start time
+        self.session_bounds: list[int] = []  # The minute of the day of each 'period change', used to look up the session at a time
+        self.session_break_idxs: list[list[int]] = [[], []]  # The timeslot index of each break between sessions, and the index of the session before each break
+        self.set_sessions(day_start_time, sessions)
+
+        ## Events
+        self.event_types = EventTypeRegistry(event_types or ())  # Assign an id to the built-in and custom event types
+        self.events = EventStore((self.create_event(**v) for v in event_data), len(self.sessions), type_key=attrgetter('type_id'), types=range(len(self.event_types)))  # Index the events by their timeslot and count their types
+
+        ## Classes
+        self.classes: list[ClassData] = []
+        self.class_ids = itertools.count()  # Generates the identifier for each new class
+        for name, room, teacher in zip(classes, rooms, teachers):
+            self.add_class(name, room, teacher)
+
+        self.mapping: list[list[Optional[ClassData]]] = [[None if idx is None else self.classes[idx] for idx in day] for day in class_mapping]  # The class mapped to each session on each weekday
+
+    @classmethod
+    def from_data(cls, data: dict, event_factory: Callable[..., EventData] = EventData) -> 'TimetableModel':
+        """
+        Create a model from timetable data.
+
+        :param data: The timetable data, with the same keys as a timetable JSON file
+        :param event_factory: Creates an event object from the data of an event
+        """
+
+        return cls(*timetable_args(data), event_factory=event_factory)
+
+    @classmethod
+    def from_file(cls, path: str, encoding: str = 'utf-8', recover: bool = False, event_factory: Callable[..., EventData] = EventData) -> 'TimetableModel':
+        """
+        Read a timetable JSON file.
+        Errors are raised rather than reported to the user (e.g.: `json.decoder.JSONDecodeError` if the file has invalid JSON syntax, or `KeyError` if it is missing a key field).
+
+        :param path: The path of the timetable file
+        :param encoding: The encoding of the timetable file
+        :param recover: Whether to include the unsaved changes stored in the journal and autosave files of the timetable, if there are any
+        :param event_factory: Creates an event object from the data of an event
+        """
+
+        if recover and has_recovery_data(path):
+            return cls.from_data(recover_timetable(path, encoding), event_factory)
+
+        with open(path, encoding=encoding) as file:
+            return cls.from_data(json.load(file), event_factory)
+
+    ## ------------------------------------------ Sessions -------------------------------------------
+
+    def set_sessions(self, day_start_time: str, sessions: list[tuple[str, bool, str]]) -> None:
+        """
+        Set the timeslots of the timetable.
+
+        :param day_start_time: The time at which the first timeslot of the day starts, in the format 'HH:MM'
+        :param sessions: The name, type (is not a break), and end time of each timeslot. The end time is in the format 'HH:MM', or '-1' for the end of the day.
+        """
+
+        self.day_start_time = day_start_time
+        self.sessions, self.sessiontimes = self.get_sessiontimes(day_start_time, sessions)
+        self.session_bounds = self.get_session_bounds(self.sessiontimes)
+
+        ## Find the breaks between sessions
+        self.session_break_idxs = [[], []]
+        for n, (name, is_normal) in enumerate(self.sessions):
+            if not is_normal:
+                self.session_break_idxs[0].append(n)  # Add the timeslot index of the break
+                self.session_break_idxs[1].append(n - len(self.session_break_idxs[0]))  # Add the index of the session before the break
+
+    @staticmethod
+    def get_sessiontimes(day_start_time: str, data: list[tuple[str, bool, str]]) -> tuple[list[tuple[str, bool]], list[list[int]]]:
+        """
+        Get the time of each 'period change' and the name and type of each timeslot.
+
+        :param day_start_time: The time at which the first timeslot of the day starts, in the format 'HH:MM'
+        :param data: The name, type, and end time of each timeslot
+        :return: A list containing the name and type of each timeslot, and a list containing the hour and minute of each 'period change', starting with the day start time. Timeslots that last until the end of the day end at [-1, -1].
+        """
+
+        session_times = [list(map(int, day_start_time.split(':')))]
+        for name, is_normal, time_str in data:
+            session_times.append([-1, -1] if time_str == '-1' else list(map(int, time_str.split(':'))))
+
+        return [(name, is_normal) for name, is_normal, time_str in data], session_times
+
+    @staticmethod
+    def get_session_bounds(sessiontimes: list[list[int]]) -> list[int]:
+        """
+        Convert the 'period change' times to minutes since the start of the day, so the session at a time can be found with a binary search.
+
+        :param sessiontimes: The hour and minute of each 'period change', starting with the day start time (see `get_sessiontimes`)
+        :return: The minute of the day of each 'period change'. Sessions that last until the end of the day end at minute 1440.
+        """
+
+        return [1440 if hour == -1 else 60 * hour + minute for hour, minute in sessiontimes]
+
+    def get_session(self, now: datetime.datetime) -> Optional[int]:
+        """
+        Get the index of the timeslot at the input time.
+
+        :param now: The time to check
+        :return: The index of the timeslot at the input time, or None if the time is before the start or after the end of the day
+        """
+
+        idx = bisect.bisect_right(self.session_bounds, 60 * now.hour + now.minute) - 1  # Find the last 'period change' at or before the input time
+        if 0 <= idx < len(self.sessions):
+            return idx
+        return None
+
+    def get_timeslot(self, now: datetime.datetime) -> int:
+        """
+        Get the timeslot index at the input time.
+
+        :param now: The time to check
+        :return: The index of the timeslot at the input time, or the number of timeslots if the time is outside the timetable
+        """
+
+        session = self.get_session(now)
+        return len(self.sessions) if session is None else session
+
+    def get_next_session_change(self, now: datetime.datetime) -> int:
+        """
+        Get the time of the next 'period change' after the input time.
+
+        :param now: The time to check
+        :return: The minute of the day of the next 'period change', or 1440 (midnight) if there are no more changes on the day
+        """
+
+        idx = bisect.bisect_right(self.session_bounds, 60 * now.hour + now.minute)
+        return self.session_bounds[idx] if idx < len(self.session_bounds) else 1440
+
+    def get_session_index(self, timeslot: int) -> Optional[int]:
+        """
+        Get the session index corresponding to a timeslot index.
+
+        :param timeslot: The timeslot index
+        :return: The session index, or None if the timeslot is a break or is not displayed in the table
+        """
+
+        if timeslot == len(self.sessions) or timeslot in self.session_break_idxs[0]:
+            return None
+        return timeslot - bisect.bisect_left(self.session_break_idxs[0], timeslot)  # Subtract the number of breaks before the timeslot
+
+    def get_timeslot_index(self, session: int) -> int:
+        """
+        Get the timeslot index corresponding to a session index.
+
+        :param session: The session index
+        """
+
+        return session + bisect.bisect_left(self.session_break_idxs[1], session)  # Add the number of breaks before the session
+
+    ## ------------------------------------------ Week Math ------------------------------------------
+
+    def get_week(self, now: float) -> int:
+        """
+        Get the week number at a timestamp.
+
+        :param now: The timestamp
+        :return: The number of weeks since the start of the term
+        """
+
+        return int((now - self.start_timestamp) // (86400 * 7))
+
+    def get_start_time(self, week: int, day: int, session: int) -> datetime.datetime:
+        """
+        Get the time at which a session starts.
+
+        :param week: The week number of the session
+        :param day: The day number of the session (Monday = 0, Sunday = 6)
+        :param session: The session index
+        """
+
+        hour, minute = self.sessiontimes[self.get_timeslot_index(session)]
+        return datetime.datetime.fromtimestamp(self.start_timestamp + 604800 * week + 86400 * day + 3600 * hour + 60 * minute)
+
+    ## ------------------------------------------- Events --------------------------------------------
+
+    def create_event(self, week: int, day: int, session: int, text: str = '', tags: Optional[list] = None, etype: str = 'Event', title: str = 'Untitled Event') -> EventData:
+        """
+        Create an event and assign the id of its type. The event is not added to the timetable’s events.
+
+        :param week: The week number of the event
+        :param day: The day number of the event (Monday = 0, Sunday = 6)
+        :param session: The session index of the event
+        :param text: The event text
+        :param tags: The tags of the event
+        :param etype: The type of the event
+        :param title: The title of the event
+        """
+
+        event = self.event_factory(week, day, session, text, tags, etype, title)
+        event.type_id = self.event_types.id(etype)
+        return event
+
+    ## ------------------------------------------- Classes -------------------------------------------
+
+    def add_class(self, name: str, room: str, teacher: str) -> ClassData:
+        """
+        Create a new class and add it to the list of classes
+
+        :param name: The name of the class
+        :param room: The name/number of the class’s room
+        :param teacher: The name of the class’s teacher
+        :return: The new class
+        """
+
+        tt_class = ClassData(next(self.class_ids), len(self.classes), name, room, teacher)
+        self.classes.append(tt_class)
+        return tt_class
+
+    def remove_class(self, tt_class: ClassData) -> None:
+        """
+        Remove a class from the list of classes and from every session it is mapped to
+
+        :param tt_class: The class to remove
+        """
+
+        for day in self.mapping:
+            for session, value in enumerate(day):
+                if value is tt_class:
+                    day[session] = None
+
+        ## Remove the class and update the indexes of the classes after it
+        del self.classes[tt_class.idx]
+        for other in self.classes[tt_class.idx:]:
+            other.idx -= 1
+
+    def map_class(self, day: int, session: int, tt_class: Optional[ClassData]) -> None:
+        """
+        Map a class to a session.
+
+        :param day: The day number of the session
+        :param session: The session index
+        :param tt_class: The class to map, or None to leave the session empty
+        """
+
+        self.mapping[day][session] = tt_class
+
+    ## ---------------------------------------- Serialisation ----------------------------------------
+
+    def get_session_data(self) -> list[list[str | bool]]:
+        """
+        Get the name, type, and end time of each session in the format stored in a timetable JSON file
+        """
+
+        return [[name, is_normal, '-1' if hour == -1 else f'{hour:02d}:{minute:02d}'] for (name, is_normal), (hour, minute) in zip(self.sessions, self.sessiontimes[1:])]
+
+    def get_class_mapping(self) -> list[list[Optional[int]]]:
+        """
+        Get the index of the class mapped to each session on each weekday in the format stored in a timetable JSON file
+        """
+
+        return [[None if tt_class is None else tt_class.idx for tt_class in day] for day in self.mapping]
+
+    def get_class_data(self) -> dict:
+        """
+        Get the name, room, and teacher of each class and the class mapping in the format stored in a timetable JSON file
+        """
+
+        return {
+            'classes': [v.name for v in self.classes],
+            'teachers': [v.teacher for v in self.classes],
+            'rooms': [v.room for v in self.classes],
+            'timetable': self.get_class_mapping()
+        }
+
+    def get_data(self) -> dict:
+        """
+        Get a snapshot of the timetable data with the same keys as a timetable JSON file
+        """
+
+        return {
+            **self.get_class_data(),
+            'events': [event.get_data() for event in self.events],
+            'sessions': self.get_session_data(),
+            'day_start': self.day_start_time,
+            'start_date_timestamp': self.start_timestamp,
+            'num_weeks': self.num_weeks,
+            'event_types': self.event_types.get_data()
+        }
+
+    def iter_json(self) -> Generator[str, None, None]:
+        """
+        Yield the JSON formatted text representing the timetable data as a series of chunks
+        """
+
+        yield from iter_timetable_json(self.get_data())
+
+    def get_json(self) -> str:
+        """
+        Get the JSON formatted text representing the timetable data
+        """
+
+        return ''.join(self.iter_json())
@@ -0,0 +1,562 @@
+from typing import TYPE_CHECKING, Literal, Optional
+from tkinter import messagebox as mb
+from tkinter import filedialog as fd
+from tkinter import ttk
+import tkinter as tk
+import webbrowser
+import copy
+import json
+import os
+from toolsV1 import file_exists
+from CustomWidgets import CustomComboBox, Entry, ScrollableFrame, MouseoverButton
+
+from reportlab.lib.colors import HexColor, Color  # noqa (Used by the custom style values, which are evaluated as python code)
+from timetable_export import DEFAULT_FORMATTING, DEFAULT_TABLESTYLE, PAGE_PRESETS, export_pdf
+
+if TYPE_CHECKING:
+    from TimetableV2_21 import Window
+
+
+class FormattingOption(tk.Frame):
+    """
+    A widget containing and displaying a line of formatting information for a reportlab Table style config
+
+    :param root: (ExportAsPDFMenu) The export as pdf toplevel widget
+    """
+
+    def __init__(self, root, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.root: ExportAsPDFMenu = root
+        self.style_option = tk.StringVar(self)  # Define a stringvar for the selected style option
+
+        ## Create a dropdown to select the style option
+        class_dropdown = CustomComboBox(self, style='TCombobox', textvariable=self.style_option, values=['GRID', 'ALIGN', 'VALIGN', 'FONT', 'TOPPADDING', 'FONTSIZE', 'TEXTCOLOR', 'BACKGROUND', 'SPAN', 'BOTTOMPADDING'])
+        class_dropdown.pack(side='left', fill='y', padx=1, pady=1)
+
+        tk.Frame(self, background='#000', width=12).pack(side='left', fill='y')  # Spacer
+
+        ## Top Left Corner
+        tk.Label(self, background='#303841', foreground='#D8DEE9', text='X₁', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
+
+        self.x1_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
+        self.x1_entry.configure(invalidcommand=lambda: self.invalid_input(self.x1_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.x1_entry, 'x'))
+        self.x1_entry.pack(side='left', fill='y', padx=(1, 0), pady=1)
+
+        tk.Label(self, background='#303841', foreground='#D8DEE9', text='Y₁', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
+
+        self.y1_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
+        self.y1_entry.configure(invalidcommand=lambda: self.invalid_input(self.y1_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.y1_entry, 'y'))
+        self.y1_entry.pack(side='left', fill='y', padx=(1, 1), pady=1)
+
+        tk.Frame(self, background='#000', width=12).pack(side='left', fill='y')  # Spacer
+
+        ## Bottom Right Corner
+        tk.Label(self, background='#303841', foreground='#D8DEE9', text='X₂', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
+
+        self.x2_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
+        self.x2_entry.configure(invalidcommand=lambda: self.invalid_input(self.x2_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.x2_entry, 'x'))
+        self.x2_entry.pack(side='left', fill='y', padx=(1, 0), pady=1)
+
+        tk.Label(self, background='#303841', foreground='#D8DEE9', text='Y₂', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
+
+        self.y2_entry = ttk.Entry(self, style='stipple.TEntry', width=2, validate='focusout')
+        self.y2_entry.configure(invalidcommand=lambda: self.invalid_input(self.y2_entry, 'Must be an integer within the bounds of the table.'), validatecommand=lambda v: self.validate_pos(self.y2_entry, 'y'))
+        self.y2_entry.pack(side='left', fill='y', padx=(1, 1), pady=1)
+
+        tk.Frame(self, background='#000', width=12).pack(side='left', fill='y')  # Spacer
+
+        ## Value entry
+        tk.Label(self, background='#303841', foreground='#D8DEE9', text='Value ', font=('Calibri', 12)).pack(side='left', fill='y', padx=(1, 0), pady=1)
+
+        self.value_entry = ttk.Entry(self, style='stipple.TEntry', validate='focusout')
+        self.value_entry.configure(invalidcommand=lambda: self.invalid_input(self.value_entry, 'Invalid Value'), validatecommand=lambda: self.validate_value())
+        self.value_entry.pack(side='left', expand=True, fill='both', padx=(1, 1), pady=1)
+
+        ## Bind the widget’s children to select the widget when clicked
+        self.bind_class(f'click:{id(self)}', '<Button-1>', lambda v: self.clicked())
+        self.bindtags((f'click:{id(self)}', *self.bindtags()))
+        for i in self.winfo_children():
+            i.bindtags((f'click:{id(self)}', *i.bindtags()))
+
+    def clicked(self) -> None:
+        """
+        Selects / deselects the formatting option
+        """
+
+        if self.root.selected_format_option == self:
+            self.deselect()
+            self.root.selected_format_option = None
+        else:
+            if self.root.selected_format_option is not None:
+                self.root.selected_format_option.deselect()
+            self.root.selected_format_option = self
+            self.select()
+
+    def select(self) -> None:
+        """ Changes the background colour to a selected colour """
+        self.configure(background='#F9AE58')
+
+    def deselect(self) -> None:
+        """ Changes the background colour to the normal colour """
+        self.configure(background='#3B434C')
+
+    def select_style_class(self) -> None:
+        """ Adds template text to the value entry when the user selects the style option to edit """
+        ## Todo: This should add a formatting template to the value entry when a new style option is selected
+        pass
+
+    def validate_pos(self, elem: ttk.Entry, mode: Literal['x', 'y']) -> bool:
+        """
+        Validates that the X or Y position in the input entry are within the bounds of the table.
+
+        :param elem: The entry whose value to check
+        :param mode: Whether to treat the value as an X coordinate or Y coordinate
+
+        :return: Whether or not the input value is an integer within the bounds of the table
+        """
+
+        val = elem.get()  # Get the contents of the entry
+        if not val.removeprefix('-').isnumeric():  # Check if the value is an integer
+            return False
+
+        ## Validate the coordinate is within the bounds of the table
+        if mode == 'x':
+            return -7 <= int(val) <= 6
+        else:
+            return -(len(self.root.timetable_data['sessions'])) <= int(val) <= (len(self.root.timetable_data['sessions']) - 1)
+
+    @staticmethod
+    def invalid_input(elem: tk.Entry, text: str) -> None:
+        """
+        This function is called when an input into an entry does not pass validation.
+        It sets the cursor back into the entry and displays a message to the user.
+
+        :param elem: The entry to set the cursor into
+        :param text: The message to display to the user
+        """
+
+        cursor_pos = elem.index(tk.INSERT)
+        mb.showinfo('Invalid Input', text)
+        elem.focus()
+        elem.icursor(cursor_pos)
+
+    def validate_value(self) -> bool:
+        """
+        Evaluate the contents of the value entry as python code and validate the result.
+        """
+
+        val = self.value_entry.get()  # Get the contents of the value entry
+
+        try:  # Attempt to evaluate the value
+            eval(f'[{val}]')
+            return True
+        except Exception:
+            return False
+
+
+## todo: add font, colours, margin, to export PDF
+
+class ExportAsPDFMenu(tk.Toplevel):
+    """
+    A window that allows converting a timetable file to PDF and configuring the formatting of the resulting PDF.
+
+    :param root: (Window) The root window widget
+    """
+
+    def __init__(self, root, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.root: Window = root
+
+        self.attributes('-topmost', True)  # Set the window to the topmost window
+        self.grab_set()  # Disable interaction with the main window until this window is closed
+        self.title('Convert to PDF')  # Set the title of the window
+        self.geometry(f'+{self.root.winfo_x() + int(self.root.winfo_width() // 3)}+{self.root.winfo_y() + int(self.root.winfo_height() // 3)}')  # Set the position of the window to roughly the centre of the main window
+        self.root.call('wm', 'iconphoto', str(self), self.root.icons['window_icon2'])  # Set the icon of the window
+
+        self.configure(background='#222', padx=1, pady=1)  # Set the background colour and internal padding of the window
+        self.columnconfigure(2, weight=1)
+        self.rowconfigure(10, weight=1)
+
+        self.selected_format_option: Optional[FormattingOption] = None
+        self.formatting_elems: list[FormattingOption] = []
+
+        ## Load the current timetable
+        self.timetable_data: Optional[dict] = None
+
+        with open(self.root.filename, encoding='utf-8') as input_file:
+            timetable = json.load(input_file)
+            self.timetable_data = timetable
+
+        self.tablestyle = list(DEFAULT_TABLESTYLE)  # Define basic style elements
+        self.preset_options = PAGE_PRESETS  # Layout formatting presets for the output PDF
+        self.formatting = copy.deepcopy(DEFAULT_FORMATTING)  # Define default formatting for each part of the output timetable
+
+        ## Define default formatting for UI elements
+        labelconfig = dict(background='#303841', foreground='#D8DEE9', image=self.root.pixel, font=('Calibri', 11), compound='center', height=14)
+        buttonconfig = dict(background='#303841', foreground='#D8DEE9', activebackground='#2E3238', mouseoverbackground='#3B434C', font=('Calibri', 11), compound='center', highlightbackground='#4F565E')
+
+        ## ======================================== User Interface ========================================
+
+        ## ---------------------------------------- Filename input ----------------------------------------
+        outfile_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
+        outfile_frame.grid(row=0, column=0, columns=3, sticky='NSWE', padx=0, pady=(0, 0))
+        outfile_frame.columnconfigure(1, weight=1)
+
+        tk.Label(outfile_frame, text='Output File', width=60, **labelconfig).grid(row=0, column=0, sticky='NSWE', padx=(0, 1), pady=0)
+
+        self.outfile_entry = Entry(outfile_frame, text=self.root.filename.removesuffix('.json').removesuffix('.txt') + '.pdf', style='stipple.TEntry')
+        self.outfile_entry.grid(row=0, column=1, sticky='NSWE', padx=(0, 1), pady=0)
+
+        MouseoverButton(outfile_frame, command=lambda: self.browse_filename(), image=self.root.icons['load'], width=25, height=20, **buttonconfig).grid(row=0, column=2, sticky='nswe', padx=(0, 0), pady=0)
+
+        ## ----------------------------------------- Page Options -----------------------------------------
+        page_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
+        page_options_frame.grid(row=1, column=0, sticky='nswe', padx=0, pady=(7, 0))
+
+        tk.Label(page_options_frame, text='Page Size', **labelconfig).pack(side='top', padx=(0, 0), pady=(0, 1), fill='x')
+        tk.Frame(page_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
+
+        self.presets_selector = CustomComboBox(page_options_frame, state='readonly', style='TCombobox', values=list(self.preset_options.keys()), width=5)
+        self.presets_selector.pack(side='top', padx=(0, 0), pady=(0, 1), fill='x')
+        self.presets_selector.bind('<<ComboboxSelected>>', lambda v: self.select_preset())
+        self.presets_selector.set('A4 (Portrait)')
+
+        self.width_entry = Entry(page_options_frame, text='29.7', style='stipple.TEntry', width=5)
+        self.width_entry.configure(validatecommand=lambda: self.validate_num(self.width_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.width_entry, 'TODO'))
+        self.width_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        tk.Label(page_options_frame, text='x', width=10, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.height_entry = Entry(page_options_frame, text='40', style='stipple.TEntry', width=5)
+        self.height_entry.configure(validatecommand=lambda: self.validate_num(self.height_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.height_entry, 'TODO'))
+        self.height_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        self.page_units = CustomComboBox(page_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in'], width=3)
+        self.page_units.pack(side='left', padx=0, pady=0, fill='both')
+        self.page_units.set('cm')
+
+        ## ----------------------------------------- Table Options ----------------------------------------
+        table_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
+        table_options_frame.grid(row=2, column=0, sticky='nswe', padx=0, pady=(7, 0))
+
+        tk.Label(table_options_frame, text='Table Size', **labelconfig).pack(side='top', anchor='w', padx=0, pady=0, fill='x')
+        tk.Frame(table_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
+
+        self.table_width_entry = Entry(table_options_frame, text='Auto', style='stipple.TEntry', width=5)
+        self.table_width_entry.configure(validatecommand=lambda: self.validate_num(self.table_width_entry, special_vals=['Auto']), validate='focusout', invalidcommand=lambda: self.invalid_input(self.table_width_entry, 'TODO'))
+        self.table_width_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        tk.Label(table_options_frame, text='x', width=10, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.table_height_entry = Entry(table_options_frame, text='Auto', style='stipple.TEntry', width=5)
+        self.table_height_entry.configure(validatecommand=lambda: self.validate_num(self.table_height_entry, special_vals=['Auto']), validate='focusout', invalidcommand=lambda: self.invalid_input(self.table_height_entry, 'TODO'))
+        self.table_height_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        self.table_units = CustomComboBox(table_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in', '%'], width=3)
+        self.table_units.pack(side='left', padx=0, pady=0, fill='both')
+        self.table_units.set('cm')
+
+        ## ---------------------------------------- Margin Options ----------------------------------------
+        margin_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
+        margin_options_frame.grid(row=3, column=0, sticky='nswe', padx=0, pady=(7, 0))
+
+        tk.Label(margin_options_frame, text='Margins', **labelconfig).pack(side='top', padx=0, pady=(0, 0), fill='x')
+        tk.Frame(margin_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
+
+        tk.Label(margin_options_frame, text='↔', width=15, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.h_margin_entry = Entry(margin_options_frame, text='1.5', style='stipple.TEntry', width=5)
+        self.h_margin_entry.configure(validatecommand=lambda: self.validate_num(self.h_margin_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.h_margin_entry, 'TODO'))
+        self.h_margin_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        tk.Label(margin_options_frame, text='↕', width=15, **labelconfig).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.v_margin_entry = Entry(margin_options_frame, text='1.5', style='stipple.TEntry', width=5)
+        self.v_margin_entry.configure(validatecommand=lambda: self.validate_num(self.v_margin_entry), validate='focusout', invalidcommand=lambda: self.invalid_input(self.v_margin_entry, 'TODO'))
+        self.v_margin_entry.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        self.margin_units = CustomComboBox(margin_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in', '%'], width=3)
+        self.margin_units.pack(side='left', padx=0, pady=0, fill='both')
+        self.margin_units.set('cm')
+
+        ## ------------------------------------ Bottom Padding Options ------------------------------------
+        ## Note: Changing the font size of the text causes """unique""" behaviour with vertical alignment, so this option exists to adjust it.
+        bottompad_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
+        bottompad_options_frame.grid(row=4, column=0, sticky='nswe', padx=0, pady=(7, 0))
+
+        tk.Label(bottompad_options_frame, text='Bottom Padding', **labelconfig).pack(side='top', padx=0, pady=(0, 0), fill='x')
+        tk.Frame(bottompad_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
+
+        self.bottom_padding_0 = Entry(bottompad_options_frame, text='5', style='stipple.TEntry', width=5)
+        self.bottom_padding_0.configure(validatecommand=lambda: self.validate_num(self.bottom_padding_0), validate='focusout', invalidcommand=lambda: self.invalid_input(self.bottom_padding_0, 'TODO'))
+        self.bottom_padding_0.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        self.bottom_padding_1 = Entry(bottompad_options_frame, text='15', style='stipple.TEntry', width=5)
+        self.bottom_padding_1.configure(validatecommand=lambda: self.validate_num(self.bottom_padding_1), validate='focusout', invalidcommand=lambda: self.invalid_input(self.bottom_padding_1, 'TODO'))
+        self.bottom_padding_1.pack(side='left', padx=(0, 1), pady=0, expand=True, fill='both')
+
+        self.bottom_padding_2 = Entry(bottompad_options_frame, text='25', style='stipple.TEntry', width=5)
+        self.bottom_padding_2.configure(validatecommand=lambda: self.validate_num(self.bottom_padding_2), validate='focusout', invalidcommand=lambda: self.invalid_input(self.bottom_padding_2, 'TODO'))
+        self.bottom_padding_2.pack(side='left', padx=(0, 0), pady=0, expand=True, fill='both')
+
+        ## ------------------------------------ Corner Rounding Options -----------------------------------
+        round_corner_options_frame = tk.Frame(self, background='#3B434C', highlightthickness=1, highlightbackground='#3B434C')
+        round_corner_options_frame.grid(row=5, column=0, sticky='nswe', padx=0, pady=(7, 0))
+
+        tk.Label(round_corner_options_frame, text='Round Corners', **labelconfig).pack(side='top', padx=0, pady=(0, 0), fill='x')
+        tk.Frame(round_corner_options_frame, background='#222', height=1).pack(side='top', fill='both', pady=(0, 1))
+
+        self.corner_units = CustomComboBox(round_corner_options_frame, state='readonly', style='TCombobox', values=['px', 'pt', 'cm', 'mm', 'in', '%'], width=3)
+        self.corner_units.pack(side='top', padx=0, pady=(0, 1), fill='both')
+        self.corner_units.set('cm')
+
+        corner_radius_entry_frame = tk.Frame(round_corner_options_frame, background='#3B434C')
+        corner_radius_entry_frame.pack(side='top', expand=True, fill='both')
+
+        tk.Label(corner_radius_entry_frame, text='◴', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.nw_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
+        self.nw_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.nw_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.nw_corner_radius, 'TODO'))
+        self.nw_corner_radius.pack(side='left', padx=(0, 1), expand=True, fill='both')
+
+        tk.Label(corner_radius_entry_frame, text='◷', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.ne_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
+        self.ne_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.ne_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.ne_corner_radius, 'TODO'))
+        self.ne_corner_radius.pack(side='left', padx=(0, 0), expand=True, fill='both')
+
+        corner_radius_entry_frame = tk.Frame(round_corner_options_frame, background='#3B434C')
+        corner_radius_entry_frame.pack(side='top', expand=True, fill='both')
+
+        tk.Label(corner_radius_entry_frame, text='◵', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.sw_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
+        self.sw_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.sw_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.sw_corner_radius, 'TODO'))
+        self.sw_corner_radius.pack(side='left', padx=(0, 1), expand=True, fill='both')
+
+        tk.Label(corner_radius_entry_frame, text='◶', **labelconfig, width=10).pack(side='left', padx=(0, 1), pady=0, fill='y')
+
+        self.se_corner_radius = Entry(corner_radius_entry_frame, text='2.5', style='stipple.TEntry', width=5)
+        self.se_corner_radius.configure(validatecommand=lambda: self.validate_corner(self.se_corner_radius), validate='focusout', invalidcommand=lambda: self.invalid_input(self.se_corner_radius, 'TODO'))
+        self.se_corner_radius.pack(side='left', padx=(0, 0), expand=True, fill='both')
+
+        self.match_corner_radius = tk.BooleanVar(self, True)
+        ttk.Checkbutton(round_corner_options_frame, style='Custom.TCheckbutton', text='Match Radius', variable=self.match_corner_radius).pack(side='top', fill='both', pady=(0, 1))
+
+        ## -------------------------------- Advanced Formatting Input Frame -------------------------------
+        ## A frame that allows direct editing of the table style options.
+        frame = tk.Frame(self, background='#222')
+        frame.grid(row=1, column=1, columns=1, rows=5, sticky='NSWE', padx=(10, 0), pady=(7, 0))
+        frame.rowconfigure(1, weight=1)
+        frame.columnconfigure(1, weight=1, minsize=500)
+
+        tk.Label(frame, text='Advanced Formatting', **labelconfig, highlightthickness=1, highlightbackground='#3B434C').grid(row=0, column=0, columns=3, sticky='NSWE', pady=(0, 1))
+
+        self.vscrollbar = ttk.Scrollbar(frame, orient='vertical', style='Custom.Vertical.TScrollbar')
+        self.vscrollbar.grid(row=1, column=2, sticky='ns', padx=(0, 0), pady=0)
+
+        self.scrollable_frame = ScrollableFrame(frame, vscrollbar=self.vscrollbar, c_highlightthickness=1, c_background='#000', c_highlightbackground='#3B434C', f_background='#000')
+        self.scrollable_frame.grid(row=1, column=0, columns=2, sticky='NSWE', padx=(0, 1), pady=0)
+
+        MouseoverButton(frame, text='+', command=lambda: self.add_formatting(), image=self.root.pixel, width=18, height=18, highlightthickness=1, **buttonconfig).grid(row=2, column=0, sticky='nw', padx=(0, 1), pady=(1, 0))
+        MouseoverButton(frame, text='-', command=lambda: self.remove_formatting(), image=self.root.pixel, width=18, height=18, highlightthickness=1, **buttonconfig).grid(row=2, column=1, sticky='nw', padx=(0, 0), pady=(1, 0))
+
+        ## Add existing formatting options to the formatting options frame
+        for i in self.tablestyle:
+            elem = FormattingOption(self, self.scrollable_frame.frame, background='#3B434C')
+            elem.pack(side='top', fill='x', padx=1, pady=(1, 0))
+            elem.style_option.set(i[0])
+            elem.x1_entry.insert(0, str(i[1][0]))
+            elem.x2_entry.insert(0, str(i[2][0]))
+            elem.y1_entry.insert(0, str(i[1][1]))
+            elem.y2_entry.insert(0, str(i[2][1]))
+            elem.value_entry.insert(0, str(list(i[3:]))[1:-1])
+
+            self.formatting_elems.append(elem)
+
+        ## ------------------------------------ Cancel and Export Buttons ---------------------------------
+
+        frame = tk.Frame(self, background='#222')
+        frame.grid(row=6, column=1, sticky='NSE', pady=(0, 0))
+
+        MouseoverButton(frame, text='Cancel', command=lambda: self.destroy(), image=self.root.pixel, width=50, height=18, highlightthickness=1, **buttonconfig).pack(side='left', padx=0, fill='y')  # .grid(row=1, column=1, sticky='nswe', padx=(0, 1), pady=(0, 0))
+        MouseoverButton(frame, text='Export', command=lambda: self.convert(), image=self.root.pixel, width=50, height=18, highlightthickness=1, **buttonconfig).pack(side='left', padx=(1, 0), fill='y')  # .grid(row=1, column=0, sticky='nswe', padx=(0, 1), pady=(0, 0))
+
+    def select_preset(self) -> None:
+        """
+        Sets the values of all page formatting entries when a preset is selected from the dropdown
+        """
+
+        ## Get the preset name and data
+        preset_name = self.presets_selector.get()
+        preset_data = self.preset_options[preset_name]
+
+        ## Get the widgets to update (in order)
+        elems = [
+            self.width_entry,
+            self.height_entry,
+            self.table_width_entry,
+            self.table_height_entry,
+            self.h_margin_entry,
+            self.v_margin_entry,
+            self.page_units,
+            self.table_units,
+            self.margin_units
+        ]
+
+        ## Update each widget
+        for elem, i in zip(elems, preset_data):
+            elem.set(i)
+
+    def browse_filename(self) -> None:
+        """ Open an 'open file' dialogue and set the outfile entry to the chosen file """
+
+        filename = fd.askopenfilename(defaultextension='.json', filetypes=(('JSON', '.json'), ('Plain Text', '.txt'), ('All', '*')), initialdir=os.path.dirname(self.root.filename), initialfile=self.root.filename, parent=self)
+        if filename:  # If a file was chosen, update the outfile entry.
+            self.outfile_entry.set(filename)
+
+    @staticmethod
+    def invalid_input(element: Entry, text: str) -> None:
+        """
+        This function is called when an input into an entry does not pass validation.
+        It sets the cursor back into the entry and displays a message to the user.
+
+        :param element: The entry to set the cursor into
+        :param text: The message to display to the user
+        """
+
+        cursor_pos = element.index(tk.INSERT)
+        mb.showinfo('Invalid Input', text)
+        element.focus()
+        element.icursor(cursor_pos)
+
+    @staticmethod
+    def validate_num(elem: Entry, dtype=float, allow_negative: bool = False, special_vals: Optional[list[str]] = None) -> bool:
+        """
+        Evaluates a number or simple equation in an entry widget and validates the result based on the input parameters.
+        Sets the value of the entry to the evaluated string if the string is valid.
+
+        :param elem: The entry from which to get the string to validate.
+        :param dtype: The data type that the evaluated string should match.
+        :param allow_negative: Weather or not to allow the result to be negative.
+        :param special_vals: An optional list of values for which to skip validation and always return `True`.
+                             This parameter should be a list of strings in Title Case or `None`.
+
+        :return: Whether or not the value in the entry is valid.
+        """
+
+        value = elem.get()  # Get the string to validate
+        if special_vals is not None:  # Check if the string matches any of the `special vals`
+            if value.title().strip(' \t\n') in special_vals:
+                elem.set(value.title().strip(' \t\n'))
+                return True
+
+        if value.strip('0123456789.+-/*() '):  # Check for invalid characters
+            return False
+        else:
+            ## Attempt to evaluate the string
+            try:
+                value = eval(value)
+                if type(value) is not dtype:  # If the resulting value does not match the valid data type
+                    ## Allow integers to be used as floats
+                    if dtype is float and type(value) is int:  # If the valid data type is `float` and the evaluated data type is `int` convert the result to a float
+                        value = float(value)
+                    else:  # Otherwise, return that the input is invalid.
+                        return False
+
+                if not allow_negative and value < 0:  # If the result is negative, and negatives are not allowed, return that the result is invalid
+                    return False
+                else:  # Otherwise, set the value of the entry to the evaluated string and return that the input is valid.
+                    elem.set(str(value))
+                    return True
+            except Exception:  # If the program fails to evaluate the input string, return that the input is invalid. Note: the `eval` function runs any python code, so the exception could be anything.
+                return False
+
+    def convert(self) -> None:
+        """
+        Converts a timetable file to a table in a PDF
+        """
+        # if append:
+        #     canvas = Canvas(dir_name + '/img2pdf_tmp.pdf', (doc_w, doc_h))
+        # else:
+
+        ## Get the filename of the output pdf
+        output_filename = self.outfile_entry.get()
+        if not output_filename.endswith('.pdf'):
+            output_filename += '.pdf'
+
+        ## If the output file already exists, check for permission to write.
+        if file_exists(output_filename):
+            permission_error = True
+            while permission_error:
+                try:
+                    open(output_filename, 'w').close()  # Attempt to write to the file
+                    permission_error = False
+                except PermissionError:
+                    ans = mb.askretrycancel('Permission Denied', f'Could not save {os.path.basename(output_filename)}, because it is open\nin another program.')  # Warn the user that the file is open in another program
+                    if not ans:  # If the user presses the 'x' or 'cancel' buttons, stop the function.
+                        return
+
+        corners = [i.get() for i in [self.nw_corner_radius, self.ne_corner_radius, self.sw_corner_radius, self.se_corner_radius]]  # Get the radius for each corner
+
+        ## Get the custom style options from the config window and add them to the end of the table formatting
+        custom_styles = []
+        for i in self.formatting_elems:
+            line = (i.style_option.get().upper(), (int(i.x1_entry.get()), int(i.y1_entry.get())), (int(i.x2_entry.get()), int(i.y2_entry.get())), *eval(f'[{i.value_entry.get()}]'))
+            custom_styles.append(line)
+
+        export_pdf(
+            self.timetable_data, output_filename,
+            self.width_entry.get(), self.height_entry.get(), self.table_width_entry.get(), self.table_height_entry.get(), self.h_margin_entry.get(), self.v_margin_entry.get(),
+            self.page_units.get(), self.table_units.get(), self.margin_units.get(),
+            formatting=self.formatting, corners=corners, corner_units=self.corner_units.get(), custom_styles=custom_styles
+        )  # Create the PDF
+
+        mb.showinfo('Success', f'Successfully converted {self.root.filename} to PDF.')  # Prompt the user that the conversion was successful
+
+        webbrowser.open('file://' + self.outfile_entry.get())  # Open the PDF
+
+        self.destroy()  # Destroy the window
+
+    def validate_corner(self, elem: Entry) -> bool:
+        """
+        Evaluates the number or simple equation in a corner radius entry widget and validates the result.
+        If match corner radius is enabled, this function updates the value of all corner radius entries.
+
+        :param elem: The entry from which to get the string to validate
+        :return: Whether or not the value in the entry is valid.
+        """
+
+        result = self.validate_num(elem)  # Validate the text in the corner entry
+        val = elem.get()  # Get the updated text in the corner entry
+
+        if result and self.match_corner_radius.get():  # If the text in the entry is valid and match corner radius is enabled
+            ## Iterate through each corner radius entry and set the value to the new text in the modified corner entry
+            for i in [self.nw_corner_radius, self.ne_corner_radius, self.sw_corner_radius, self.se_corner_radius]:
+                i.set(val)
+
+        return result  # Return the validation result
+
+    def add_formatting(self) -> None:
+        """ Add a table formatting option """
+
+        ## Create a formatting option widget and add it at the bottom of the scrollable frame
+        elem = FormattingOption(self, self.scrollable_frame.frame, background='#3B434C')
+        elem.pack(side='top', fill='x', padx=1, pady=(1, 0))
+
+        self.formatting_elems.append(elem)  # Add the formatting option widget to the list of formatting options
+        self.scrollable_frame.canvas.yview_moveto(10)  # Scroll the scrollable frame canvas by a large amount so the new formatting option is visible
+
+    def remove_formatting(self) -> None:
+        """ Removes a table formatting option """
+
+        ## Todo: Save PDF formatting config
+
+        if self.selected_format_option is not None:  # If a formatting option is selected
+            idx = self.formatting_elems.index(self.selected_format_option)  # Get the index of the formatting option in the list
+            self.formatting_elems.pop(idx).destroy()  # Remove the option from the list and destroy the widget
+            if len(self.formatting_elems):  # If there are other elements in the formatting option list
+                ## Select the previous formatting option
+                self.selected_format_option = self.formatting_elems[max(0, idx - 1)]
+                self.selected_format_option.select()